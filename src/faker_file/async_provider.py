@@ -0,0 +1,121 @@
+import asyncio
+import functools
+import inspect
+from typing import Any, Callable, Coroutine, List, Optional, Union
+
+from .base import BytesValue, StringValue
+from .registry import FILE_REGISTRY
+from .storages.async_base import AsyncBaseStorage, AsyncStorageAdapter
+from .storages.base import BaseStorage
+
+__author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
+__copyright__ = "2022-2025 Artur Barseghyan"
+__license__ = "MIT"
+__all__ = (
+    "ASYNC_METHOD_PREFIX",
+    "add_async_methods",
+    "make_async_method",
+)
+
+ASYNC_METHOD_PREFIX = "a"
+FileValue = Union[BytesValue, StringValue]
+# Marker set on the generated coroutine functions
+ASYNC_METHOD_MARKER = "_faker_file_async_method"
+
+
+def _is_file_method(func: Any) -> bool:
+    """Check if given function is a file generating provider method."""
+    if not inspect.isfunction(func) or getattr(func, ASYNC_METHOD_MARKER, None):
+        return False
+    try:
+        parameters = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+    return "storage" in parameters and "raw" in parameters
+
+
+def make_async_method(
+    func: Callable[..., Union[FileValue, List[FileValue]]],
+) -> Callable[..., Coroutine[Any, Any, Union[FileValue, List[FileValue]]]]:
+    """Make an awaitable variant of a provider method.
+
+    The content is generated in the default thread pool executor of the
+    event loop (as raw content) and then written with the async storage.
+    Synchronous storages are wrapped into `AsyncStorageAdapter`. If no
+    storage is given, `AsyncFileSystemStorage` is used. Methods returning
+    a list of files (for instance, `augment_files_from_dir`) get all of
+    them written concurrently.
+
+    :param func: Provider method, accepting `storage` and `raw` arguments.
+    :return: Coroutine function.
+    """
+
+    async def _save(
+        raw_content: BytesValue,
+        storage: AsyncBaseStorage,
+        raw: bool,
+    ) -> FileValue:
+        raw_content.data["storage"] = storage
+        if raw:
+            return raw_content
+
+        filename = raw_content.data["filename"]
+        await storage.write_bytes(filename, bytes(raw_content))
+
+        file_name = StringValue(storage.relpath(filename))
+        file_name.data = raw_content.data
+        FILE_REGISTRY.add(file_name)
+        return file_name
+
+    @functools.wraps(func)
+    async def wrapper(
+        self: Any,
+        *args,
+        storage: Optional[Union[AsyncBaseStorage, BaseStorage]] = None,
+        raw: bool = False,
+        **kwargs,
+    ) -> Union[FileValue, List[FileValue]]:
+        if storage is None:
+            from .storages.async_filesystem import AsyncFileSystemStorage
+
+            storage = AsyncFileSystemStorage()
+        elif isinstance(storage, BaseStorage):
+            storage = AsyncStorageAdapter(storage)
+
+        # Only the synchronous `generate_filename` is used when `raw` is
+        # set, thus native async storages can be passed as is.
+        raw_content = await asyncio.to_thread(
+            func,
+            self,
+            *args,
+            storage=storage.sync_storage or storage,
+            raw=True,
+            **kwargs,
+        )
+        if isinstance(raw_content, list):
+            return list(
+                await asyncio.gather(
+                    *(_save(item, storage, raw) for item in raw_content)
+                )
+            )
+        return await _save(raw_content, storage, raw)
+
+    setattr(wrapper, ASYNC_METHOD_MARKER, True)
+    return wrapper
+
+
+def add_async_methods(cls: type) -> None:
+    """Add awaitable variants of provider methods to the class.
+
+    For each public method accepting `storage` and `raw` arguments (for
+    instance, `txt_file`), a coroutine method prefixed with `a` (for
+    instance, `atxt_file`) is added, unless already defined.
+
+    :param cls: Provider class.
+    """
+    for name, func in list(vars(cls).items()):
+        if name.startswith("_") or not _is_file_method(func):
+            continue
+        async_name = f"{ASYNC_METHOD_PREFIX}{name}"
+        if async_name not in vars(cls):
+            setattr(cls, async_name, make_async_method(func))
@@ -79,6 +79,14 @@ class FileMixin:
     generator: Union[Faker, Generator, Provider]
     extension: str  # Desired file extension.
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Add awaitable variants of file methods (`txt_file` ->
+        `atxt_file`)."""
+        super().__init_subclass__(**kwargs)
+        from .async_provider import add_async_methods
+
+        add_async_methods(cls)
+
     def _generate_text_content(
         self,
         max_nb_chars: int,
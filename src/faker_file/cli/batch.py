@@ -0,0 +1,319 @@
+import hashlib
+import json
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, Optional, TextIO, Tuple
+
+from ..helpers import load_class_from_path
+from .helpers import PROVIDER_PATHS, PROVIDERS, get_provider_method
+
+__author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
+__copyright__ = "2022-2025 Artur Barseghyan"
+__license__ = "MIT"
+__all__ = (
+    "load_batch_manifest",
+    "run_batch",
+    "validate_batch_manifest",
+)
+
+# Provider arguments set by the batch job itself
+RESERVED_KWARGS = {"storage", "raw"}
+
+# Storage specs and storages of the current (worker) process
+_STORAGE_SPECS: Dict[str, Dict[str, Any]] = {}
+_STORAGES: Dict[Optional[str], Any] = {}
+
+# (provider, kwargs, storage name, seed)
+Task = Tuple[str, Dict[str, Any], Optional[str], Optional[int]]
+
+
+def load_batch_manifest(path: str) -> Dict[str, Any]:
+    """Load and validate batch manifest from a JSON or YAML file.
+
+    YAML files (`.yaml` or `.yml`) require `PyYAML`.
+
+    :param path: Path to the manifest file.
+    :return: Validated manifest (see `validate_batch_manifest`).
+    """
+    with open(path) as file:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError as err:
+                raise ImportError(
+                    "You need to pip install PyYAML to use YAML manifests"
+                ) from err
+            manifest = yaml.safe_load(file)
+        else:
+            manifest = json.load(file)
+    return validate_batch_manifest(manifest)
+
+
+def validate_batch_manifest(manifest: Any) -> Dict[str, Any]:
+    """Validate batch manifest, filling in the defaults.
+
+    Manifest example (YAML):
+
+    .. code-block:: yaml
+
+        workers: 4
+        seed: 42
+        index: index.jsonl
+        storages:
+          local:
+            class: faker_file.storages.filesystem.FileSystemStorage
+            kwargs:
+              root_path: /tmp/fixtures
+          s3:
+            class: faker_file.storages.aws_s3.AWSS3Storage
+            kwargs:
+              bucket_name: artur-testing-1
+        entries:
+          - provider: docx_file
+            count: 100
+            kwargs:
+              max_nb_chars: 500
+            storage: s3
+          - provider: txt_file
+            count: 1000
+            storage: local
+            seed: 7
+
+    All keys, except `entries` and their `provider`, are optional. Files
+    of entries without `storage` are saved with `FileSystemStorage`.
+
+    :param manifest: Loaded manifest.
+    :return: Manifest.
+    :raise ValueError: If manifest is not valid.
+    """
+    if not isinstance(manifest, dict):
+        raise ValueError("Manifest shall be a mapping!")
+    storages = manifest.get("storages") or {}
+    if not isinstance(storages, dict):
+        raise ValueError("`storages` shall be a mapping!")
+    for name, spec in storages.items():
+        if not isinstance(spec, dict) or not isinstance(spec.get("class"), str):
+            raise ValueError(f"Storage `{name}` shall have a `class`!")
+
+    entries = manifest.get("entries")
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("`entries` shall be a non-empty list!")
+
+    validated_entries = []
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Entry {index} shall be a mapping!")
+        provider = entry.get("provider")
+        if provider not in PROVIDER_PATHS:
+            raise ValueError(f"Entry {index}: unknown provider {provider!r}!")
+        count = entry.get("count", 1)
+        if not isinstance(count, int) or count < 0:
+            raise ValueError(f"Entry {index}: invalid count {count!r}!")
+        kwargs = entry.get("kwargs") or {}
+        if not isinstance(kwargs, dict):
+            raise ValueError(f"Entry {index}: `kwargs` shall be a mapping!")
+        if RESERVED_KWARGS & set(kwargs):
+            raise ValueError(
+                f"Entry {index}: `kwargs` shall not contain "
+                f"{', '.join(sorted(RESERVED_KWARGS & set(kwargs)))}!"
+            )
+        storage = entry.get("storage")
+        if storage is not None and storage not in storages:
+            raise ValueError(f"Entry {index}: unknown storage {storage!r}!")
+        validated_entries.append(
+            {
+                "provider": provider,
+                "count": count,
+                "kwargs": kwargs,
+                "storage": storage,
+                "seed": entry.get("seed"),
+            }
+        )
+
+    return {
+        "workers": manifest.get("workers", 1),
+        "seed": manifest.get("seed"),
+        "index": manifest.get("index"),
+        "storages": storages,
+        "entries": validated_entries,
+    }
+
+
+def _iter_tasks(manifest: Dict[str, Any]) -> Iterator[Task]:
+    """Iterate over all files to generate.
+
+    Entries without a seed get one derived from the manifest `seed` (if
+    given). Every file gets a seed derived from its entry seed.
+    """
+    manifest_random = (
+        None if manifest["seed"] is None else random.Random(manifest["seed"])
+    )
+    for entry in manifest["entries"]:
+        seed = entry["seed"]
+        if manifest_random is not None:
+            entry_seed = manifest_random.getrandbits(64)
+            if seed is None:
+                seed = entry_seed
+        entry_random = None if seed is None else random.Random(seed)
+        for _ in range(entry["count"]):
+            yield (
+                entry["provider"],
+                entry["kwargs"],
+                entry["storage"],
+                None if entry_random is None else entry_random.getrandbits(64),
+            )
+
+
+def _init_worker(storage_specs: Dict[str, Dict[str, Any]]) -> None:
+    """Initialise the worker process."""
+    # Forked workers inherit the random state (thus file names)
+    random.seed()
+    _STORAGE_SPECS.clear()
+    _STORAGE_SPECS.update(storage_specs)
+    _STORAGES.clear()
+
+
+def _get_storage(name: Optional[str]) -> Any:
+    """Get storage by name, created once per process."""
+    if name not in _STORAGES:
+        if name is None:
+            from ..storages.filesystem import FileSystemStorage
+
+            _STORAGES[name] = FileSystemStorage()
+        else:
+            spec = _STORAGE_SPECS[name]
+            storage_cls = load_class_from_path(spec["class"])
+            _STORAGES[name] = storage_cls(**(spec.get("kwargs") or {}))
+    return _STORAGES[name]
+
+
+def _generate(task: Task) -> Dict[str, Any]:
+    """Generate a single file, returning its index record."""
+    provider, kwargs, storage_name, seed = task
+    details = {
+        "provider": provider,
+        "kwargs": kwargs,
+        "storage": storage_name,
+        "seed": seed,
+    }
+    try:
+        storage = _get_storage(storage_name)
+        method = get_provider_method(provider)
+        if seed is not None:
+            method.__self__.generator.seed_instance(seed)
+        raw_content = method(storage=storage, raw=True, **kwargs)
+        filename = raw_content.data["filename"]
+        storage.write_bytes(filename, raw_content)
+    except Exception as err:
+        return {**details, "error": f"{err.__class__.__name__}: {err}"}
+    return {
+        "path": storage.abspath(filename),
+        "size": len(raw_content),
+        "sha256": hashlib.sha256(raw_content).hexdigest(),
+        **details,
+    }
+
+
+def run_batch(
+    manifest: Dict[str, Any],
+    index_file: TextIO,
+    workers: Optional[int] = None,
+) -> Dict[str, int]:
+    """Run batch job.
+
+    All files are generated by a single pool of worker processes. Each
+    worker creates every storage (and provider) once, reusing it for all
+    its files. An index record (`path`, `size`, `sha256`, `provider`,
+    `kwargs`, `storage` and `seed`, or `error` if generation failed) is
+    written to `index_file` (JSON Lines) for every file, in manifest
+    order.
+
+    :param manifest: Validated manifest (see `load_batch_manifest`).
+    :param index_file: Text file to write the index to.
+    :param workers: Number of worker processes. Defaults to manifest
+        `workers`. If set to 1, files are generated in the current process.
+    :return: Dictionary with `succeeded` and `failed` counts.
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker_file.cli.batch import load_batch_manifest, run_batch
+
+        manifest = load_batch_manifest("manifest.yaml")
+        with open("index.jsonl", "w") as index_file:
+            summary = run_batch(manifest, index_file, workers=8)
+    """
+    if workers is None:
+        workers = manifest["workers"]
+    storage_specs = manifest["storages"]
+    tasks = _iter_tasks(manifest)
+    nb_files = sum(entry["count"] for entry in manifest["entries"])
+    summary = {"succeeded": 0, "failed": 0}
+
+    def _write(records: Iterator[Dict[str, Any]]) -> None:
+        for record in records:
+            summary["failed" if "error" in record else "succeeded"] += 1
+            index_file.write(json.dumps(record, default=str) + "\n")
+
+    if workers <= 1 or nb_files <= 1:
+        _init_worker(storage_specs)
+        _write(map(_generate, tasks))
+        return summary
+
+    # Forked workers inherit the providers (no need to import them again)
+    for entry in manifest["entries"]:
+        PROVIDERS[entry["provider"]]
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(storage_specs,),
+    ) as executor:
+        _write(
+            executor.map(
+                _generate,
+                tasks,
+                chunksize=max(1, min(64, nb_files // (workers * 4))),
+            )
+        )
+    return summary
+
+
+def main(
+    manifest_path: str,
+    index_path: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> int:
+    """Run batch job, as the `faker-file batch` command.
+
+    :param manifest_path: Path to the manifest file.
+    :param index_path: Path to the index file ("-" for standard output).
+        Defaults to manifest `index`, or standard output.
+    :param workers: Number of worker processes.
+    :return: Exit code.
+    """
+    try:
+        manifest = load_batch_manifest(manifest_path)
+    except (OSError, ValueError, ImportError) as err:
+        print(f"Invalid manifest {manifest_path}: {err}", file=sys.stderr)
+        return 1
+
+    index_path = index_path or manifest["index"] or "-"
+    start = time.perf_counter()
+    if index_path == "-":
+        summary = run_batch(manifest, sys.stdout, workers=workers)
+    else:
+        with open(index_path, "w") as index_file:
+            summary = run_batch(manifest, index_file, workers=workers)
+    elapsed = time.perf_counter() - start
+
+    total = summary["succeeded"] + summary["failed"]
+    print(
+        f"Generated {summary['succeeded']} of {total} file(s) in "
+        f"{elapsed:.2f}s ({total / max(elapsed, 1e-9):.1f} files per second, "
+        f"{summary['failed']} failed)",
+        file=sys.stderr,
+    )
+    return 1 if summary["failed"] else 0
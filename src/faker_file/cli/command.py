@@ -1,6 +1,7 @@
 import argparse
+import os
 import sys
-import typing
+import time
 
 from .. import __version__
 
@@ -9,18 +10,26 @@ __copyright__ = "2023 Artur Barseghyan"
 __license__ = "MIT"
 __all__ = ("main",)
 
+INSTALL_MESSAGE = "You need to pip install faker-file[common] to use the CLI"
+
 
 def main():
     try:
         from .helpers import (
             PROVIDERS,
             generate_completion_file,
-            generate_file,
-            get_method_kwargs,
-            is_optional_type,
+            generate_files,
+            get_manifest,
+            get_provider_method,
+            write_tar_stream,
         )
+
+        # Arguments come from the cached manifest, thus providers are not
+        # imported, except for the one being used (building the manifest
+        # imports all of them)
+        manifest = get_manifest()
     except ImportError:
-        print("You need to pip install faker-file[common] to use the CLI")
+        print(INSTALL_MESSAGE)
         sys.exit(1)
 
     parser = argparse.ArgumentParser(
@@ -36,29 +45,44 @@ def main():
         help="Generate bash completion file.",
     )
 
+    # Add batch subparser
+    batch_subparser = subparsers.add_parser(
+        "batch",
+        help="Generate files described in a manifest (JSON or YAML).",
+    )
+    batch_subparser.add_argument(
+        "manifest",
+        help="path to the manifest file",
+    )
+    batch_subparser.add_argument(
+        "--index",
+        default=None,
+        help="path to the JSONL index file, - for standard output "
+        "(default: manifest index or standard output)",
+    )
+    batch_subparser.add_argument(
+        "--workers",
+        default=None,
+        type=int,
+        help="number of worker processes (default: manifest workers or 1)",
+    )
+
     # Add version subparser
     __version_subparser = subparsers.add_parser(
         "version",
         help="Print version.",
     )
 
-    for method_name, provider in PROVIDERS.items():
+    for method_name in PROVIDERS:
         subparser = subparsers.add_parser(
             method_name,
             help=f"Generate a {method_name.split('_file')[0]} file.",
         )
-        method_kwargs, annotations = get_method_kwargs(provider, method_name)
-        for arg, default in method_kwargs.items():
-            arg_type = annotations[arg]
+        for arg, spec in manifest[method_name].items():
             arg_kwargs = {
-                "default": default,
-                "help": f"{arg} (default: {default})",
-                "type": (
-                    arg_type.__args__[0]
-                    if isinstance(arg_type, typing._GenericAlias)
-                    and is_optional_type(arg_type)
-                    else arg_type
-                ),
+                "default": spec["default"],
+                "help": f"{arg} (default: {spec['default']})",
+                "type": spec["type"],
             }
 
             subparser.add_argument(f"--{arg}", **arg_kwargs)
@@ -70,6 +94,29 @@ def main():
             type=int,
             help="number of files to generate (default: 1)",
         )
+        subparser.add_argument(
+            "--workers",
+            default=1,
+            type=int,
+            help="number of worker processes (default: 1)",
+        )
+        subparser.add_argument(
+            "--seed",
+            default=None,
+            type=int,
+            help="seed, for reproducible content (default: None)",
+        )
+        output_group = subparser.add_mutually_exclusive_group()
+        output_group.add_argument(
+            "--stdout",
+            action="store_true",
+            help="write the content of a single file to the standard output",
+        )
+        output_group.add_argument(
+            "--tar-stream",
+            action="store_true",
+            help="write all files as a tar stream to the standard output",
+        )
 
     args = parser.parse_args()
 
@@ -77,15 +124,73 @@ def main():
         generate_completion_file()
     elif args.command == "version":
         print(__version__)
+    elif args.command == "batch":
+        from .batch import main as batch_main
+
+        sys.exit(
+            batch_main(
+                args.manifest,
+                index_path=args.index,
+                workers=args.workers,
+            )
+        )
     elif args.command:
-        kwargs = {k: v for k, v in vars(args).items() if k not in ("command",)}
-        for counter in range(args.nb_files):
-            output_file = generate_file(args.command, **kwargs)
-            print(
-                f"Generated {args.command} file "
-                f"({counter+1} of {args.nb_files}): "
-                f"{output_file.data['filename']}"
+        if args.stdout and args.nb_files != 1:
+            parser.error("--stdout supports a single file only (--nb_files 1)")
+        try:
+            get_provider_method(args.command)
+        except ImportError:
+            print(INSTALL_MESSAGE)
+            sys.exit(1)
+        kwargs = {
+            k: v
+            for k, v in vars(args).items()
+            if k
+            not in (
+                "command",
+                "nb_files",
+                "workers",
+                "seed",
+                "stdout",
+                "tar_stream",
             )
+        }
+        start = time.perf_counter()
+        files = generate_files(
+            args.command,
+            nb_files=args.nb_files,
+            workers=args.workers,
+            seed=args.seed,
+            raw=args.stdout or args.tar_stream,
+            **kwargs,
+        )
+        try:
+            if args.stdout:
+                for _, content in files:
+                    sys.stdout.buffer.write(content)
+                sys.stdout.buffer.flush()
+            elif args.tar_stream:
+                write_tar_stream(files, sys.stdout.buffer)
+                sys.stdout.buffer.flush()
+            else:
+                for counter, filename in enumerate(files, start=1):
+                    print(
+                        f"Generated {args.command} file "
+                        f"({counter} of {args.nb_files}): "
+                        f"{filename}"
+                    )
+        except BrokenPipeError:
+            # The reader has gone (for instance, `| head`). Python would
+            # fail flushing the standard output at exit otherwise.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            sys.exit(1)
+        elapsed = time.perf_counter() - start
+        print(
+            f"Generated {args.nb_files} {args.command} file(s) in "
+            f"{elapsed:.2f}s ({args.nb_files / max(elapsed, 1e-9):.1f} "
+            f"files per second, {max(1, args.workers)} worker(s))",
+            file=sys.stderr,
+        )
     else:
         parser.print_help()
         sys.exit(1)
@@ -1,45 +1,58 @@
+import ast
+import hashlib
+import importlib
+import importlib.util
 import inspect
+import json
 import os
+import random
+import tarfile
+import tempfile
+import time
 import typing
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
-from typing import Any, Dict, Tuple, Type
-
-from faker import Faker
-
-from ..base import FileMixin, StringValue
-from ..providers.bin_file import BinFileProvider
-from ..providers.csv_file import CsvFileProvider
-from ..providers.docx_file import DocxFileProvider
-from ..providers.eml_file import EmlFileProvider
-from ..providers.epub_file import EpubFileProvider
-from ..providers.generic_file import GenericFileProvider
-from ..providers.ico_file import GraphicIcoFileProvider, IcoFileProvider
-from ..providers.jpeg_file import GraphicJpegFileProvider, JpegFileProvider
-from ..providers.mp3_file import Mp3FileProvider
-from ..providers.odp_file import OdpFileProvider
-from ..providers.ods_file import OdsFileProvider
-from ..providers.odt_file import OdtFileProvider
-from ..providers.pdf_file import GraphicPdfFileProvider, PdfFileProvider
-from ..providers.png_file import GraphicPngFileProvider, PngFileProvider
-from ..providers.pptx_file import PptxFileProvider
-from ..providers.rtf_file import RtfFileProvider
-from ..providers.svg_file import SvgFileProvider
-from ..providers.tar_file import TarFileProvider
-from ..providers.txt_file import TxtFileProvider
-from ..providers.webp_file import GraphicWebpFileProvider, WebpFileProvider
-from ..providers.xlsx_file import XlsxFileProvider
-from ..providers.xml_file import XmlFileProvider
-from ..providers.zip_file import ZipFileProvider
+from functools import lru_cache
+from io import BytesIO
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .. import __version__
+
+if TYPE_CHECKING:
+    from ..base import FileMixin, StringValue
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2023 Artur Barseghyan"
 __license__ = "MIT"
 __all__ = (
+    "ARG_TYPES",
+    "LazyProviders",
+    "PROVIDERS",
+    "PROVIDER_PATHS",
+    "build_manifest",
     "generate_completion_file",
     "generate_file",
+    "generate_files",
+    "get_manifest",
+    "get_manifest_path",
     "get_method_kwargs",
+    "get_provider_method",
     "is_optional_type",
-    "PROVIDERS",
+    "resolve_arg_type",
+    "write_tar_stream",
 )
 
 KWARGS_DROP = {
@@ -99,51 +112,92 @@ OVERRIDES = {
         },
     },
 }
-PROVIDERS = {
-    BinFileProvider.bin_file.__name__: BinFileProvider,
-    CsvFileProvider.csv_file.__name__: CsvFileProvider,
-    DocxFileProvider.docx_file.__name__: DocxFileProvider,
-    EmlFileProvider.eml_file.__name__: EmlFileProvider,
-    EpubFileProvider.epub_file.__name__: EpubFileProvider,
-    GenericFileProvider.generic_file.__name__: GenericFileProvider,
-    GraphicIcoFileProvider.graphic_ico_file.__name__: GraphicIcoFileProvider,
-    GraphicJpegFileProvider.graphic_jpeg_file.__name__: (
-        GraphicJpegFileProvider
+PROVIDER_PATHS = {
+    "bin_file": "faker_file.providers.bin_file.BinFileProvider",
+    "csv_file": "faker_file.providers.csv_file.CsvFileProvider",
+    "docx_file": "faker_file.providers.docx_file.DocxFileProvider",
+    "eml_file": "faker_file.providers.eml_file.EmlFileProvider",
+    "epub_file": "faker_file.providers.epub_file.EpubFileProvider",
+    "generic_file": "faker_file.providers.generic_file.GenericFileProvider",
+    "graphic_ico_file": "faker_file.providers.ico_file.GraphicIcoFileProvider",
+    "graphic_jpeg_file": (
+        "faker_file.providers.jpeg_file.GraphicJpegFileProvider"
     ),
-    GraphicPdfFileProvider.graphic_pdf_file.__name__: GraphicPdfFileProvider,
-    GraphicPngFileProvider.graphic_png_file.__name__: GraphicPngFileProvider,
-    GraphicWebpFileProvider.graphic_webp_file.__name__: (
-        GraphicWebpFileProvider
+    "graphic_pdf_file": "faker_file.providers.pdf_file.GraphicPdfFileProvider",
+    "graphic_png_file": "faker_file.providers.png_file.GraphicPngFileProvider",
+    "graphic_webp_file": (
+        "faker_file.providers.webp_file.GraphicWebpFileProvider"
     ),
-    IcoFileProvider.ico_file.__name__: IcoFileProvider,
-    JpegFileProvider.jpeg_file.__name__: JpegFileProvider,
-    Mp3FileProvider.mp3_file.__name__: Mp3FileProvider,
-    OdpFileProvider.odp_file.__name__: OdpFileProvider,
-    OdsFileProvider.ods_file.__name__: OdsFileProvider,
-    OdtFileProvider.odt_file.__name__: OdtFileProvider,
-    PdfFileProvider.pdf_file.__name__: PdfFileProvider,
-    PngFileProvider.png_file.__name__: PngFileProvider,
-    PptxFileProvider.pptx_file.__name__: PptxFileProvider,
-    RtfFileProvider.rtf_file.__name__: RtfFileProvider,
-    SvgFileProvider.svg_file.__name__: SvgFileProvider,
-    TarFileProvider.tar_file.__name__: TarFileProvider,
-    TxtFileProvider.txt_file.__name__: TxtFileProvider,
-    WebpFileProvider.webp_file.__name__: WebpFileProvider,
-    XlsxFileProvider.xlsx_file.__name__: XlsxFileProvider,
-    XmlFileProvider.xml_file.__name__: XmlFileProvider,
-    ZipFileProvider.zip_file.__name__: ZipFileProvider,
+    "ico_file": "faker_file.providers.ico_file.IcoFileProvider",
+    "jpeg_file": "faker_file.providers.jpeg_file.JpegFileProvider",
+    "mp3_file": "faker_file.providers.mp3_file.Mp3FileProvider",
+    "odp_file": "faker_file.providers.odp_file.OdpFileProvider",
+    "ods_file": "faker_file.providers.ods_file.OdsFileProvider",
+    "odt_file": "faker_file.providers.odt_file.OdtFileProvider",
+    "pdf_file": "faker_file.providers.pdf_file.PdfFileProvider",
+    "png_file": "faker_file.providers.png_file.PngFileProvider",
+    "pptx_file": "faker_file.providers.pptx_file.PptxFileProvider",
+    "rtf_file": "faker_file.providers.rtf_file.RtfFileProvider",
+    "svg_file": "faker_file.providers.svg_file.SvgFileProvider",
+    "tar_file": "faker_file.providers.tar_file.TarFileProvider",
+    "txt_file": "faker_file.providers.txt_file.TxtFileProvider",
+    "webp_file": "faker_file.providers.webp_file.WebpFileProvider",
+    "xlsx_file": "faker_file.providers.xlsx_file.XlsxFileProvider",
+    "xml_file": "faker_file.providers.xml_file.XmlFileProvider",
+    "zip_file": "faker_file.providers.zip_file.ZipFileProvider",
+}
+# Argument types supported by the CLI (other arguments are passed as strings)
+ARG_TYPES = {
+    "bool": bool,
+    "bytes": bytes,
+    "float": float,
+    "int": int,
+    "str": str,
 }
+MANIFEST_VERSION = 1
+
+
+class LazyProviders(Mapping):
+    """Provider classes by method name, imported on first access.
+
+    Iterating over the keys (method names) does not import anything.
+    """
+
+    def __init__(self: "LazyProviders", paths: Dict[str, str]) -> None:
+        """
+        :param paths: Dotted paths of provider classes by method name.
+        """
+        self.paths = paths
+        self._classes: Dict[str, Type["FileMixin"]] = {}
+
+    def __getitem__(self: "LazyProviders", key: str) -> Type["FileMixin"]:
+        if key not in self._classes:
+            module_name, class_name = self.paths[key].rsplit(".", 1)
+            module = importlib.import_module(module_name)
+            self._classes[key] = getattr(module, class_name)
+        return self._classes[key]
+
+    def __iter__(self: "LazyProviders") -> Iterator[str]:
+        return iter(self.paths)
+
+    def __len__(self: "LazyProviders") -> int:
+        return len(self.paths)
+
+
+PROVIDERS = LazyProviders(PROVIDER_PATHS)
 
 
 def get_method_kwargs(
-    cls: Type[FileMixin], method_name: str
+    cls: Type["FileMixin"], method_name: str
 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     method = getattr(cls, method_name)
     method_specs = inspect.getfullargspec(method)
 
     kwargs = deepcopy(method_specs.args[1:])  # Omit `self`
     defaults = deepcopy(method_specs.defaults if method_specs.defaults else [])
-    model_props = dict(zip(kwargs, defaults))
+    # Defaults belong to the last arguments, the rest are required
+    model_props = dict.fromkeys(kwargs[: len(kwargs) - len(defaults)])
+    model_props.update(zip(kwargs[len(kwargs) - len(defaults) :], defaults))
     annotations = deepcopy(method_specs.annotations)
 
     # Override the type definition for mp3_generator_cls
@@ -159,12 +213,169 @@ def get_method_kwargs(
     return model_props, annotations
 
 
-def generate_file(method_name: str, **kwargs) -> StringValue:
-    faker = Faker()
-    cls = PROVIDERS[method_name]
-    method = getattr(cls(faker), method_name)
-    value = method(**kwargs)
-    return value
+# Provider methods by method name, created once per process
+_PROVIDER_METHODS: Dict[str, Callable[..., "StringValue"]] = {}
+
+
+def get_provider_method(method_name: str) -> Callable[..., "StringValue"]:
+    """Get provider method, bound to a `Faker` instance.
+
+    The provider (and its `Faker` instance) is created once per process
+    and reused for all files.
+    """
+    if method_name not in _PROVIDER_METHODS:
+        from faker import Faker
+
+        faker = Faker()
+        cls = PROVIDERS[method_name]
+        _PROVIDER_METHODS[method_name] = getattr(cls(faker), method_name)
+    return _PROVIDER_METHODS[method_name]
+
+
+def generate_file(
+    method_name: str,
+    seed: Optional[int] = None,
+    **kwargs,
+) -> "StringValue":
+    """Generate a file.
+
+    :param method_name: Provider method name, such as `txt_file`.
+    :param seed: If given, the `Faker` instance is seeded with it.
+    :return: Generated file.
+    """
+    method = get_provider_method(method_name)
+    if seed is not None:
+        method.__self__.generator.seed_instance(seed)
+    return method(**kwargs)
+
+
+def _init_worker() -> None:
+    """Re-seed the global random number generator in a worker process.
+
+    Forked workers inherit the state of the parent process, thus would
+    generate the same (random) file names.
+    """
+    random.seed()
+
+
+def _generate_file_in_worker(
+    method_name: str,
+    kwargs: Dict[str, Any],
+    seed: Optional[int],
+) -> str:
+    """Generate a file within a worker process, returning its name."""
+    return str(generate_file(method_name, seed=seed, **kwargs).data["filename"])
+
+
+def _generate_raw_file_in_worker(
+    method_name: str,
+    kwargs: Dict[str, Any],
+    seed: Optional[int],
+) -> Tuple[str, bytes]:
+    """Generate a file within a worker process, returning its base name and
+    content (nothing is written to disk)."""
+    raw_content = generate_file(method_name, seed=seed, raw=True, **kwargs)
+    return os.path.basename(raw_content.data["filename"]), bytes(raw_content)
+
+
+def generate_files(
+    method_name: str,
+    nb_files: int,
+    workers: int = 1,
+    seed: Optional[int] = None,
+    raw: bool = False,
+    **kwargs,
+) -> Iterator[Union[str, Tuple[str, bytes]]]:
+    """Generate multiple files, optionally in a process pool.
+
+    Every worker process creates a single provider, reused for all its
+    files. If `seed` is given, every file gets its own seed, derived from
+    it, thus the output does not depend on the number of workers.
+
+    :param method_name: Provider method name, such as `txt_file`.
+    :param nb_files: Number of files to generate.
+    :param workers: Number of worker processes. If set to 1, files are
+        generated in the current process.
+    :param seed: Seed.
+    :param raw: If set to True, files are not saved. (base name, content)
+        tuples are returned instead of file names.
+    :return: Iterator of generated file names (or (base name, content)
+        tuples, if `raw` is set to True), in order.
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker_file.cli.helpers import generate_files
+
+        for filename in generate_files(
+            "txt_file", nb_files=1_000, workers=4, seed=42
+        ):
+            print(filename)
+    """
+    if seed is None:
+        seeds = [None] * nb_files
+    else:
+        _random = random.Random(seed)
+        seeds = [_random.getrandbits(64) for _ in range(nb_files)]
+
+    generate = _generate_raw_file_in_worker if raw else _generate_file_in_worker
+    if workers <= 1 or nb_files <= 1:
+        for _seed in seeds:
+            yield generate(method_name, kwargs, _seed)
+        return
+
+    # Forked workers inherit the provider (no need to import it again)
+    get_provider_method(method_name)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker
+    ) as executor:
+        yield from executor.map(
+            generate,
+            [method_name] * nb_files,
+            [kwargs] * nb_files,
+            seeds,
+            chunksize=max(1, min(64, nb_files // (workers * 4))),
+        )
+
+
+def write_tar_stream(
+    files: Iterable[Tuple[str, bytes]],
+    fileobj: BinaryIO,
+) -> int:
+    """Write files as a tar stream, one member at a time.
+
+    The archive is never seeked, thus `fileobj` may be a pipe (such as
+    standard output).
+
+    :param files: Iterable of (name, content) tuples, such as returned by
+        `generate_files` with `raw` set to True.
+    :param fileobj: Binary file object to write to.
+    :return: Number of files written.
+
+    Usage example:
+
+    .. code-block:: python
+
+        import sys
+
+        from faker_file.cli.helpers import generate_files, write_tar_stream
+
+        write_tar_stream(
+            generate_files("pdf_file", nb_files=10_000, raw=True),
+            sys.stdout.buffer,
+        )
+    """
+    counter = 0
+    with tarfile.open(fileobj=fileobj, mode="w|") as tar:
+        for name, content in files:
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            info.mtime = int(time.time())
+            info.mode = 0o644
+            tar.addfile(info, BytesIO(content))
+            counter += 1
+    return counter
 
 
 def is_optional_type(t: Any) -> bool:
@@ -173,6 +384,148 @@ def is_optional_type(t: Any) -> bool:
     return False
 
 
+def resolve_arg_type(annotation: Any) -> Optional[str]:
+    """Get name of the CLI argument type (a key of `ARG_TYPES`).
+
+    `Optional[int]` (and any other union including None) resolves to its
+    first type (`int`).
+
+    :return: Type name. None, if the type is not supported.
+    """
+    if isinstance(annotation, typing._GenericAlias) and is_optional_type(
+        annotation
+    ):
+        annotation = annotation.__args__[0]
+    for name, arg_type in ARG_TYPES.items():
+        if annotation is arg_type:
+            return name
+    return None
+
+
+def _to_literal(value: Any) -> Optional[str]:
+    """Represent the value as Python literal (None if not possible)."""
+    try:
+        ast.literal_eval(repr(value))
+    except (ValueError, SyntaxError):
+        return None
+    return repr(value)
+
+
+def build_manifest() -> Dict[str, Any]:
+    """Build the CLI manifest: arguments of all providers.
+
+    Imports all providers. Argument defaults are stored as Python literals
+    (see `get_manifest`).
+
+    :return: Dictionary `{method_name: {argument: {"default": ...,
+        "type": ...}}}`.
+    """
+    manifest = {}
+    for method_name in PROVIDER_PATHS:
+        method_kwargs, annotations = get_method_kwargs(
+            PROVIDERS[method_name], method_name
+        )
+        manifest[method_name] = {
+            arg: {
+                "default": _to_literal(default),
+                "type": resolve_arg_type(annotations.get(arg)),
+            }
+            for arg, default in method_kwargs.items()
+        }
+    return manifest
+
+
+def _get_manifest_key() -> str:
+    """Key of the manifest cache.
+
+    Changes with the package version, the list of providers and the
+    modification time of provider modules (found without importing them).
+    """
+    digest = hashlib.md5(
+        f"{MANIFEST_VERSION}:{__version__}".encode(), usedforsecurity=False
+    )
+    for path in PROVIDER_PATHS.values():
+        module_name = path.rsplit(".", 1)[0]
+        digest.update(path.encode())
+        spec = importlib.util.find_spec(module_name)
+        if spec is not None and spec.origin:
+            digest.update(str(os.stat(spec.origin).st_mtime_ns).encode())
+    return digest.hexdigest()
+
+
+def get_manifest_path() -> str:
+    """Path of the cached manifest file.
+
+    Stored in the `FAKER_FILE_CACHE_DIR` directory, if set. Otherwise, in
+    `$XDG_CACHE_HOME/faker-file` (defaults to `~/.cache/faker-file`).
+    """
+    cache_dir = os.environ.get("FAKER_FILE_CACHE_DIR") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME")
+        or os.path.join(os.path.expanduser("~"), ".cache"),
+        "faker-file",
+    )
+    return os.path.join(cache_dir, f"cli-manifest-{_get_manifest_key()}.json")
+
+
+def _read_manifest(path: str) -> Optional[Dict[str, Any]]:
+    """Read the cached manifest (None if missing or broken)."""
+    try:
+        with open(path) as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or set(manifest) != set(PROVIDER_PATHS):
+        return None
+    return manifest
+
+
+def _write_manifest(path: str, manifest: Dict[str, Any]) -> None:
+    """Write the manifest atomically, ignoring errors (read-only home)."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=os.path.dirname(path), suffix=".tmp", delete=False
+        ) as file:
+            json.dump(manifest, file)
+        os.replace(file.name, path)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=None)
+def get_manifest() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Get arguments of all providers, without importing them.
+
+    The manifest is built (see `build_manifest`) on first use and cached
+    on disk (see `get_manifest_path`), thus later runs of the CLI only
+    import the provider being used.
+
+    :return: Dictionary `{method_name: {argument: {"default": ...,
+        "type": ...}}}`, with defaults being Python values and types being
+        Python types (None for unsupported types).
+    """
+    path = get_manifest_path()
+    manifest = _read_manifest(path)
+    if manifest is None:
+        manifest = build_manifest()
+        _write_manifest(path, manifest)
+
+    return {
+        method_name: {
+            arg: {
+                "default": (
+                    None
+                    if spec["default"] is None
+                    else ast.literal_eval(spec["default"])
+                ),
+                "type": ARG_TYPES.get(spec["type"]),
+            }
+            for arg, spec in arguments.items()
+        }
+        for method_name, arguments in manifest.items()
+    }
+
+
 def generate_completion_file():
     completion_script = f"""#!/bin/bash
 
@@ -180,21 +533,23 @@ _faker_file_completion() {{
     local cur prev providers commands
     cur="${{COMP_WORDS[COMP_CWORD]}}"
     prev="${{COMP_WORDS[COMP_CWORD - 1]}}"
-    providers="{(' '.join(PROVIDERS.keys()))}"
-    commands="generate-completion version"  # Add the commands here
+    providers="{(" ".join(PROVIDERS.keys()))}"
+    commands="batch generate-completion version"  # Add the commands here
 
     case $prev in"""
 
-    for method_name, provider in PROVIDERS.items():
-        method_kwargs, _ = get_method_kwargs(provider, method_name)
+    for method_name, method_kwargs in get_manifest().items():
         completion_script += f"""
         {method_name})
-            COMPREPLY=($(compgen -W "{(' '.join('--' + k for k in method_kwargs.keys()))} --nb_files" -- "$cur"))
+            COMPREPLY=($(compgen -W "{(" ".join("--" + k for k in method_kwargs.keys()))} --nb_files --workers --seed --stdout --tar-stream" -- "$cur"))
             ;;
         """  # noqa
 
     # Add the case for commands
     completion_script += """
+        batch)
+            COMPREPLY=($(compgen -f -- "$cur"))
+            ;;
         generate-completion|version)
             COMPREPLY=()
             ;;
@@ -94,9 +94,10 @@ from collections import namedtuple
 from io import BytesIO
 from typing import Tuple, Union
 
-from PIL import Image, ImageFont
+from PIL import Image
 
 from ...base import DEFAULT_FORMAT_FUNC
+from ...providers.helpers.fonts import get_pil_font
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2022-2025 Artur Barseghyan"
@@ -245,7 +246,7 @@ def add_paragraph(
         content=content,
         format_func=format_func,
     )
-    font = ImageFont.truetype(generator.font, generator.font_size)
+    font = get_pil_font(generator.font, generator.font_size)
     lines = _content.split("\n")
     line_max_num_chars = generator.find_max_fit_for_multi_line_text(
         generator.draw,
@@ -262,7 +263,7 @@ def add_paragraph(
         lines = textwrap.wrap(_content, line_max_num_chars)
 
     # Load a truetype or opentype font file, and create a font object.
-    font = ImageFont.truetype(generator.font, generator.font_size)
+    font = get_pil_font(generator.font, generator.font_size)
 
     y_text = position[1]
     # LOGGER.debug(f"position: {position}")
@@ -368,7 +369,7 @@ def add_heading(
     )
 
     # Here, you'll specify a different font size for heading
-    font = ImageFont.truetype(generator.font, font_size)
+    font = get_pil_font(generator.font, font_size)
 
     y = position[1]
     generator.draw.text(
@@ -491,7 +492,7 @@ def add_table(
     cell_height = kwargs.get("cell_height", 30)
 
     # Font for the table cells
-    font = ImageFont.truetype(generator.font, generator.font_size)
+    font = get_pil_font(generator.font, generator.font_size)
 
     # Extract or generate table data
     rows = kwargs.get("rows", 3)
@@ -2,12 +2,13 @@ from io import BytesIO
 
 from PIL import Image as PilImage
 from reportlab.lib import colors
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.platypus import Image, PageBreak, Paragraph, Table, TableStyle
 
 from ...base import DEFAULT_FORMAT_FUNC
+from ...providers.pdf_file.generators.reportlab_generator import (
+    get_paragraph_style,
+    register_font,
+)
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2022-2025 Artur Barseghyan"
@@ -144,10 +145,8 @@ def add_paragraph(
     )
 
     # Insert a paragraph
-    styles = getSampleStyleSheet()
-    style_paragraph = styles["Normal"]
-    style_paragraph.fontName = generator.font_name
-    pdfmetrics.registerFont(TTFont(generator.font_name, generator.font_path))
+    register_font(generator.font_name, generator.font_path)
+    style_paragraph = get_paragraph_style(generator.font_name)
     content = provider.generator.text(max_nb_chars=5_000)
     paragraph = Paragraph(content, style_paragraph)
     story.append(paragraph)
@@ -185,19 +184,16 @@ def add_heading(
     )
 
     # Insert a heading
-    styles = getSampleStyleSheet()
+    register_font(generator.font_name, generator.font_path)
 
     # Define the heading style based on the level
-    heading_style = ParagraphStyle(
+    heading_style = get_paragraph_style(
+        generator.font_name,
         f"Heading{level}",
-        parent=styles[f"Heading{level}"],
         fontSize=14 - level,
         spaceAfter=12,
     )
 
-    heading_style.fontName = generator.font_name
-    pdfmetrics.registerFont(TTFont(generator.font_name, generator.font_path))
-
     heading = Paragraph(_content, heading_style)
     story.append(heading)
 
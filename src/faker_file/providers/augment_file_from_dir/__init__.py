@@ -1,17 +1,18 @@
-import os
 from pathlib import Path
-from random import choice
 from typing import (
     Any,
     Callable,
     Dict,
     Iterable,
+    List,
     Optional,
+    Tuple,
     Type,
     Union,
     overload,
 )
 
+from faker import Faker
 from faker.providers import BaseProvider
 
 from ...base import BytesValue, FileMixin, StringValue
@@ -20,6 +21,7 @@ from ...storages.base import BaseStorage
 from ...storages.filesystem import FileSystemStorage
 from ..base.text_augmenter import BaseTextAugmenter
 from ..base.text_extractor import BaseTextExtractor
+from ..helpers.dir_index import get_dir_index
 from ..helpers.inner import (
     create_inner_docx_file,
     create_inner_eml_file,
@@ -136,6 +138,16 @@ class AugmentFileFromDirProvider(BaseProvider, FileMixin):
             prefix="zzz",
             extensions={"docx", "pdf"}
         )
+
+    Augment many files at once (texts are augmented in a single batch,
+    which is much faster with model based augmenters):
+
+    .. code-block:: python
+
+        files = FAKER.augment_files_from_dir(
+            source_dir_path="/tmp/tmp/",
+            count=100,
+        )
     """
 
     extension: str = ""
@@ -157,6 +169,8 @@ class AugmentFileFromDirProvider(BaseProvider, FileMixin):
             Union[str, Type[BaseTextAugmenter]]
         ] = DEFAULT_AUGMENTER,
         text_augmenter_kwargs: Optional[Dict[str, Any]] = None,
+        recursive: bool = False,
+        weights: Optional[Union[str, Dict[str, float]]] = None,
         raw: bool = True,
         **kwargs,
     ) -> BytesValue: ...
@@ -178,6 +192,8 @@ class AugmentFileFromDirProvider(BaseProvider, FileMixin):
             Union[str, Type[BaseTextAugmenter]]
         ] = DEFAULT_AUGMENTER,
         text_augmenter_kwargs: Optional[Dict[str, Any]] = None,
+        recursive: bool = False,
+        weights: Optional[Union[str, Dict[str, float]]] = None,
         **kwargs,
     ) -> StringValue: ...
 
@@ -197,6 +213,8 @@ class AugmentFileFromDirProvider(BaseProvider, FileMixin):
             Union[str, Type[BaseTextAugmenter]]
         ] = DEFAULT_AUGMENTER,
         text_augmenter_kwargs: Optional[Dict[str, Any]] = None,
+        recursive: bool = False,
+        weights: Optional[Union[str, Dict[str, float]]] = None,
         raw: bool = False,
         **kwargs,
     ) -> Union[BytesValue, StringValue]:
@@ -207,6 +225,12 @@ class AugmentFileFromDirProvider(BaseProvider, FileMixin):
         :param storage: Storage. Defaults to `FileSystemStorage`.
         :param basename: File basename (without extension).
         :param prefix: File name prefix.
+        :param recursive: If set to True, files of sub-directories are
+            considered as well.
+        :param weights: If not given, all files are equally likely to be
+            picked. If set to "size", files are weighted by their size. If a
+            dictionary is given (for instance, ``{"pdf": 3, "docx": 1}``),
+            files are weighted by extension.
         :param wrap_chars_after: If given, the output string would be separated
              by line breaks after the given position.
         :param text_extractor_cls: Text extractor class.
@@ -223,20 +247,176 @@ class AugmentFileFromDirProvider(BaseProvider, FileMixin):
         if storage is None:
             storage = FileSystemStorage()
 
-        if extensions is None:
-            extensions = EXTENSIONS
+        # Specific
+        ((file_type, content),) = self._augment_contents(
+            source_dir_path=source_dir_path,
+            count=1,
+            extensions=extensions,
+            text_extractor_cls=text_extractor_cls,
+            text_extractor_kwargs=text_extractor_kwargs,
+            text_augmenter_cls=text_augmenter_cls,
+            text_augmenter_kwargs=text_augmenter_kwargs,
+            recursive=recursive,
+            weights=weights,
+        )
+
+        return FILE_TYPE_TO_INNER_FUNC_MAPPING[file_type](
+            storage=storage,
+            basename=basename,
+            prefix=prefix,
+            content=content,
+            wrap_chars_after=wrap_chars_after,
+            raw=raw,
+        )
+
+    @overload
+    def augment_files_from_dir(
+        self: "AugmentFileFromDirProvider",
+        source_dir_path: str,
+        count: int = 1,
+        extensions: Optional[Iterable[str]] = None,
+        storage: Optional[BaseStorage] = None,
+        prefix: Optional[str] = None,
+        wrap_chars_after: Optional[int] = None,
+        text_extractor_cls: Optional[
+            Union[str, Type[BaseTextExtractor]]
+        ] = DEFAULT_EXTRACTOR,
+        text_extractor_kwargs: Optional[Dict[str, Any]] = None,
+        text_augmenter_cls: Optional[
+            Union[str, Type[BaseTextAugmenter]]
+        ] = DEFAULT_AUGMENTER,
+        text_augmenter_kwargs: Optional[Dict[str, Any]] = None,
+        recursive: bool = False,
+        weights: Optional[Union[str, Dict[str, float]]] = None,
+        raw: bool = True,
+        **kwargs,
+    ) -> List[BytesValue]: ...
+
+    @overload
+    def augment_files_from_dir(
+        self: "AugmentFileFromDirProvider",
+        source_dir_path: str,
+        count: int = 1,
+        extensions: Optional[Iterable[str]] = None,
+        storage: Optional[BaseStorage] = None,
+        prefix: Optional[str] = None,
+        wrap_chars_after: Optional[int] = None,
+        text_extractor_cls: Optional[
+            Union[str, Type[BaseTextExtractor]]
+        ] = DEFAULT_EXTRACTOR,
+        text_extractor_kwargs: Optional[Dict[str, Any]] = None,
+        text_augmenter_cls: Optional[
+            Union[str, Type[BaseTextAugmenter]]
+        ] = DEFAULT_AUGMENTER,
+        text_augmenter_kwargs: Optional[Dict[str, Any]] = None,
+        recursive: bool = False,
+        weights: Optional[Union[str, Dict[str, float]]] = None,
+        **kwargs,
+    ) -> List[StringValue]: ...
+
+    def augment_files_from_dir(
+        self: "AugmentFileFromDirProvider",
+        source_dir_path: str,
+        count: int = 1,
+        extensions: Optional[Iterable[str]] = None,
+        storage: Optional[BaseStorage] = None,
+        prefix: Optional[str] = None,
+        wrap_chars_after: Optional[int] = None,
+        text_extractor_cls: Optional[
+            Union[str, Type[BaseTextExtractor]]
+        ] = DEFAULT_EXTRACTOR,
+        text_extractor_kwargs: Optional[Dict[str, Any]] = None,
+        text_augmenter_cls: Optional[
+            Union[str, Type[BaseTextAugmenter]]
+        ] = DEFAULT_AUGMENTER,
+        text_augmenter_kwargs: Optional[Dict[str, Any]] = None,
+        recursive: bool = False,
+        weights: Optional[Union[str, Dict[str, float]]] = None,
+        raw: bool = False,
+        **kwargs,
+    ) -> Union[List[BytesValue], List[StringValue]]:
+        """Augment `count` random files from given directory.
+
+        Same as `augment_file_from_dir`, but texts of all picked files are
+        augmented in a single `augment_many` call.
+
+        :param source_dir_path: Source files directory.
+        :param count: Number of files to generate.
+        :param extensions: Allowed extensions.
+        :param storage: Storage. Defaults to `FileSystemStorage`.
+        :param prefix: File name prefix.
+        :param recursive: If set to True, files of sub-directories are
+            considered as well.
+        :param weights: See `augment_file_from_dir`.
+        :param wrap_chars_after: If given, the output string would be separated
+             by line breaks after the given position.
+        :param text_extractor_cls: Text extractor class.
+        :param text_extractor_kwargs: Text extractor kwargs.
+        :param text_augmenter_cls: Text augmenter class.
+        :param text_augmenter_kwargs: Text augmenter kwargs.
+        :param raw: If set to True, return list of `BytesValue` (binary
+            content of the files). Otherwise, return list of `StringValue`
+            (paths to the saved files).
+        :return: List of relative paths (from root directory) of the
+            generated files or raw contents of the files.
+        """
+        # Generic
+        if storage is None:
+            storage = FileSystemStorage()
 
         # Specific
-        source_file_choices = [
-            os.path.join(source_dir_path, _f)
-            for _f in os.listdir(source_dir_path)
-            if (
-                os.path.isfile(os.path.join(source_dir_path, _f))
-                and os.path.splitext(_f)[1][1:] in extensions
+        return [
+            FILE_TYPE_TO_INNER_FUNC_MAPPING[file_type](
+                storage=storage,
+                prefix=prefix,
+                content=content,
+                wrap_chars_after=wrap_chars_after,
+                raw=raw,
+            )
+            for file_type, content in self._augment_contents(
+                source_dir_path=source_dir_path,
+                count=count,
+                extensions=extensions,
+                text_extractor_cls=text_extractor_cls,
+                text_extractor_kwargs=text_extractor_kwargs,
+                text_augmenter_cls=text_augmenter_cls,
+                text_augmenter_kwargs=text_augmenter_kwargs,
+                recursive=recursive,
+                weights=weights,
             )
         ]
-        source_file_path = choice(source_file_choices)
-        source_file = Path(source_file_path)
+
+    def _augment_contents(
+        self: "AugmentFileFromDirProvider",
+        source_dir_path: str,
+        count: int,
+        extensions: Optional[Iterable[str]],
+        text_extractor_cls: Optional[Union[str, Type[BaseTextExtractor]]],
+        text_extractor_kwargs: Optional[Dict[str, Any]],
+        text_augmenter_cls: Optional[Union[str, Type[BaseTextAugmenter]]],
+        text_augmenter_kwargs: Optional[Dict[str, Any]],
+        recursive: bool,
+        weights: Optional[Union[str, Dict[str, float]]],
+    ) -> List[Tuple[str, str]]:
+        """Pick `count` source files and augment their texts.
+
+        :return: List of (file type, augmented text) pairs.
+        """
+        if extensions is None:
+            extensions = EXTENSIONS
+
+        if self.generator is None:
+            self.generator = Faker()
+
+        dir_index = get_dir_index(
+            source_dir_path,
+            extensions=extensions,
+            recursive=recursive,
+        )
+        source_files = [
+            Path(dir_index.choice(weights=weights, rand=self.generator.random))
+            for _ in range(count)
+        ]
 
         if text_extractor_cls is None:
             text_extractor_cls = DEFAULT_EXTRACTOR
@@ -248,8 +428,10 @@ class AugmentFileFromDirProvider(BaseProvider, FileMixin):
             text_extractor_kwargs = {}
 
         text_extractor = text_extractor_cls(**text_extractor_kwargs)
-        extracted_content = text_extractor.extract(source_file)
-        file_type = source_file.suffix[1:]
+        extracted_contents = [
+            text_extractor.extract_cached(source_file)
+            for source_file in source_files
+        ]
 
         if text_augmenter_cls is None:
             text_augmenter_cls = DEFAULT_AUGMENTER
@@ -261,13 +443,9 @@ class AugmentFileFromDirProvider(BaseProvider, FileMixin):
             text_augmenter_kwargs = {}
 
         text_augmenter = text_augmenter_cls(**text_augmenter_kwargs)
-        content = text_augmenter.augment(extracted_content)
+        contents = text_augmenter.augment_many(extracted_contents)
 
-        return FILE_TYPE_TO_INNER_FUNC_MAPPING[file_type](
-            storage=storage,
-            basename=basename,
-            prefix=prefix,
-            content=content,
-            wrap_chars_after=wrap_chars_after,
-            raw=raw,
-        )
+        return [
+            (source_file.suffix[1:], content)
+            for source_file, content in zip(source_files, contents)
+        ]
@@ -2,6 +2,9 @@
 Deprecated! Use FakerWordAugmenter.
 """
 
+from threading import Lock
+from typing import Dict, Iterable, List, Tuple
+
 import nlpaug.augmenter.word as naw
 
 from ...base.text_augmenter import BaseTextAugmenter
@@ -12,11 +15,13 @@ __license__ = "MIT"
 __all__ = (
     "ContextualWordEmbeddingsAugmenter",
     "DEFAULT_ACTION",
+    "DEFAULT_DEVICE",
     "DEFAULT_MODEL_PATH",
 )
 
 DEFAULT_MODEL_PATH = "bert-base-multilingual-cased"
 DEFAULT_ACTION = "substitute"
+DEFAULT_DEVICE = "cpu"
 
 
 class ContextualWordEmbeddingsAugmenter(BaseTextAugmenter):
@@ -66,10 +71,21 @@ class ContextualWordEmbeddingsAugmenter(BaseTextAugmenter):
 
         - insert
         - substitute
+
+    Options for `device` are `cpu`, `cuda` (or `cuda:0`, `cuda:1`, etc.).
+
+    Loaded models are cached per (`model_path`, `action`, `device`) and
+    shared by all instances of the class (and thus, by all
+    `augment_file_from_dir` calls). To free the memory, call
+    `ContextualWordEmbeddingsAugmenter.clear_cache()`.
     """
 
     model_path: str = DEFAULT_MODEL_PATH
     action: str = DEFAULT_ACTION
+    device: str = DEFAULT_DEVICE
+
+    _augmenters: Dict[Tuple[str, str, str], naw.ContextualWordEmbsAug] = {}
+    _augmenters_lock: Lock = Lock()
 
     def handle_kwargs(
         self: "ContextualWordEmbeddingsAugmenter", **kwargs
@@ -79,14 +95,47 @@ class ContextualWordEmbeddingsAugmenter(BaseTextAugmenter):
             self.model_path = kwargs["model_path"]
         if "action" in kwargs:
             self.action = kwargs["action"]
+        if "device" in kwargs:
+            self.device = kwargs["device"]
+
+    @property
+    def augmenter(
+        self: "ContextualWordEmbeddingsAugmenter",
+    ) -> naw.ContextualWordEmbsAug:
+        """Get (cached) `ContextualWordEmbsAug` instance. Loaded lazily."""
+        key = (self.model_path, self.action, self.device)
+        augmenter = self._augmenters.get(key)
+        if augmenter is None:
+            with self._augmenters_lock:
+                augmenter = self._augmenters.get(key)
+                if augmenter is None:
+                    augmenter = naw.ContextualWordEmbsAug(
+                        model_path=self.model_path,
+                        action=self.action,
+                        device=self.device,
+                    )
+                    self._augmenters[key] = augmenter
+        return augmenter
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all cached models."""
+        with cls._augmenters_lock:
+            cls._augmenters.clear()
 
     def augment(
         self: "ContextualWordEmbeddingsAugmenter",
         text: str,
     ) -> str:
         """Augment text."""
-        aug = naw.ContextualWordEmbsAug(
-            model_path=self.model_path,
-            action=self.action,
-        )
-        return aug.augment(text)[0]
+        return self.augmenter.augment(text)[0]
+
+    def augment_many(
+        self: "ContextualWordEmbeddingsAugmenter",
+        texts: Iterable[str],
+    ) -> List[str]:
+        """Augment several texts, in batches of the model."""
+        texts = list(texts)
+        if not texts:
+            return []
+        return self.augmenter.augment(texts)
@@ -5,11 +5,18 @@ import tika
 from tika import parser
 
 from ...base.text_extractor import BaseTextExtractor
+from ...helpers.extraction_cache import MemoryExtractionCache
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2022-2025 Artur Barseghyan"
 __license__ = "MIT"
-__all__ = ("TikaTextExtractor",)
+__all__ = (
+    "TIKA_EXTRACTION_CACHE",
+    "TikaTextExtractor",
+)
+
+# Shared by all `TikaTextExtractor` instances, unless overridden
+TIKA_EXTRACTION_CACHE = MemoryExtractionCache()
 
 
 class TikaTextExtractor(BaseTextExtractor):
@@ -33,8 +40,13 @@ class TikaTextExtractor(BaseTextExtractor):
         file = FAKER.augment_file_from_dir(
             text_extractor_cls=tika_extractor.TikaTextExtractor
         )
+
+    Extracted text is cached in memory (`TIKA_EXTRACTION_CACHE`). See
+    `faker_file.providers.helpers.extraction_cache` for an on-disk cache.
     """
 
+    cache = TIKA_EXTRACTION_CACHE
+
     def handle_kwargs(self: "TikaTextExtractor", **kwargs) -> None:
         """Handle kwargs."""
 
@@ -1,7 +1,5 @@
 import logging
-import os
 from pathlib import Path
-from random import choice
 from typing import (
     Any,
     Callable,
@@ -14,6 +12,7 @@ from typing import (
     overload,
 )
 
+from faker import Faker
 from faker.providers import BaseProvider
 
 from ..base import BytesValue, FileMixin, StringValue
@@ -21,6 +20,7 @@ from ..helpers import random_pop
 from ..registry import FILE_REGISTRY
 from ..storages.base import BaseStorage
 from ..storages.filesystem import FileSystemStorage
+from .helpers.dir_index import get_dir_index
 from .image.augment import augment_image_file
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
@@ -86,6 +86,8 @@ class AugmentRandomImageFromDirProvider(BaseProvider, FileMixin):
         augmentations: Optional[List[Tuple[Callable, Dict[str, Any]]]] = None,
         num_steps: Optional[int] = None,
         pop_func: Callable = random_pop,
+        recursive: bool = False,
+        weights: Optional[Union[str, Dict[str, float]]] = None,
         raw: bool = True,
         **kwargs,
     ) -> BytesValue: ...
@@ -101,6 +103,8 @@ class AugmentRandomImageFromDirProvider(BaseProvider, FileMixin):
         augmentations: Optional[List[Tuple[Callable, Dict[str, Any]]]] = None,
         num_steps: Optional[int] = None,
         pop_func: Callable = random_pop,
+        recursive: bool = False,
+        weights: Optional[Union[str, Dict[str, float]]] = None,
         **kwargs,
     ) -> StringValue: ...
 
@@ -114,6 +118,8 @@ class AugmentRandomImageFromDirProvider(BaseProvider, FileMixin):
         augmentations: Optional[List[Tuple[Callable, Dict[str, Any]]]] = None,
         num_steps: Optional[int] = None,
         pop_func: Callable = random_pop,
+        recursive: bool = False,
+        weights: Optional[Union[str, Dict[str, float]]] = None,
         raw: bool = False,
         **kwargs,
     ) -> Union[BytesValue, StringValue]:
@@ -124,6 +130,12 @@ class AugmentRandomImageFromDirProvider(BaseProvider, FileMixin):
         :param storage: Storage. Defaults to `FileSystemStorage`.
         :param basename: File basename (without extension).
         :param prefix: File name prefix.
+        :param recursive: If set to True, files of sub-directories are
+            considered as well.
+        :param weights: If not given, all files are equally likely to be
+            picked. If set to "size", files are weighted by their size. If a
+            dictionary is given (for instance, ``{"pdf": 3, "docx": 1}``),
+            files are weighted by extension.
         :param augmentations: List of tuples of callable augmentation
             functions and their respective keyword arguments. If not
             provided, the default augmentation functions will be used.
@@ -147,16 +159,15 @@ class AugmentRandomImageFromDirProvider(BaseProvider, FileMixin):
         if extensions is None:
             extensions = EXTENSIONS
 
+        if self.generator is None:
+            self.generator = Faker()
+
         # Specific
-        source_file_choices = [
-            os.path.join(source_dir_path, _f)
-            for _f in os.listdir(source_dir_path)
-            if (
-                os.path.isfile(os.path.join(source_dir_path, _f))
-                and os.path.splitext(_f)[1][1:] in extensions
-            )
-        ]
-        source_file_path = choice(source_file_choices)
+        source_file_path = get_dir_index(
+            source_dir_path,
+            extensions=extensions,
+            recursive=recursive,
+        ).choice(weights=weights, rand=self.generator.random)
         source_file = Path(source_file_path)
 
         # Generic
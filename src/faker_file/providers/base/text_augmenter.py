@@ -1,3 +1,5 @@
+from typing import Iterable, List
+
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2022-2025 Artur Barseghyan"
 __license__ = "MIT"
@@ -26,3 +28,14 @@ class BaseTextAugmenter:
         text: str,
     ) -> str:
         raise NotImplementedError("Method `augment` is not implemented.")
+
+    def augment_many(
+        self: "BaseTextAugmenter",
+        texts: Iterable[str],
+    ) -> List[str]:
+        """Augment several texts.
+
+        Augmenters backed by a model could override this to process
+        all texts in one go.
+        """
+        return [self.augment(text) for text in texts]
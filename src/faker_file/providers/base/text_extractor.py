@@ -1,5 +1,7 @@
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
+
+from ..helpers.extraction_cache import BaseExtractionCache, make_cache_key
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2022-2025 Artur Barseghyan"
@@ -8,9 +10,17 @@ __all__ = ("BaseTextExtractor",)
 
 
 class BaseTextExtractor:
-    """Base text extractor."""
+    """Base text extractor.
+
+    Extracted text is cached in `cache` (if set), which could be overridden
+    with the `cache` kwarg (set it to None to disable caching). Cache keys
+    are made of the path, size and modification time of the file, or of
+    its content hash, if `cache_by_content` kwarg is set to True.
+    """
 
     path: str
+    cache: Optional[BaseExtractionCache] = None
+    cache_by_content: bool = False
 
     def __init__(
         self: "BaseTextExtractor",
@@ -21,6 +31,10 @@ class BaseTextExtractor:
         :param kwargs: Dictionary with parameters (for text extractor
             specific tuning).
         """
+        if "cache" in kwargs:
+            self.cache = kwargs["cache"]
+        if "cache_by_content" in kwargs:
+            self.cache_by_content = kwargs["cache_by_content"]
         self.handle_kwargs(**kwargs)
 
     def handle_kwargs(self: "BaseTextExtractor", **kwargs):
@@ -31,3 +45,22 @@ class BaseTextExtractor:
         source_file: Union[Path, str],
     ) -> str:
         raise NotImplementedError("Method `extract` is not implemented.")
+
+    def extract_cached(
+        self: "BaseTextExtractor",
+        source_file: Union[Path, str],
+    ) -> str:
+        """Extract text, using the cache (if set)."""
+        if self.cache is None:
+            return self.extract(source_file)
+
+        key = (
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}:"
+            f"{make_cache_key(source_file, by_content=self.cache_by_content)}"
+        )
+        content = self.cache.get(key)
+        if content is None:
+            content = self.extract(source_file)
+            if content is not None:
+                self.cache.set(key, content)
+        return content
@@ -1,4 +1,3 @@
-import os
 from email.message import EmailMessage
 from email.policy import Policy, default
 from typing import Any, Callable, Dict, Optional, Union, overload
@@ -13,14 +12,17 @@ from ..base import (
     BytesValue,
     FileMixin,
     StringValue,
-    returns_list,
 )
 from ..constants import DEFAULT_TEXT_MAX_NB_CHARS
 from ..helpers import get_mime_maintype_subtype
 from ..registry import FILE_REGISTRY
 from ..storages.base import BaseStorage
 from ..storages.filesystem import FileSystemStorage
-from .helpers.inner import create_inner_txt_file
+from .helpers.inner import (
+    create_inner_files,
+    create_inner_txt_file,
+    read_inner_file,
+)
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2022-2025 Artur Barseghyan"
@@ -84,6 +86,30 @@ class EmlFileProvider(BaseProvider, FileMixin):
 
         file = FAKER.eml_file(cte_type="7bit", content=FAKER.text())
 
+    Usage example of generating inner files in parallel (each inner file
+    gets its own seed, derived from ``FAKER``, so seeded runs are
+    reproducible; ``executor`` could be either ``"thread"`` (default),
+    ``"process"`` or a ``concurrent.futures.Executor`` instance):
+
+    .. code-block:: python
+
+        file = FAKER.eml_file(
+            options={
+                "count": 100,
+                "create_inner_file_func": create_inner_docx_file,
+                "workers": 4,
+                "executor": "process",
+            },
+        )
+
+    Worker generators are new ``Faker`` instances of the same locale, with
+    all providers of ``FAKER`` added (by class, thus custom providers,
+    used in ``content`` templates, keep working). With the ``"process"``
+    executor, ``create_inner_file_func``, its arguments and custom
+    provider classes are sent to other processes, thus shall be picklable
+    (defined at module level): lambdas and ``functools.partial`` objects
+    over local functions fail there.
+
     If you want to see, which files were included inside the EML, check
     the ``file.data["files"]``.
     """
@@ -244,58 +270,37 @@ class EmlFileProvider(BaseProvider, FileMixin):
                 "create_inner_file_func", create_inner_txt_file
             )
             _create_inner_file_args = options.get("create_inner_file_args", {})
+            _workers = options.get("workers")
+            _executor = options.get("executor")
 
         else:
             # Defaults
             _count = 0
             _create_inner_file_func = create_inner_txt_file
             _create_inner_file_args = {}
+            _workers = None
+            _executor = None
+
+        _files = create_inner_files(
+            create_inner_file_func=_create_inner_file_func,
+            create_inner_file_args=_create_inner_file_args,
+            count=_count,
+            storage=fs_storage,
+            generator=self.generator,
+            workers=_workers,
+            executor=_executor,
+        )
 
-        _kwargs = {"generator": self.generator}
-        _kwargs.update(_create_inner_file_args)
-
-        # If `_create_inner_file_func` returns a list of values
-        if returns_list(_create_inner_file_func):
-            _files = _create_inner_file_func(
-                storage=fs_storage,
-                **_kwargs,
+        for __file in _files:
+            __key, __name, __content = read_inner_file(__file, fs_storage)
+            data["inner"][__key] = __file
+            _maintype, _subtype = get_mime_maintype_subtype(path=__name)
+            msg.add_attachment(
+                __content,
+                maintype=_maintype,
+                subtype=_subtype,
+                filename=__name,
             )
-            for __file in _files:
-                data["inner"][str(__file)] = __file
-                __file_abs_path = fs_storage.abspath(__file)
-                _maintype, _subtype = get_mime_maintype_subtype(
-                    path=__file_abs_path,
-                )
-                with open(__file_abs_path, "rb") as _fp:
-                    _file_data = _fp.read()
-                    msg.add_attachment(
-                        _file_data,
-                        maintype=_maintype,
-                        subtype=_subtype,
-                        filename=os.path.basename(__file),
-                    )
-                os.remove(__file_abs_path)  # Clean up temporary files
-        # If `_create_inner_file_func` returns a single value
-        else:
-            for __i in range(_count):
-                __file = _create_inner_file_func(
-                    storage=fs_storage,
-                    **_kwargs,
-                )
-                data["inner"][str(__file)] = __file
-                __file_abs_path = fs_storage.abspath(__file)
-                _maintype, _subtype = get_mime_maintype_subtype(
-                    path=__file_abs_path,
-                )
-                with open(__file_abs_path, "rb") as _fp:
-                    _file_data = _fp.read()
-                    msg.add_attachment(
-                        _file_data,
-                        maintype=_maintype,
-                        subtype=_subtype,
-                        filename=os.path.basename(__file),
-                    )
-                os.remove(__file_abs_path)  # Clean up temporary files
 
         if raw:
             raw_content = BytesValue(msg.as_bytes(policy=policy))
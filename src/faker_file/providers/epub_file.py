@@ -183,19 +183,18 @@ class EpubFileProvider(BaseProvider, FileMixin):
             "storage": storage,
         }
 
-        _raw_content = bytes()
-        with open(_local_file_name, "rb") as fakefile:
-            _raw_content = fakefile.read()
+        try:
+            if raw:
+                with open(_local_file_name, "rb") as fakefile:
+                    raw_content = BytesValue(fakefile.read())
+                raw_content.data = data
+                return raw_content
+
+            storage.write_file(filename, _local_file_name)
+        finally:
             os.remove(_local_file_name)
             shutil.rmtree(_book.EPUB_DIR)
 
-        if raw:
-            raw_content = BytesValue(_raw_content)
-            raw_content.data = data
-            return raw_content
-
-        storage.write_bytes(filename, _raw_content)
-
         # Generic
         file_name = StringValue(storage.relpath(filename))
         file_name.data = data
@@ -77,7 +77,9 @@ class FileFromPathProvider(BaseProvider, FileMixin):
     ) -> Union[BytesValue, StringValue]:
         """File from given path.
 
-        :param path: Path to source file.
+        :param path: Path to source file. Cloud storages also accept URI
+            of a file in the same cloud (such as `s3://bucket/file.pdf`),
+            copied server-side, unless `raw` is set.
         :param storage: Storage. Defaults to `FileSystemStorage`.
         :param basename: File basename (without extension).
         :param prefix: File name prefix.
@@ -103,13 +105,13 @@ class FileFromPathProvider(BaseProvider, FileMixin):
         data = {"filename": filename, "storage": storage}
 
         # Specific
-        with open(path, "rb") as _file:
-            if raw:
+        if raw:
+            with open(path, "rb") as _file:
                 raw_content = BytesValue(_file.read())
-                raw_content.data = data
-                return raw_content
+            raw_content.data = data
+            return raw_content
 
-            storage.write_bytes(filename, _file.read())
+        storage.copy_file(filename, path)
 
         # Generic
         file_name = StringValue(storage.relpath(filename))
@@ -140,7 +140,7 @@ class GenericFileProvider(BaseProvider, FileMixin):
             storage = FileSystemStorage()
 
         filename = storage.generate_filename(
-            extension=self.extension,
+            extension=extension,
             prefix=prefix,
             basename=basename,
         )
@@ -0,0 +1,216 @@
+import os
+import random
+import time
+from bisect import bisect
+from itertools import accumulate
+from threading import Lock
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+__author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
+__copyright__ = "2022-2025 Artur Barseghyan"
+__license__ = "MIT"
+__all__ = (
+    "DIR_INDEX_TTL",
+    "DirIndex",
+    "clear_dir_index_cache",
+    "get_dir_index",
+)
+
+# Time (in seconds) during which a cached index is used as is, without
+# checking directory modification times. If None, modification times are
+# checked on every call (one `stat` per indexed directory).
+DIR_INDEX_TTL: Optional[float] = None
+
+_DIR_INDEX_CACHE: Dict[
+    Tuple[str, Optional[FrozenSet[str]], bool], "DirIndex"
+] = {}
+_DIR_INDEX_CACHE_LOCK = Lock()
+
+
+class DirIndex:
+    """Index of files in a directory.
+
+    Built once with `os.scandir`. Files are sorted by path, so that picks
+    made with a seeded random instance are reproducible. Picking a random
+    file is O(1) (or O(log n) for weighted picks).
+
+    Usage example:
+
+    .. code-block:: python
+
+        import random
+
+        from faker_file.providers.helpers.dir_index import get_dir_index
+
+        index = get_dir_index("/tmp/tmp/", extensions={"docx", "pdf"})
+        path = index.choice()
+
+        # Files with "pdf" extension are 3 times more likely to be picked
+        path = index.choice(weights={"pdf": 3, "docx": 1})
+
+        # Larger files are more likely to be picked
+        path = index.choice(weights="size")
+
+        # Reproducible picks
+        path = index.choice(rand=random.Random(42))
+    """
+
+    def __init__(
+        self: "DirIndex",
+        path: str,
+        extensions: Optional[Iterable[str]] = None,
+        recursive: bool = False,
+    ) -> None:
+        """
+        :param path: Directory path.
+        :param extensions: Allowed extensions (without leading dot). If not
+            given, all files are indexed.
+        :param recursive: If set to True, sub-directories are indexed too.
+        """
+        self.path = path
+        self.extensions = (
+            frozenset(extensions) if extensions is not None else None
+        )
+        self.recursive = recursive
+        self.paths: List[str] = []
+        self.file_extensions: List[str] = []
+        self.dir_mtimes: Dict[str, float] = {}
+        self._cum_weights: Dict[Union[str, Tuple], List[float]] = {}
+        self._lock = Lock()
+        self._scan(path)
+        if self.paths:
+            self.paths, self.file_extensions = map(
+                list, zip(*sorted(zip(self.paths, self.file_extensions)))
+            )
+        self.indexed_at = time.monotonic()
+
+    def _scan(self: "DirIndex", path: str) -> None:
+        self.dir_mtimes[path] = os.stat(path).st_mtime
+        sub_dirs = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    extension = os.path.splitext(entry.name)[1][1:]
+                    if self.extensions is None or extension in self.extensions:
+                        self.paths.append(entry.path)
+                        self.file_extensions.append(extension)
+                elif self.recursive and entry.is_dir():
+                    sub_dirs.append(entry.path)
+        for sub_dir in sub_dirs:
+            self._scan(sub_dir)
+
+    def __len__(self: "DirIndex") -> int:
+        return len(self.paths)
+
+    def is_stale(self: "DirIndex", ttl: Optional[float] = None) -> bool:
+        """Check if index is outdated.
+
+        :param ttl: If given, the index is considered fresh for `ttl`
+            seconds since it was built, without checking directory
+            modification times, and stale afterwards.
+        """
+        if ttl is not None:
+            return time.monotonic() - self.indexed_at > ttl
+        try:
+            return any(
+                os.stat(path).st_mtime != mtime
+                for path, mtime in self.dir_mtimes.items()
+            )
+        except OSError:
+            return True
+
+    def _get_cum_weights(
+        self: "DirIndex",
+        weights: Union[str, Dict[str, float]],
+    ) -> List[float]:
+        key = weights if isinstance(weights, str) else tuple(weights.items())
+        cum_weights = self._cum_weights.get(key)
+        if cum_weights is None:
+            if weights == "size":
+                values = (os.stat(path).st_size for path in self.paths)
+            elif isinstance(weights, dict):
+                values = (
+                    weights.get(extension, 0)
+                    for extension in self.file_extensions
+                )
+            else:
+                raise ValueError(
+                    f"Unsupported weights {weights!r}. Use 'size' or a "
+                    f"dictionary of extension weights."
+                )
+            cum_weights = list(accumulate(values))
+            with self._lock:
+                self._cum_weights[key] = cum_weights
+        return cum_weights
+
+    def choice(
+        self: "DirIndex",
+        weights: Optional[Union[str, Dict[str, float]]] = None,
+        rand: Optional[random.Random] = None,
+    ) -> str:
+        """Pick a random file path.
+
+        :param weights: If not given, all files are equally likely to be
+            picked. If set to "size", files are weighted by their size. If
+            a dictionary is given (for instance, ``{"pdf": 3, "docx": 1}``),
+            files are weighted by extension (missing extensions get 0).
+        :param rand: Random instance (for instance, ``generator.random`` of
+            a seeded Faker). Defaults to the `random` module.
+        :return: File path.
+        """
+        if rand is None:
+            rand = random
+        if weights is None:
+            return rand.choice(self.paths)
+        cum_weights = self._get_cum_weights(weights)
+        if not cum_weights or cum_weights[-1] <= 0:
+            raise IndexError("Cannot choose from an empty sequence")
+        position = rand.random() * cum_weights[-1]
+        return self.paths[bisect(cum_weights, position)]
+
+
+def get_dir_index(
+    path: str,
+    extensions: Optional[Iterable[str]] = None,
+    recursive: bool = False,
+    ttl: Optional[float] = None,
+) -> DirIndex:
+    """Get (cached) index of files in a directory.
+
+    Indexes are cached per (path, extensions, recursive) and rebuilt when
+    stale (see `DirIndex.is_stale`).
+
+    :param path: Directory path.
+    :param extensions: Allowed extensions (without leading dot).
+    :param recursive: If set to True, sub-directories are indexed too.
+    :param ttl: Time (in seconds) to use a cached index without checking
+        directory modification times. Defaults to `DIR_INDEX_TTL`.
+    :return: Directory index.
+    """
+    if ttl is None:
+        ttl = DIR_INDEX_TTL
+    key = (
+        os.path.abspath(path),
+        frozenset(extensions) if extensions is not None else None,
+        recursive,
+    )
+    index = _DIR_INDEX_CACHE.get(key)
+    if index is None or index.is_stale(ttl):
+        index = DirIndex(path, extensions=extensions, recursive=recursive)
+        with _DIR_INDEX_CACHE_LOCK:
+            _DIR_INDEX_CACHE[key] = index
+    return index
+
+
+def clear_dir_index_cache() -> None:
+    """Forget all cached directory indexes."""
+    with _DIR_INDEX_CACHE_LOCK:
+        _DIR_INDEX_CACHE.clear()
@@ -0,0 +1,222 @@
+import hashlib
+import os
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Optional, Sequence, Union
+
+__author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
+__copyright__ = "2022-2025 Artur Barseghyan"
+__license__ = "MIT"
+__all__ = (
+    "BaseExtractionCache",
+    "MemoryExtractionCache",
+    "SqliteExtractionCache",
+    "TieredExtractionCache",
+    "make_cache_key",
+)
+
+DEFAULT_MAXSIZE = 256
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def make_cache_key(
+    source_file: Union[Path, str],
+    by_content: bool = False,
+) -> str:
+    """Make cache key for the given file.
+
+    :param source_file: Source file path.
+    :param by_content: If set to True, the key is the SHA-256 hash of the
+        file content (survives renames and copies, but the file is read
+        in full). Otherwise, the key is made of the absolute path, size
+        and modification time of the file (one `stat` call).
+    :return: Cache key.
+    """
+    if by_content:
+        _hash = hashlib.sha256()
+        with open(source_file, "rb") as _file:
+            for chunk in iter(lambda: _file.read(HASH_CHUNK_SIZE), b""):
+                _hash.update(chunk)
+        return f"sha256:{_hash.hexdigest()}"
+
+    stat = os.stat(source_file)
+    return f"{os.path.abspath(source_file)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class BaseExtractionCache:
+    """Base extraction cache."""
+
+    def get(self: "BaseExtractionCache", key: str) -> Optional[str]:
+        raise NotImplementedError("Method `get` is not implemented.")
+
+    def set(self: "BaseExtractionCache", key: str, value: str) -> None:
+        raise NotImplementedError("Method `set` is not implemented.")
+
+    def clear(self: "BaseExtractionCache") -> None:
+        raise NotImplementedError("Method `clear` is not implemented.")
+
+
+class MemoryExtractionCache(BaseExtractionCache):
+    """In-memory LRU extraction cache.
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker_file.providers.helpers.extraction_cache import (
+            MemoryExtractionCache,
+        )
+
+        cache = MemoryExtractionCache(maxsize=1_000)
+    """
+
+    def __init__(
+        self: "MemoryExtractionCache",
+        maxsize: int = DEFAULT_MAXSIZE,
+    ) -> None:
+        """
+        :param maxsize: Maximum number of cached items.
+        """
+        self.maxsize = maxsize
+        self._items: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self: "MemoryExtractionCache", key: str) -> Optional[str]:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def set(self: "MemoryExtractionCache", key: str, value: str) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self: "MemoryExtractionCache") -> None:
+        with self._lock:
+            self._items.clear()
+
+
+class SqliteExtractionCache(BaseExtractionCache):
+    """SQLite based (on-disk) extraction cache.
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker_file.providers.helpers.extraction_cache import (
+            SqliteExtractionCache,
+        )
+
+        cache = SqliteExtractionCache("/tmp/extraction_cache.sqlite3")
+    """
+
+    def __init__(
+        self: "SqliteExtractionCache",
+        path: Union[Path, str],
+    ) -> None:
+        """
+        :param path: Path to the database file. Created if missing.
+        """
+        self.path = str(path)
+        self._lock = Lock()
+        self._connection = sqlite3.connect(
+            self.path,
+            check_same_thread=False,
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS extraction_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+    def get(self: "SqliteExtractionCache", key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM extraction_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self: "SqliteExtractionCache", key: str, value: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO extraction_cache (key, value) "
+                "VALUES (?, ?)",
+                (key, value),
+            )
+
+    def clear(self: "SqliteExtractionCache") -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM extraction_cache")
+
+    def close(self: "SqliteExtractionCache") -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class TieredExtractionCache(BaseExtractionCache):
+    """Extraction cache with several tiers (fastest first).
+
+    Values found in a slower tier are copied to the faster ones.
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker import Faker
+        from faker_file.providers.augment_file_from_dir import (
+            AugmentFileFromDirProvider,
+        )
+        from faker_file.providers.helpers.extraction_cache import (
+            MemoryExtractionCache,
+            SqliteExtractionCache,
+            TieredExtractionCache,
+        )
+
+        FAKER = Faker()
+        FAKER.add_provider(AugmentFileFromDirProvider)
+
+        CACHE = TieredExtractionCache(
+            [
+                MemoryExtractionCache(maxsize=1_000),
+                SqliteExtractionCache("/tmp/extraction_cache.sqlite3"),
+            ]
+        )
+
+        file = FAKER.augment_file_from_dir(
+            source_dir_path="/tmp/tmp/",
+            text_extractor_kwargs={"cache": CACHE},
+        )
+    """
+
+    def __init__(
+        self: "TieredExtractionCache",
+        tiers: Sequence[BaseExtractionCache],
+    ) -> None:
+        """
+        :param tiers: Caches, fastest first.
+        """
+        self.tiers = list(tiers)
+
+    def get(self: "TieredExtractionCache", key: str) -> Optional[str]:
+        for counter, tier in enumerate(self.tiers):
+            value = tier.get(key)
+            if value is not None:
+                for faster_tier in self.tiers[:counter]:
+                    faster_tier.set(key, value)
+                return value
+        return None
+
+    def set(self: "TieredExtractionCache", key: str, value: str) -> None:
+        for tier in self.tiers:
+            tier.set(key, value)
+
+    def clear(self: "TieredExtractionCache") -> None:
+        for tier in self.tiers:
+            tier.clear()
@@ -0,0 +1,76 @@
+from functools import lru_cache
+from typing import Iterable, Sequence
+
+from PIL import ImageFont
+
+__author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
+__copyright__ = "2022-2025 Artur Barseghyan"
+__license__ = "MIT"
+__all__ = (
+    "clear_pil_font_cache",
+    "get_pil_font",
+    "warm_up_pil_font_cache",
+)
+
+# Maximum number of `FreeTypeFont` objects kept in the cache
+PIL_FONT_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=PIL_FONT_CACHE_SIZE)
+def _load_pil_font(
+    path: str,
+    size: int,
+    index: int,
+) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(path, size, index=index)
+
+
+def get_pil_font(
+    path: str,
+    size: int,
+    index: int = 0,
+) -> ImageFont.FreeTypeFont:
+    """Get a (cached) PIL font object.
+
+    Parsing a TTF file is costly, so font objects are cached process-wide
+    by (path, size, index) and shared by all PIL-based generators and
+    snippets.
+
+    :param path: Path to the font file.
+    :param size: Font size.
+    :param index: Index of the font face to load (in font collections).
+    :return: Font object.
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker_file.providers.helpers.fonts import get_pil_font
+
+        font = get_pil_font("DejaVuSans.ttf", 12)
+    """
+    return _load_pil_font(str(path), size, index)
+
+
+def warm_up_pil_font_cache(fonts: Iterable[Sequence]) -> None:
+    """Load given fonts into the cache upfront.
+
+    :param fonts: Iterable of (path, size) or (path, size, index) tuples.
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker_file.providers.helpers.fonts import warm_up_pil_font_cache
+
+        warm_up_pil_font_cache(
+            [("DejaVuSans.ttf", size) for size in (12, 14, 16, 18, 20, 24)]
+        )
+    """
+    for font in fonts:
+        get_pil_font(*font)
+
+
+def clear_pil_font_cache() -> None:
+    """Clear the font cache."""
+    _load_pil_font.cache_clear()
@@ -1,10 +1,19 @@
+import os
+import random
+import threading
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from email.policy import Policy
-from random import choice
+from pathlib import Path
 from typing import (
     Any,
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -16,9 +25,15 @@ from typing import (
 
 from faker import Faker
 from faker.generator import Generator
+from faker.providers import BaseProvider
 from faker.providers.python import Provider
 
-from ...base import DEFAULT_FORMAT_FUNC, BytesValue, StringValue
+from ...base import (
+    DEFAULT_FORMAT_FUNC,
+    BytesValue,
+    StringValue,
+    returns_list,
+)
 from ...constants import (
     DEFAULT_AUDIO_MAX_NB_CHARS,
     DEFAULT_IMAGE_MAX_NB_CHARS,
@@ -39,6 +54,7 @@ __all__ = (
     "create_inner_csv_file",
     "create_inner_docx_file",
     "create_inner_eml_file",
+    "create_inner_files",
     "create_inner_epub_file",
     "create_inner_file_from_path",
     "create_inner_generic_file",
@@ -67,9 +83,44 @@ __all__ = (
     "create_inner_xml_file",
     "create_inner_zip_file",
     "fuzzy_choice_create_inner_file",
+    "get_inner_provider",
+    "inner_file_reference",
     "list_create_inner_file",
+    "read_inner_file",
 )
 
+# Name of the generator attribute, holding providers created for it
+_PROVIDERS_ATTR = "_faker_file_inner_providers"
+# Providers created for calls without a generator
+_DEFAULT_PROVIDERS: Dict[Type[BaseProvider], BaseProvider] = {}
+
+
+def get_inner_provider(
+    provider_cls: Type[BaseProvider],
+    generator: Optional[Union[Faker, Generator, Provider]] = None,
+) -> BaseProvider:
+    """Get provider instance, created once per (provider class, generator).
+
+    Providers are cached on the generator itself, thus released together
+    with it. Providers created without a generator are cached globally;
+    they create a `Faker` instance on first use and reuse it afterwards.
+
+    :param provider_cls: Provider class, such as `TxtFileProvider`.
+    :param generator: Generator.
+    :return: Provider instance.
+    """
+    if generator is None:
+        providers = _DEFAULT_PROVIDERS
+    else:
+        try:
+            providers = vars(generator).setdefault(_PROVIDERS_ATTR, {})
+        except TypeError:  # Generator without `__dict__`
+            return provider_cls(generator)
+    provider = providers.get(provider_cls)
+    if provider is None:
+        provider = providers.setdefault(provider_cls, provider_cls(generator))
+    return provider
+
 
 # ************************************************
 # ************ augment_image_from_path ***********
@@ -123,7 +174,9 @@ def create_inner_augment_image_from_path(
     except ImportError as err:
         raise err
 
-    return AugmentImageFromPathProvider(generator).augment_image_from_path(
+    return get_inner_provider(
+        AugmentImageFromPathProvider, generator
+    ).augment_image_from_path(
         path=path,
         storage=storage,
         basename=basename,
@@ -193,8 +246,8 @@ def create_inner_augment_random_image_from_dir(
     except ImportError as err:
         raise err
 
-    return AugmentRandomImageFromDirProvider(
-        generator
+    return get_inner_provider(
+        AugmentRandomImageFromDirProvider, generator
     ).augment_random_image_from_dir(
         source_dir_path=source_dir_path,
         extensions=extensions,
@@ -255,7 +308,7 @@ def create_inner_bin_file(
     except ImportError as err:
         raise err
 
-    return BinFileProvider(generator).bin_file(
+    return get_inner_provider(BinFileProvider, generator).bin_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -330,7 +383,7 @@ def create_inner_csv_file(
     except ImportError as err:
         raise err
 
-    return CsvFileProvider(generator).csv_file(
+    return get_inner_provider(CsvFileProvider, generator).csv_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -403,7 +456,7 @@ def create_inner_docx_file(
     except ImportError as err:
         raise err
 
-    return DocxFileProvider(generator).docx_file(
+    return get_inner_provider(DocxFileProvider, generator).docx_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -478,7 +531,7 @@ def create_inner_eml_file(
         from ..eml_file import EmlFileProvider
     except ImportError as err:
         raise err
-    return EmlFileProvider(generator).eml_file(
+    return get_inner_provider(EmlFileProvider, generator).eml_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -558,7 +611,7 @@ def create_inner_epub_file(
     except ImportError as err:
         raise err
 
-    return EpubFileProvider(generator).epub_file(
+    return get_inner_provider(EpubFileProvider, generator).epub_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -616,7 +669,7 @@ def create_inner_file_from_path(
     except ImportError as err:
         raise err
 
-    return FileFromPathProvider(generator).file_from_path(
+    return get_inner_provider(FileFromPathProvider, generator).file_from_path(
         path,
         storage=storage,
         basename=basename,
@@ -681,7 +734,7 @@ def create_inner_generic_file(
     except ImportError as err:
         raise err
 
-    return GenericFileProvider(generator).generic_file(
+    return get_inner_provider(GenericFileProvider, generator).generic_file(
         content=content,
         extension=extension,
         storage=storage,
@@ -753,7 +806,7 @@ def create_inner_ico_file(
     except ImportError as err:
         raise err
 
-    return IcoFileProvider(generator).ico_file(
+    return get_inner_provider(IcoFileProvider, generator).ico_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -813,7 +866,9 @@ def create_inner_graphic_ico_file(
     except ImportError as err:
         raise err
 
-    return GraphicIcoFileProvider(generator).graphic_ico_file(
+    return get_inner_provider(
+        GraphicIcoFileProvider, generator
+    ).graphic_ico_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -883,7 +938,7 @@ def create_inner_jpeg_file(
     except ImportError as err:
         raise err
 
-    return JpegFileProvider(generator).jpeg_file(
+    return get_inner_provider(JpegFileProvider, generator).jpeg_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -943,7 +998,9 @@ def create_inner_graphic_jpeg_file(
     except ImportError as err:
         raise err
 
-    return GraphicJpegFileProvider(generator).graphic_jpeg_file(
+    return get_inner_provider(
+        GraphicJpegFileProvider, generator
+    ).graphic_jpeg_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -1016,7 +1073,7 @@ def create_inner_json_file(
     except ImportError as err:
         raise err
 
-    return JsonFileProvider(generator).json_file(
+    return get_inner_provider(JsonFileProvider, generator).json_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -1091,7 +1148,7 @@ def create_inner_mp3_file(
     except ImportError as err:
         raise err
 
-    return Mp3FileProvider(generator).mp3_file(
+    return get_inner_provider(Mp3FileProvider, generator).mp3_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -1163,7 +1220,7 @@ def create_inner_odp_file(
     except ImportError as err:
         raise err
 
-    return OdpFileProvider(generator).odp_file(
+    return get_inner_provider(OdpFileProvider, generator).odp_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -1234,7 +1291,7 @@ def create_inner_ods_file(
     except ImportError as err:
         raise err
 
-    return OdsFileProvider(generator).ods_file(
+    return get_inner_provider(OdsFileProvider, generator).ods_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -1305,7 +1362,7 @@ def create_inner_odt_file(
     except ImportError as err:
         raise err
 
-    return OdtFileProvider(generator).odt_file(
+    return get_inner_provider(OdtFileProvider, generator).odt_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -1382,7 +1439,7 @@ def create_inner_pdf_file(
     except ImportError as err:
         raise err
 
-    return PdfFileProvider(generator).pdf_file(
+    return get_inner_provider(PdfFileProvider, generator).pdf_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -1444,7 +1501,9 @@ def create_inner_graphic_pdf_file(
     except ImportError as err:
         raise err
 
-    return GraphicPdfFileProvider(generator).graphic_pdf_file(
+    return get_inner_provider(
+        GraphicPdfFileProvider, generator
+    ).graphic_pdf_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -1514,7 +1573,7 @@ def create_inner_png_file(
     except ImportError as err:
         raise err
 
-    return PngFileProvider(generator).png_file(
+    return get_inner_provider(PngFileProvider, generator).png_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -1574,7 +1633,9 @@ def create_inner_graphic_png_file(
     except ImportError as err:
         raise err
 
-    return GraphicPngFileProvider(generator).graphic_png_file(
+    return get_inner_provider(
+        GraphicPngFileProvider, generator
+    ).graphic_png_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -1644,7 +1705,7 @@ def create_inner_pptx_file(
     except ImportError as err:
         raise err
 
-    return PptxFileProvider(generator).pptx_file(
+    return get_inner_provider(PptxFileProvider, generator).pptx_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -1702,7 +1763,9 @@ def create_inner_random_file_from_dir(
     except ImportError as err:
         raise err
 
-    return RandomFileFromDirProvider(generator).random_file_from_dir(
+    return get_inner_provider(
+        RandomFileFromDirProvider, generator
+    ).random_file_from_dir(
         source_dir_path=source_dir_path,
         storage=storage,
         basename=basename,
@@ -1770,7 +1833,7 @@ def create_inner_rtf_file(
     except ImportError as err:
         raise err
 
-    return RtfFileProvider(generator).rtf_file(
+    return get_inner_provider(RtfFileProvider, generator).rtf_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -1841,7 +1904,7 @@ def create_inner_svg_file(
     except ImportError as err:
         raise err
 
-    return SvgFileProvider(generator).svg_file(
+    return get_inner_provider(SvgFileProvider, generator).svg_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -1899,7 +1962,7 @@ def create_inner_tar_file(
         from ..tar_file import TarFileProvider
     except ImportError as err:
         raise err
-    return TarFileProvider(generator).tar_file(
+    return get_inner_provider(TarFileProvider, generator).tar_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -1968,7 +2031,7 @@ def create_inner_txt_file(
     except ImportError as err:
         raise err
 
-    return TxtFileProvider(generator).txt_file(
+    return get_inner_provider(TxtFileProvider, generator).txt_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -2039,7 +2102,7 @@ def create_inner_webp_file(
     except ImportError as err:
         raise err
 
-    return WebpFileProvider(generator).webp_file(
+    return get_inner_provider(WebpFileProvider, generator).webp_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -2099,7 +2162,9 @@ def create_inner_graphic_webp_file(
     except ImportError as err:
         raise err
 
-    return GraphicWebpFileProvider(generator).graphic_webp_file(
+    return get_inner_provider(
+        GraphicWebpFileProvider, generator
+    ).graphic_webp_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -2169,7 +2234,7 @@ def create_inner_xlsx_file(
     except ImportError as err:
         raise err
 
-    return XlsxFileProvider(generator).xlsx_file(
+    return get_inner_provider(XlsxFileProvider, generator).xlsx_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -2249,7 +2314,7 @@ def create_inner_xml_file(
     except ImportError as err:
         raise err
 
-    return XmlFileProvider(generator).xml_file(
+    return get_inner_provider(XmlFileProvider, generator).xml_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -2307,7 +2372,7 @@ def create_inner_zip_file(
         from ..zip_file import ZipFileProvider
     except ImportError as err:
         raise err
-    return ZipFileProvider(generator).zip_file(
+    return get_inner_provider(ZipFileProvider, generator).zip_file(
         storage=storage,
         basename=basename,
         prefix=prefix,
@@ -2393,7 +2458,9 @@ def fuzzy_choice_create_inner_file(
             }
         )
     """
-    _func, _kwargs = choice(func_choices)
+    _func, _kwargs = random.choice(func_choices)
+    if kwargs.get("raw"):
+        _kwargs = {**_kwargs, "raw": True}
     return _func(**_kwargs)
 
 
@@ -2452,7 +2519,216 @@ def list_create_inner_file(
     in the `func_list` list of tuples.
     """
     created_files = []
-    for func, kwargs in func_list:
-        file = func(**kwargs)
+    for func, _kwargs in func_list:
+        if kwargs.get("raw"):
+            _kwargs = {**_kwargs, "raw": True}
+        file = func(**_kwargs)
         created_files.append(file)
     return created_files
+
+
+def read_inner_file(
+    file: Union[BytesValue, StringValue],
+    storage: BaseStorage,
+) -> Tuple[str, str, bytes]:
+    """Get the registry key, basename and binary content of an inner file.
+
+    Archive providers (ZIP, TAR, EML) call inner functions with `raw=True`,
+    so that inner files are added to the archive directly from memory. If a
+    (custom) inner function does not honour the `raw` argument and returns a
+    `StringValue` instead, the file is read from the given storage and
+    removed afterwards.
+
+    :param file: Value returned by the inner function.
+    :param storage: Storage the inner function was given.
+    :return: Tuple of (relative path, basename, binary content).
+    """
+    if isinstance(file, BytesValue):
+        _storage = file.data.get("storage", storage)
+        _filename = file.data["filename"]
+        return _storage.relpath(_filename), Path(_filename).name, file
+
+    # Legacy case: file has been written to the storage
+    _file_abs_path = storage.abspath(file)
+    with open(_file_abs_path, "rb") as _fp:
+        _content = _fp.read()
+    os.remove(_file_abs_path)  # Clean up temporary files
+    return str(file), Path(file).name, _content
+
+
+def inner_file_reference(
+    key: str,
+    file: Union[BytesValue, StringValue],
+) -> StringValue:
+    """Get a lightweight reference to an inner file.
+
+    Used by archive providers in stream mode, so that contents of inner
+    files are not held in memory for the lifetime of the archive value.
+
+    :param key: Relative path, as returned by `read_inner_file`.
+    :param file: Value returned by the inner function.
+    :return: `StringValue` of the given key, holding the metadata of
+        the inner file, except its content.
+    """
+    reference = StringValue(key)
+    reference.data = {k: v for k, v in file.data.items() if k != "content"}
+    return reference
+
+
+_WORKER_LOCAL = threading.local()
+
+
+def _get_provider_classes(
+    generator: Optional[Union[Faker, Generator, Provider]],
+) -> Tuple[Type[BaseProvider], ...]:
+    """Get classes of all providers of the generator, in order of adding.
+
+    :return: Provider classes (empty for generators without providers,
+        such as None).
+    """
+    _classes: List[Type[BaseProvider]] = []
+    for _factory in getattr(generator, "factories", None) or [generator]:
+        _get_providers = getattr(_factory, "get_providers", None)
+        if _get_providers is None:
+            continue
+        # Providers added last come first
+        for _provider in reversed(_get_providers()):
+            if type(_provider) not in _classes:
+                _classes.append(type(_provider))
+    return tuple(_classes)
+
+
+def _create_inner_file_in_worker(
+    create_inner_file_func: Callable,
+    create_inner_file_args: Dict[str, Any],
+    locale: Optional[Union[str, List[str]]],
+    seed: int,
+    provider_classes: Tuple[Type[BaseProvider], ...] = (),
+) -> Union[BytesValue, StringValue]:
+    """Create a single inner file within a worker thread or process.
+
+    Each worker keeps its own `Faker` instance, with the same providers
+    as the parent generator, which is re-seeded for every file. That makes
+    the output independent of which worker picked up which file.
+    """
+    _fakers = getattr(_WORKER_LOCAL, "fakers", None)
+    if _fakers is None:
+        _fakers = _WORKER_LOCAL.fakers = {}
+    _key = (
+        tuple(locale) if isinstance(locale, list) else locale,
+        provider_classes,
+    )
+    if _key not in _fakers:
+        _faker = Faker(locale)
+        _existing = set(_get_provider_classes(_faker))
+        for _provider_cls in provider_classes:
+            if _provider_cls not in _existing:
+                _faker.add_provider(_provider_cls)
+        _fakers[_key] = _faker
+    _faker = _fakers[_key]
+    _faker.seed_instance(seed)
+    return create_inner_file_func(
+        **{**create_inner_file_args, "generator": _faker}
+    )
+
+
+def create_inner_files(
+    create_inner_file_func: Callable,
+    create_inner_file_args: Dict[str, Any],
+    count: int,
+    storage: BaseStorage,
+    generator: Optional[Union[Faker, Generator, Provider]] = None,
+    workers: Optional[int] = None,
+    executor: Optional[Union[str, Executor]] = None,
+) -> Iterator[Union[BytesValue, StringValue]]:
+    """Create inner files for archive providers (ZIP, TAR and EML).
+
+    Inner files are always requested with `raw=True`. If
+    `create_inner_file_func` returns a list of values, `count`, `workers`
+    and `executor` are ignored.
+
+    If neither `workers` nor `executor` is given, files are created one
+    after another, using the given generator. Otherwise, calls are fanned
+    out to a thread or process pool. Every file then gets its own seed,
+    derived from the given generator, and files are yielded in submission
+    order, so that seeded archives stay reproducible. Workers use their
+    own `Faker` instances, with all providers of the given generator added
+    (by class).
+
+    :param create_inner_file_func: Inner function.
+    :param create_inner_file_args: Arguments for the inner function.
+    :param count: Number of files to create.
+    :param storage: Storage to pass to the inner function.
+    :param generator: Parent generator.
+    :param workers: Number of workers.
+    :param executor: Either "thread" (default), "process" or an existing
+        `concurrent.futures.Executor` instance. An executor instance is
+        not shut down afterwards. With "process" (or a process pool),
+        `create_inner_file_func`, its arguments and provider classes of
+        the generator shall be picklable (defined at module level).
+    :return: Iterator of created files.
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker import Faker
+        from faker_file.providers.helpers.inner import create_inner_docx_file
+        from faker_file.providers.zip_file import ZipFileProvider
+
+        FAKER = Faker()
+        FAKER.seed_instance(42)
+        FAKER.add_provider(ZipFileProvider)
+
+        file = FAKER.zip_file(
+            options={
+                "count": 50,
+                "create_inner_file_func": create_inner_docx_file,
+                "workers": 4,
+                "executor": "process",
+            }
+        )
+    """
+    _kwargs = {"generator": generator}
+    _kwargs.update(create_inner_file_args)
+    _kwargs["storage"] = storage
+    # Inner files are generated in memory and never hit the disk
+    _kwargs["raw"] = True
+
+    # If create_inner_file_func returns a list of values
+    if returns_list(create_inner_file_func):
+        yield from create_inner_file_func(**_kwargs)
+        return
+
+    # Sequential
+    if not workers and executor is None:
+        for __i in range(count):
+            yield create_inner_file_func(**_kwargs)
+        return
+
+    # Parallel
+    try:
+        _random = getattr(generator, "random", None) or random
+    except NotImplementedError:  # Faker in multiple locale mode
+        _random = generator[generator.locales[0]].random
+    _seeds = [_random.getrandbits(64) for __i in range(count)]
+    _locale = getattr(generator, "locales", None)
+    _provider_classes = _get_provider_classes(generator)
+    _worker_kwargs = {k: v for k, v in _kwargs.items() if k != "generator"}
+    _map_args = (
+        [create_inner_file_func] * count,
+        [_worker_kwargs] * count,
+        [_locale] * count,
+        _seeds,
+        [_provider_classes] * count,
+    )
+
+    if isinstance(executor, Executor):
+        yield from executor.map(_create_inner_file_in_worker, *_map_args)
+        return
+
+    _executor_cls = (
+        ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    )
+    with _executor_cls(max_workers=workers) as _executor:
+        yield from _executor.map(_create_inner_file_in_worker, *_map_args)
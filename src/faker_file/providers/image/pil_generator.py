@@ -12,6 +12,7 @@ from PIL import Image, ImageDraw, ImageFont
 from ...base import DynamicTemplate
 from ...constants import DEFAULT_FILE_ENCODING
 from ..base.image_generator import BaseImageGenerator
+from ..helpers.fonts import get_pil_font
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2022-2025 Artur Barseghyan"
@@ -266,7 +267,7 @@ class PilImageGenerator(BaseImageGenerator):
         else:
             self.img = self.create_image_instance()
             self.draw = ImageDraw.Draw(self.img)
-            font = ImageFont.truetype(self.font, self.font_size)
+            font = get_pil_font(self.font, self.font_size)
 
             # The `content_specs` is a dictionary that holds two keys:
             # `max_nb_chars` and `wrap_chars_after`. Those are the same values
@@ -217,7 +217,7 @@ class OdtFileProvider(BaseProvider, FileMixin):
                 raw_content.data = data
                 return raw_content
 
-            storage.write_bytes(filename, _fake_file.getvalue())
+            storage.write_file(filename, _fake_file)
 
         # Generic
         file_name = StringValue(storage.relpath(filename))
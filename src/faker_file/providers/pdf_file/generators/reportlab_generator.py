@@ -1,12 +1,18 @@
 import logging
+from functools import lru_cache
 from io import BytesIO
-from typing import Any, Dict, Union
+from threading import Lock
+from typing import Any, Dict, Tuple, Union
 
 from faker import Faker
 from faker.generator import Generator
 from faker.providers.python import Provider
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.styles import (
+    ParagraphStyle,
+    StyleSheet1,
+    getSampleStyleSheet,
+)
 from reportlab.lib.units import inch
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
@@ -19,10 +25,77 @@ from ...base.pdf_generator import BasePdfGenerator
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2022-2025 Artur Barseghyan"
 __license__ = "MIT"
-__all__ = ("ReportlabPdfGenerator",)
+__all__ = (
+    "ReportlabPdfGenerator",
+    "get_paragraph_style",
+    "get_stylesheet",
+    "register_font",
+)
 
 LOGGER = logging.getLogger(__name__)
 
+# Fonts registered by `register_font`: {font_name: (font_path, TTFont)}
+_REGISTERED_FONTS: Dict[str, Tuple[str, TTFont]] = {}
+_REGISTERED_FONTS_LOCK = Lock()
+
+
+def register_font(font_name: str, font_path: str) -> None:
+    """Register TTF font in reportlab, once per process.
+
+    Parsing a TTF file is costly, so the font is registered only if it
+    hasn't been registered yet by this function (with the same path), or
+    if it has been replaced in the reportlab font registry since.
+
+    :param font_name: Font name.
+    :param font_path: Path to the font file.
+    """
+    font_path = str(font_path)
+    with _REGISTERED_FONTS_LOCK:
+        registered = _REGISTERED_FONTS.get(font_name)
+        if registered and registered[0] == font_path:
+            try:
+                if pdfmetrics.getFont(font_name) is registered[1]:
+                    return
+            except Exception:
+                pass
+        font = TTFont(font_name, font_path)
+        pdfmetrics.registerFont(font)
+        _REGISTERED_FONTS[font_name] = (font_path, font)
+
+
+@lru_cache(maxsize=None)
+def get_stylesheet() -> StyleSheet1:
+    """Get (cached) reportlab sample stylesheet.
+
+    The stylesheet is shared. Do not modify it; use `get_paragraph_style`
+    to get styles with a custom font instead.
+    """
+    return getSampleStyleSheet()
+
+
+@lru_cache(maxsize=None)
+def get_paragraph_style(
+    font_name: str,
+    style_name: str = "Normal",
+    **kwargs,
+) -> ParagraphStyle:
+    """Get (cached) paragraph style based on the sample stylesheet.
+
+    The style is shared. Do not modify it.
+
+    :param font_name: Font name.
+    :param style_name: Name of the style in the sample stylesheet.
+    :param kwargs: Other style attributes (for instance, `fontSize`).
+        Values shall be hashable.
+    :return: Paragraph style.
+    """
+    return ParagraphStyle(
+        f"{style_name}-{font_name}",
+        parent=get_stylesheet()[style_name],
+        fontName=font_name,
+        **kwargs,
+    )
+
 
 class ReportlabPdfGenerator(BasePdfGenerator):
     """Reportlab PDF generator.
@@ -57,10 +130,7 @@ class ReportlabPdfGenerator(BasePdfGenerator):
         )
         from PIL import Image as PilImage
         from reportlab.lib.pagesizes import letter, landscape
-        from reportlab.lib.styles import getSampleStyleSheet
         from reportlab.lib import colors
-        from reportlab.pdfbase import pdfmetrics
-        from reportlab.pdfbase.ttfonts import TTFont
         from reportlab.platypus import (
             Image,
             Table,
@@ -155,11 +225,11 @@ class ReportlabPdfGenerator(BasePdfGenerator):
             provider, generator, story, data, counter, **kwargs
         ):
             # Insert a paragraph
-            styles = getSampleStyleSheet()
-            style_paragraph = styles["Normal"]
-            style_paragraph.fontName = generator.font_name
-            pdfmetrics.registerFont(
-                TTFont(generator.font_name, generator.font_path)
+            reportlab_generator.register_font(
+                generator.font_name, generator.font_path
+            )
+            style_paragraph = reportlab_generator.get_paragraph_style(
+                generator.font_name
             )
             content = provider.generator.text(max_nb_chars=5_000)
             paragraph = Paragraph(content, style_paragraph)
@@ -218,10 +288,8 @@ class ReportlabPdfGenerator(BasePdfGenerator):
         :param data:
         :param provider: `PdfFileProvider` instance.
         """
-        styles = getSampleStyleSheet()
-        style_paragraph = styles["Normal"]
-        style_paragraph.fontName = self.font_name
-        pdfmetrics.registerFont(TTFont(self.font_name, self.font_path))
+        register_font(self.font_name, self.font_path)
+        style_paragraph = get_paragraph_style(self.font_name)
 
         story = []
         buffer = BytesIO()
@@ -163,7 +163,7 @@ class PptxFileProvider(BaseProvider, FileMixin):
             raw_content.data = data
             return raw_content
 
-        storage.write_bytes(filename, stream.getvalue())
+        storage.write_file(filename, stream)
 
         # Generic
         file_name = StringValue(storage.relpath(filename))
@@ -1,14 +1,14 @@
-import os
 from pathlib import Path
-from random import choice
-from typing import Optional, Union, overload
+from typing import Dict, Optional, Union, overload
 
+from faker import Faker
 from faker.providers import BaseProvider
 
 from ..base import BytesValue, FileMixin, StringValue
 from ..registry import FILE_REGISTRY
 from ..storages.base import BaseStorage
 from ..storages.filesystem import FileSystemStorage
+from .helpers.dir_index import get_dir_index
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2022-2025 Artur Barseghyan"
@@ -54,6 +54,8 @@ class RandomFileFromDirProvider(BaseProvider, FileMixin):
         storage: Optional[BaseStorage] = None,
         basename: Optional[str] = None,
         prefix: Optional[str] = None,
+        recursive: bool = False,
+        weights: Optional[Union[str, Dict[str, float]]] = None,
         raw: bool = True,
         **kwargs,
     ) -> BytesValue: ...
@@ -65,6 +67,8 @@ class RandomFileFromDirProvider(BaseProvider, FileMixin):
         storage: Optional[BaseStorage] = None,
         basename: Optional[str] = None,
         prefix: Optional[str] = None,
+        recursive: bool = False,
+        weights: Optional[Union[str, Dict[str, float]]] = None,
         **kwargs,
     ) -> StringValue: ...
 
@@ -74,6 +78,8 @@ class RandomFileFromDirProvider(BaseProvider, FileMixin):
         storage: Optional[BaseStorage] = None,
         basename: Optional[str] = None,
         prefix: Optional[str] = None,
+        recursive: bool = False,
+        weights: Optional[Union[str, Dict[str, float]]] = None,
         raw: bool = False,
         **kwargs,
     ) -> Union[BytesValue, StringValue]:
@@ -83,6 +89,12 @@ class RandomFileFromDirProvider(BaseProvider, FileMixin):
         :param storage: Storage. Defaults to `FileSystemStorage`.
         :param basename: File basename (without extension).
         :param prefix: File name prefix.
+        :param recursive: If set to True, files of sub-directories are
+            considered as well.
+        :param weights: If not given, all files are equally likely to be
+            picked. If set to "size", files are weighted by their size. If a
+            dictionary is given (for instance, ``{"pdf": 3, "docx": 1}``),
+            files are weighted by extension.
         :param raw: If set to True, return `BytesValue` (binary content of
             the file). Otherwise, return `StringValue` (path to the saved
             file).
@@ -93,13 +105,14 @@ class RandomFileFromDirProvider(BaseProvider, FileMixin):
         if storage is None:
             storage = FileSystemStorage()
 
+        if self.generator is None:
+            self.generator = Faker()
+
         # Specific
-        source_file_choices = [
-            os.path.join(source_dir_path, _f)
-            for _f in os.listdir(source_dir_path)
-            if os.path.isfile(os.path.join(source_dir_path, _f))
-        ]
-        source_file_path = choice(source_file_choices)
+        source_file_path = get_dir_index(
+            source_dir_path,
+            recursive=recursive,
+        ).choice(weights=weights, rand=self.generator.random)
         source_file = Path(source_file_path)
 
         # Generic
@@ -111,13 +124,13 @@ class RandomFileFromDirProvider(BaseProvider, FileMixin):
         data = {"filename": filename, "storage": storage}
 
         # Specific
-        with open(source_file_path, "rb") as _file:
-            if raw:
+        if raw:
+            with open(source_file_path, "rb") as _file:
                 raw_content = BytesValue(_file.read())
-                raw_content.data = data
-                return raw_content
+            raw_content.data = data
+            return raw_content
 
-            storage.write_bytes(filename, _file.read())
+        storage.copy_file(filename, source_file_path)
 
         # Generic
         file_name = StringValue(storage.relpath(filename))
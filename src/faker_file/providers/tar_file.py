@@ -1,16 +1,22 @@
-import os
 import tarfile
+import time
+from contextlib import nullcontext
 from io import BytesIO
 from pathlib import Path
 from typing import Any, Dict, Optional, Union, overload
 
 from faker.providers import BaseProvider
 
-from ..base import BytesValue, FileMixin, StringValue, returns_list
+from ..base import BytesValue, FileMixin, StringValue
 from ..registry import FILE_REGISTRY
 from ..storages.base import BaseStorage
 from ..storages.filesystem import FileSystemStorage
-from .helpers.inner import create_inner_txt_file
+from .helpers.inner import (
+    create_inner_files,
+    create_inner_txt_file,
+    inner_file_reference,
+    read_inner_file,
+)
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2022-2025 Artur Barseghyan"
@@ -72,6 +78,44 @@ class TarFileProvider(BaseProvider, FileMixin):
             },
         )
 
+    Usage example of writing the archive directly to the storage, one
+    inner file at a time (memory usage is then bound by the size of the
+    largest inner file, rather than the size of the archive):
+
+    .. code-block:: python
+
+        file = FAKER.tar_file(
+            stream=True,
+            options={
+                "count": 500,
+                "create_inner_file_func": create_inner_docx_file,
+            },
+        )
+
+    Usage example of generating inner files in parallel (each inner file
+    gets its own seed, derived from ``FAKER``, so seeded runs are
+    reproducible; ``executor`` could be either ``"thread"`` (default),
+    ``"process"`` or a ``concurrent.futures.Executor`` instance):
+
+    .. code-block:: python
+
+        file = FAKER.tar_file(
+            options={
+                "count": 100,
+                "create_inner_file_func": create_inner_docx_file,
+                "workers": 4,
+                "executor": "process",
+            },
+        )
+
+    Worker generators are new ``Faker`` instances of the same locale, with
+    all providers of ``FAKER`` added (by class, thus custom providers,
+    used in ``content`` templates, keep working). With the ``"process"``
+    executor, ``create_inner_file_func``, its arguments and custom
+    provider classes are sent to other processes, thus shall be picklable
+    (defined at module level): lambdas and ``functools.partial`` objects
+    over local functions fail there.
+
     If you want to see, which files were included inside the TAR, check
     the ``file.data["files"]``.
     """
@@ -88,6 +132,7 @@ class TarFileProvider(BaseProvider, FileMixin):
         # Once Python 3.7 is deprecated, add the following annotation:
         #     Optional[Literal["gz", "bz2", "xz"]] = None
         compression: Optional[str] = None,
+        stream: bool = False,
         raw: bool = True,
         **kwargs,
     ) -> BytesValue: ...
@@ -102,6 +147,7 @@ class TarFileProvider(BaseProvider, FileMixin):
         # Once Python 3.7 is deprecated, add the following annotation:
         #     Optional[Literal["gz", "bz2", "xz"]] = None
         compression: Optional[str] = None,
+        stream: bool = False,
         **kwargs,
     ) -> StringValue: ...
 
@@ -114,6 +160,7 @@ class TarFileProvider(BaseProvider, FileMixin):
         # Once Python 3.7 is deprecated, add the following annotation:
         #     Optional[Literal["gz", "bz2", "xz"]] = None
         compression: Optional[str] = None,
+        stream: bool = False,
         raw: bool = False,
         **kwargs,
     ) -> Union[BytesValue, StringValue]:
@@ -125,6 +172,10 @@ class TarFileProvider(BaseProvider, FileMixin):
         :param options: Options (non-structured) for complex types, such as ZIP.
         :param compression: Desired compression. Can be None or `gz`, `bz2`
             or `xz`.
+        :param stream: If set to True, write the archive directly to the
+            storage, one inner file at a time, instead of building it in
+            memory first. Contents of inner files are then not kept in
+            ``data["inner"]``. Ignored if `raw` is set to True.
         :param raw: If set to True, return `BytesValue` (binary content of
             the file). Otherwise, return `StringValue` (path to the saved
             file).
@@ -174,6 +225,8 @@ class TarFileProvider(BaseProvider, FileMixin):
                 "create_inner_file_func", create_inner_txt_file
             )
             _create_inner_file_args = options.get("create_inner_file_args", {})
+            _workers = options.get("workers")
+            _executor = options.get("executor")
             _dir_path = Path("")
             _directory = options.get("directory", "")
 
@@ -182,55 +235,55 @@ class TarFileProvider(BaseProvider, FileMixin):
             _count = 5
             _create_inner_file_func = create_inner_txt_file
             _create_inner_file_args = {}
+            _workers = None
+            _executor = None
             _dir_path = Path("")
             _directory = ""
 
-        _tar_content = BytesIO()
-        _mode = "w"
+        _stream = stream and not raw
+        if _stream:
+            _output = storage.open_write(filename)
+            # Stream mode; does not require a seekable output
+            _mode = "w|"
+        else:
+            _output = nullcontext(BytesIO())
+            _mode = "w:"
         if compression and compression in COMPRESSION_OPTIONS:
-            _mode += f":{compression}"
-        with tarfile.open(fileobj=_tar_content, mode=_mode) as __fake_file:
-            _kwargs = {"generator": self.generator}
-            _kwargs.update(_create_inner_file_args)
-
-            # If _create_inner_file_func returns a list of values
-            if returns_list(_create_inner_file_func):
-                _files = _create_inner_file_func(
-                    storage=fs_storage,
-                    **_kwargs,
+            _mode += compression
+
+        with (
+            _output as _tar_content,
+            tarfile.open(fileobj=_tar_content, mode=_mode) as __fake_file,
+        ):
+            _files = create_inner_files(
+                create_inner_file_func=_create_inner_file_func,
+                create_inner_file_args=_create_inner_file_args,
+                count=_count,
+                storage=fs_storage,
+                generator=self.generator,
+                workers=_workers,
+                executor=_executor,
+            )
+
+            for __file in _files:
+                __key, __name, __content = read_inner_file(__file, fs_storage)
+                __arcname = Path(_directory) / __name
+                __tar_info = tarfile.TarInfo(name=str(__arcname))
+                __tar_info.size = len(__content)
+                __tar_info.mtime = int(time.time())
+                __fake_file.addfile(__tar_info, BytesIO(__content))
+                data["inner"][__key] = (
+                    inner_file_reference(__key, __file) if _stream else __file
                 )
-                for __file in _files:
-                    data["inner"][str(__file)] = __file
-                    __file_abs_path = fs_storage.abspath(__file)
-                    __fake_file.add(
-                        __file_abs_path,
-                        arcname=Path(_directory) / Path(__file).name,
-                    )
-                    os.remove(__file_abs_path)  # Clean up temporary files
-                    data["files"].append(Path(_directory) / Path(__file).name)
-
-            # If _create_inner_file_func returns a single value
-            else:
-                for __i in range(_count):
-                    __file = _create_inner_file_func(
-                        storage=fs_storage,
-                        **_kwargs,
-                    )
-                    data["inner"][str(__file)] = __file
-                    __file_abs_path = fs_storage.abspath(__file)
-                    __fake_file.add(
-                        __file_abs_path,
-                        arcname=Path(_directory) / Path(__file).name,
-                    )
-                    os.remove(__file_abs_path)  # Clean up temporary files
-                    data["files"].append(Path(_directory) / Path(__file).name)
+                data["files"].append(__arcname)
 
         if raw:
             raw_content = BytesValue(_tar_content.getvalue())
             raw_content.data = data
             return raw_content
 
-        storage.write_bytes(filename, _tar_content.getvalue())
+        if not _stream:
+            storage.write_file(filename, _tar_content)
 
         # Generic
         file_name = StringValue(storage.relpath(filename))
@@ -1,16 +1,21 @@
-import os
 import zipfile
+from contextlib import nullcontext
 from io import BytesIO
 from pathlib import Path
 from typing import Any, Dict, Optional, Union, overload
 
 from faker.providers import BaseProvider
 
-from ..base import BytesValue, FileMixin, StringValue, returns_list
+from ..base import BytesValue, FileMixin, StringValue
 from ..registry import FILE_REGISTRY
 from ..storages.base import BaseStorage
 from ..storages.filesystem import FileSystemStorage
-from .helpers.inner import create_inner_txt_file
+from .helpers.inner import (
+    create_inner_files,
+    create_inner_txt_file,
+    inner_file_reference,
+    read_inner_file,
+)
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2022-2025 Artur Barseghyan"
@@ -69,6 +74,44 @@ class ZipFileProvider(BaseProvider, FileMixin):
             },
         )
 
+    Usage example of writing the archive directly to the storage, one
+    inner file at a time (memory usage is then bound by the size of the
+    largest inner file, rather than the size of the archive):
+
+    .. code-block:: python
+
+        file = FAKER.zip_file(
+            stream=True,
+            options={
+                "count": 500,
+                "create_inner_file_func": create_inner_docx_file,
+            },
+        )
+
+    Usage example of generating inner files in parallel (each inner file
+    gets its own seed, derived from ``FAKER``, so seeded runs are
+    reproducible; ``executor`` could be either ``"thread"`` (default),
+    ``"process"`` or a ``concurrent.futures.Executor`` instance):
+
+    .. code-block:: python
+
+        file = FAKER.zip_file(
+            options={
+                "count": 100,
+                "create_inner_file_func": create_inner_docx_file,
+                "workers": 4,
+                "executor": "process",
+            },
+        )
+
+    Worker generators are new ``Faker`` instances of the same locale, with
+    all providers of ``FAKER`` added (by class, thus custom providers,
+    used in ``content`` templates, keep working). With the ``"process"``
+    executor, ``create_inner_file_func``, its arguments and custom
+    provider classes are sent to other processes, thus shall be picklable
+    (defined at module level): lambdas and ``functools.partial`` objects
+    over local functions fail there.
+
     If you want to see, which files were included inside the ZIP, check
     the ``file.data["files"]``.
     """
@@ -82,6 +125,7 @@ class ZipFileProvider(BaseProvider, FileMixin):
         basename: Optional[str] = None,
         prefix: Optional[str] = None,
         options: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
         raw: bool = True,
         **kwargs,
     ) -> BytesValue: ...
@@ -93,6 +137,7 @@ class ZipFileProvider(BaseProvider, FileMixin):
         basename: Optional[str] = None,
         prefix: Optional[str] = None,
         options: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
         **kwargs,
     ) -> Union[BytesValue, StringValue]: ...
 
@@ -102,6 +147,7 @@ class ZipFileProvider(BaseProvider, FileMixin):
         basename: Optional[str] = None,
         prefix: Optional[str] = None,
         options: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
         raw: bool = False,
         **kwargs,
     ) -> Union[BytesValue, StringValue]:
@@ -111,6 +157,10 @@ class ZipFileProvider(BaseProvider, FileMixin):
         :param basename: File basename (without extension).
         :param prefix: File name prefix.
         :param options: Options (non-structured) for complex types, such as ZIP.
+        :param stream: If set to True, write the archive directly to the
+            storage, one inner file at a time, instead of building it in
+            memory first. Contents of inner files are then not kept in
+            ``data["inner"]``. Ignored if `raw` is set to True.
         :param raw: If set to True, return `BytesValue` (binary content of
             the file). Otherwise, return `StringValue` (path to the saved
             file).
@@ -161,6 +211,8 @@ class ZipFileProvider(BaseProvider, FileMixin):
                 "create_inner_file_func", create_inner_txt_file
             )
             _create_inner_file_args = options.get("create_inner_file_args", {})
+            _workers = options.get("workers")
+            _executor = options.get("executor")
             _dir_path = Path("")
             _directory = options.get("directory", "")
 
@@ -169,52 +221,47 @@ class ZipFileProvider(BaseProvider, FileMixin):
             _count = 5
             _create_inner_file_func = create_inner_txt_file
             _create_inner_file_args = {}
+            _workers = None
+            _executor = None
             _dir_path = Path("")
             _directory = ""
 
-        _zip_content = BytesIO()
-        with zipfile.ZipFile(_zip_content, "w") as __fake_file:
-            _kwargs = {"generator": self.generator}
-            _kwargs.update(_create_inner_file_args)
+        _stream = stream and not raw
+        if _stream:
+            _output = storage.open_write(filename)
+        else:
+            _output = nullcontext(BytesIO())
+
+        with (
+            _output as _zip_content,
+            zipfile.ZipFile(_zip_content, "w") as __fake_file,
+        ):
+            _files = create_inner_files(
+                create_inner_file_func=_create_inner_file_func,
+                create_inner_file_args=_create_inner_file_args,
+                count=_count,
+                storage=fs_storage,
+                generator=self.generator,
+                workers=_workers,
+                executor=_executor,
+            )
 
-            # If _create_inner_file_func returns a list of values
-            if returns_list(_create_inner_file_func):
-                _files = _create_inner_file_func(
-                    storage=fs_storage,
-                    **_kwargs,
+            for __file in _files:
+                __key, __name, __content = read_inner_file(__file, fs_storage)
+                __arcname = Path(_directory) / __name
+                __fake_file.writestr(str(__arcname), __content)
+                data["inner"][__key] = (
+                    inner_file_reference(__key, __file) if _stream else __file
                 )
-                for __file in _files:
-                    data["inner"][str(__file)] = __file
-                    __file_abs_path = fs_storage.abspath(__file)
-                    __fake_file.write(
-                        __file_abs_path,
-                        arcname=Path(_directory) / Path(__file).name,
-                    )
-                    os.remove(__file_abs_path)  # Clean up temporary files
-                    data["files"].append(Path(_directory) / Path(__file).name)
-
-            # If _create_inner_file_func returns a single value
-            else:
-                for __i in range(_count):
-                    __file = _create_inner_file_func(
-                        storage=fs_storage,
-                        **_kwargs,
-                    )
-                    data["inner"][str(__file)] = __file
-                    __file_abs_path = fs_storage.abspath(__file)
-                    __fake_file.write(
-                        __file_abs_path,
-                        arcname=Path(_directory) / Path(__file).name,
-                    )
-                    os.remove(__file_abs_path)  # Clean up temporary files
-                    data["files"].append(Path(_directory) / Path(__file).name)
+                data["files"].append(__arcname)
 
         if raw:
             raw_content = BytesValue(_zip_content.getvalue())
             raw_content.data = data
             return raw_content
 
-        storage.write_bytes(filename, _zip_content.getvalue())
+        if not _stream:
+            storage.write_file(filename, _zip_content)
 
         # Generic
         file_name = StringValue(storage.relpath(filename))
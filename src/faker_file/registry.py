@@ -1,8 +1,12 @@
+import asyncio
+import inspect
 import logging
+from collections import OrderedDict
 from threading import Lock
-from typing import Optional, Set, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .base import StringValue
+from .storages.base import BaseStorage
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2022-2025 Artur Barseghyan"
@@ -15,6 +19,25 @@ __all__ = (
 
 LOGGER = logging.getLogger(__name__)
 
+# Metadata kept for registered files, unless `retain_content` is set
+LIGHTWEIGHT_DATA_KEYS = ("filename", "storage", "payload_size")
+
+
+def _get_payload_size(content: Any) -> int:
+    """Get size (in bytes) of the given content.
+
+    Text is measured UTF-8 encoded, binary content by its length.
+    """
+    if content is None:
+        return 0
+    if isinstance(content, str):
+        return len(content.encode("utf-8"))
+    if isinstance(content, memoryview):
+        return content.nbytes
+    if isinstance(content, (bytes, bytearray)):
+        return len(content)
+    return len(str(content).encode("utf-8"))
+
 
 class FileRegistry:
     """Stores list `StringValue` instances.
@@ -34,60 +57,277 @@ class FileRegistry:
 
         # The FileRegistry._registry would then contain this:
         {
-            txt_file_1,
-            txt_file_2,
+            txt_file_1: <lightweight copy of txt_file_1>,
+            txt_file_2: <lightweight copy of txt_file_2>,
             ...,
-            txt_file_n,
+            txt_file_n: <lightweight copy of txt_file_n>,
         }
+
+    By default, only the metadata required for removing the file
+    (`filename` and `storage`) and the size (in bytes) of its `content`
+    (`payload_size`) is kept. Set `retain_content` to True
+    to keep the `StringValue` instances as they are (with all the
+    `data`, such as `content`). The memory used by the registry could
+    be capped as follows:
+
+    .. code-block:: python
+
+        from faker_file.registry import FILE_REGISTRY
+
+        # Keep at most 10_000 entries. When exceeded, oldest entries are
+        # forgotten (but files are not deleted).
+        FILE_REGISTRY.max_entries = 10_000
+
+        # Keep the `data` of registered files, but no more than 64 MB of
+        # content. When exceeded, content of oldest entries is dropped.
+        FILE_REGISTRY.retain_content = True
+        FILE_REGISTRY.max_bytes = 64 * 1024 * 1024
     """
 
-    def __init__(self):
-        self._registry: Set[StringValue] = set()
+    def __init__(
+        self: "FileRegistry",
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        retain_content: bool = False,
+    ) -> None:
+        """
+        :param max_entries: Maximum number of entries. Oldest entries are
+            forgotten when exceeded.
+        :param max_bytes: Maximum size (in bytes) of retained content, as
+            recorded in the `payload_size` of entries. Only makes sense
+            when `retain_content` is set to True. Content of oldest entries
+            is dropped when exceeded.
+        :param retain_content: If set to True, registered `StringValue`
+            instances are kept as they are.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.retain_content = retain_content
+        self._registry: "OrderedDict[str, StringValue]" = OrderedDict()
+        self._content_sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._content_bytes = 0
         self._lock = Lock()
 
+    def _make_entry(
+        self: "FileRegistry",
+        string_value: StringValue,
+    ) -> StringValue:
+        """Make a lightweight copy of the given `StringValue`."""
+        entry = StringValue(string_value)
+        entry.data = {
+            key: string_value.data[key]
+            for key in LIGHTWEIGHT_DATA_KEYS
+            if key in string_value.data
+        }
+        return entry
+
+    def _pop(self: "FileRegistry", key: str) -> Optional[StringValue]:
+        """Remove entry by key. Shall be called with the lock held."""
+        self._content_bytes -= self._content_sizes.pop(key, 0)
+        return self._registry.pop(key, None)
+
+    def _evict(self: "FileRegistry") -> None:
+        """Apply limits. Shall be called with the lock held."""
+        if self.max_entries is not None:
+            while len(self._registry) > self.max_entries:
+                key = next(iter(self._registry))
+                self._pop(key)
+                LOGGER.debug(f"Registry limit reached, forgetting {key}")
+
+        if self.max_bytes is not None:
+            while self._content_bytes > self.max_bytes:
+                key, size = self._content_sizes.popitem(last=False)
+                self._content_bytes -= size
+                self._registry[key] = self._make_entry(self._registry[key])
+
     def add(self, string_value: StringValue) -> None:
+        key = str(string_value)
+        content = string_value.data.get("content")
+        string_value.data["payload_size"] = _get_payload_size(content)
         with self._lock:
-            self._registry.add(string_value)
+            self._pop(key)
+            if self.retain_content:
+                self._registry[key] = string_value
+                if content is not None:
+                    size = string_value.data["payload_size"]
+                    self._content_sizes[key] = size
+                    self._content_bytes += size
+            else:
+                self._registry[key] = self._make_entry(string_value)
+            self._evict()
 
     def remove(self, string_value: Union[StringValue, str]) -> bool:
-        if not isinstance(string_value, StringValue):
-            string_value = self.search(string_value)
-
-        if not string_value:
-            return False
+        """Remove the file and forget it.
 
+        Files of async storages without `sync_storage` are not removed
+        (and stay in the registry, for `aclean_up`).
+        """
+        key = str(string_value)
         with self._lock:
-            # No error if the element doesn't exist
-            self._registry.discard(string_value)
-            try:
-                string_value.data["storage"].unlink(
-                    string_value.data["filename"]
-                )
-                return True
-            except Exception as e:
-                LOGGER.error(
-                    f"Failed to unlink file "
-                    f"{string_value.data['filename']}: {e}"
-                )
+            entry = self._registry.get(key)
+            if not isinstance(string_value, StringValue):
+                string_value = entry
+            if not string_value:
+                return False
+            storage = self._get_sync_storage(string_value.data["storage"])
+            if storage is not None:
+                self._pop(key)
+
+        if storage is None:
+            LOGGER.warning(
+                f"Storage of {string_value} is async, use "
+                f"`await storage.unlink(filename)` or "
+                f"`await FILE_REGISTRY.aclean_up()` instead"
+            )
             return False
 
+        try:
+            storage.unlink(string_value.data["filename"])
+            return True
+        except Exception as e:
+            LOGGER.error(
+                f"Failed to unlink file {string_value.data['filename']}: {e}"
+            )
+        return False
+
     def search(self, value: str) -> Optional[StringValue]:
         with self._lock:
-            for string_value in self._registry:
-                if string_value == value:
-                    return string_value
-        return None
+            return self._registry.get(str(value))
+
+    @staticmethod
+    def _get_sync_storage(storage: Any) -> Optional[BaseStorage]:
+        """Get synchronous equivalent of the storage (if any).
+
+        For async storages, that's their `sync_storage` (None, if not
+        set).
+        """
+        if inspect.iscoroutinefunction(getattr(storage, "unlink", None)):
+            return getattr(storage, "sync_storage", None)
+        return storage
+
+    @staticmethod
+    def _unlink_many(
+        storage: BaseStorage,
+        filenames: List[Any],
+    ) -> List[Tuple[Any, Exception]]:
+        """Delete files of the storage, logging failures."""
+        try:
+            errors = storage.unlink_many(filenames)
+        except Exception as err:
+            errors = [(filename, err) for filename in filenames]
+        for filename, err in errors:
+            LOGGER.error(f"Failed to unlink file {filename}: {err}")
+        return errors
+
+    def _pop_all(
+        self,
+        sync_only: bool = False,
+    ) -> Dict[int, Tuple[Any, List[Any]]]:
+        """Remove all entries and group their filenames by storage.
+
+        :param sync_only: If set to True, entries of async storages without
+            `sync_storage` are left in the registry.
+        """
+        with self._lock:
+            if sync_only:
+                files = [
+                    self._pop(key)
+                    for key, file in list(self._registry.items())
+                    if self._get_sync_storage(file.data["storage"]) is not None
+                ]
+            else:
+                files = list(self._registry.values())
+                self._registry.clear()
+                self._content_sizes.clear()
+                self._content_bytes = 0
+
+        storages: Dict[int, Tuple[Any, List[Any]]] = {}
+        for file in files:
+            storage = file.data["storage"]
+            storages.setdefault(id(storage), (storage, []))[1].append(
+                file.data["filename"]
+            )
+        return storages
+
+    def clean_up(self) -> Dict[str, int]:
+        """Delete all registered files.
+
+        Files are grouped by storage and deleted with its `unlink_many`
+        method, which uses bulk deletion where the storage supports it
+        (for instance, AWS S3 or Google Cloud Storage), or a bounded
+        thread pool otherwise.
+
+        Files of async storages are deleted with their `sync_storage`.
+        If there's none, files are counted as failed, but stay in the
+        registry, thus could still be deleted with `aclean_up`.
+
+        :return: Summary, such as ``{"succeeded": 98, "failed": 2}``.
+        """
+        succeeded = failed = 0
+        for storage, filenames in self._pop_all(sync_only=True).values():
+            errors = self._unlink_many(
+                self._get_sync_storage(storage), filenames
+            )
+            succeeded += len(filenames) - len(errors)
+            failed += len(errors)
 
-    def clean_up(self) -> None:
         with self._lock:
-            while self._registry:
-                file = self._registry.pop()
-                try:
-                    file.data["storage"].unlink(file.data["filename"])
-                except Exception as err:
-                    LOGGER.error(
-                        f"Failed to unlink file {file.data['filename']}: {err}"
-                    )
+            # Left in the registry by `_pop_all`
+            kept = sum(
+                self._get_sync_storage(file.data["storage"]) is None
+                for file in self._registry.values()
+            )
+        if kept:
+            LOGGER.error(
+                f"Failed to unlink {kept} file(s) of async storages, use "
+                f"`FILE_REGISTRY.aclean_up()`"
+            )
+            failed += kept
+
+        return {"succeeded": succeeded, "failed": failed}
+
+    async def aclean_up(self) -> Dict[str, int]:
+        """Delete all registered files (async version of `clean_up`).
+
+        Files of async storages are deleted with their `unlink_many`
+        coroutine, all other files in a worker thread. Storages are
+        processed concurrently.
+
+        .. code-block:: python
+
+            from faker_file.registry import FILE_REGISTRY
+
+            await FILE_REGISTRY.aclean_up()
+
+        :return: Summary, such as ``{"succeeded": 98, "failed": 2}``.
+        """
+
+        async def _unlink_many(
+            storage: Any,
+            filenames: List[Any],
+        ) -> List[Tuple[Any, Exception]]:
+            if self._get_sync_storage(storage) is storage:
+                return await asyncio.to_thread(
+                    self._unlink_many, storage, filenames
+                )
+            try:
+                errors = await storage.unlink_many(filenames)
+            except Exception as err:
+                errors = [(filename, err) for filename in filenames]
+            for filename, err in errors:
+                LOGGER.error(f"Failed to unlink file {filename}: {err}")
+            return errors
+
+        storages = list(self._pop_all().values())
+        results = await asyncio.gather(
+            *(
+                _unlink_many(storage, filenames)
+                for storage, filenames in storages
+            )
+        )
+        total = sum(len(filenames) for _, filenames in storages)
+        failed = sum(len(errors) for errors in results)
+        return {"succeeded": total - failed, "failed": failed}
 
 
 FILE_REGISTRY = FileRegistry()
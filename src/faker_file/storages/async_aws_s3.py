@@ -0,0 +1,228 @@
+import asyncio
+import posixpath
+from contextlib import AsyncExitStack
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from aiobotocore.session import get_session
+from botocore.exceptions import ClientError
+
+from ..base import DEFAULT_REL_PATH
+from .async_base import AsyncBaseStorage
+
+__author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
+__copyright__ = "2022-2025 Artur Barseghyan"
+__license__ = "MIT"
+__all__ = ("AsyncAWSS3Storage",)
+
+# Same as for the `pathy` based storages
+DEFAULT_ROOT_PATH = "tmp"
+# Maximum number of keys per `DeleteObjects` request
+DELETE_OBJECTS_MAX_KEYS = 1_000
+
+
+class AsyncAWSS3Storage(AsyncBaseStorage):
+    """Async AWS S3 Storage, based on `aiobotocore`.
+
+    Filenames are object keys (`root_path/rel_path/basename.extension`).
+    The client is created on first use and kept open until `close` is
+    called.
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker_file.storages.async_aws_s3 import AsyncAWSS3Storage
+
+        async with AsyncAWSS3Storage(
+            bucket_name="artur-testing-1",
+            rel_path="tmp",
+        ) as s3_storage:
+            file = s3_storage.generate_filename(
+                prefix="zzz_", extension="docx"
+            )
+            await s3_storage.write_text(file, "Lorem ipsum")
+            await s3_storage.write_bytes(file, b"Lorem ipsum")
+    """
+
+    def __init__(
+        self: "AsyncAWSS3Storage",
+        bucket_name: str,
+        root_path: Optional[str] = DEFAULT_ROOT_PATH,
+        rel_path: Optional[str] = DEFAULT_REL_PATH,
+        credentials: Optional[Dict[str, Any]] = None,
+        *args,
+        **kwargs,
+    ) -> None:
+        """
+        :param bucket_name: Bucket name.
+        :param root_path: Path of your files root directory.
+        :param rel_path: Relative path (from root directory).
+        :param credentials: Client params, such as `key_id`,
+            `key_secret`, `region_name` or `endpoint_url`.
+        """
+        self.bucket_name = bucket_name
+        self.root_path = root_path or ""
+        self.rel_path = rel_path or ""
+        self.credentials = dict(credentials or {})
+        self._client = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._lock: Optional[asyncio.Lock] = None
+        super().__init__(*args, **kwargs)
+
+    def _client_kwargs(self: "AsyncAWSS3Storage") -> Dict[str, Any]:
+        """Map `credentials` to `create_client` keyword arguments."""
+        client_kwargs = dict(self.credentials)
+        if "key_id" in client_kwargs:
+            client_kwargs["aws_access_key_id"] = client_kwargs.pop("key_id")
+        if "key_secret" in client_kwargs:
+            client_kwargs["aws_secret_access_key"] = client_kwargs.pop(
+                "key_secret"
+            )
+        return client_kwargs
+
+    async def get_client(self: "AsyncAWSS3Storage"):
+        """Get S3 client, creating it if needed."""
+        if self._client is not None:
+            return self._client
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self._client is None:
+                exit_stack = AsyncExitStack()
+                self._client = await exit_stack.enter_async_context(
+                    get_session().create_client("s3", **self._client_kwargs())
+                )
+                self._exit_stack = exit_stack
+        return self._client
+
+    def _get_key(self: "AsyncAWSS3Storage", filename: str) -> str:
+        """Get object key of the file.
+
+        Same as for `AWSS3Storage`, the path is relative to the root
+        directory, unless it's a full `s3://` URI.
+        """
+        prefix = f"s3://{self.bucket_name}/"
+        if filename.startswith(prefix):
+            return filename[len(prefix) :]
+        if self.root_path and not filename.startswith(f"{self.root_path}/"):
+            return posixpath.join(self.root_path, filename)
+        return filename
+
+    def generate_filename(
+        self: "AsyncAWSS3Storage",
+        extension: str,
+        prefix: Optional[str] = None,
+        basename: Optional[str] = None,
+    ) -> str:
+        """Generate filename."""
+        if not extension:
+            raise Exception("Extension shall be given!")
+
+        if not basename:
+            basename = self.generate_basename(prefix)
+
+        return posixpath.join(
+            self.root_path, self.rel_path, f"{basename}.{extension}"
+        )
+
+    async def write_text(
+        self: "AsyncAWSS3Storage",
+        filename: str,
+        data: str,
+        encoding: Optional[str] = None,
+    ) -> int:
+        """Write text."""
+        return await self.write_bytes(
+            filename, data.encode(encoding or "utf-8")
+        )
+
+    async def write_bytes(
+        self: "AsyncAWSS3Storage",
+        filename: str,
+        data: bytes,
+    ) -> int:
+        """Write bytes."""
+        client = await self.get_client()
+        await client.put_object(
+            Bucket=self.bucket_name,
+            Key=self._get_key(filename),
+            Body=data,
+        )
+        return len(data)
+
+    async def exists(self: "AsyncAWSS3Storage", filename: str) -> bool:
+        """Check if file exists."""
+        client = await self.get_client()
+        try:
+            await client.head_object(
+                Bucket=self.bucket_name,
+                Key=self._get_key(filename),
+            )
+        except ClientError as err:
+            if err.response.get("Error", {}).get("Code") in (
+                "404",
+                "NoSuchKey",
+            ):
+                return False
+            raise
+        return True
+
+    def relpath(self: "AsyncAWSS3Storage", filename: str) -> str:
+        """Return relative path."""
+        return posixpath.relpath(self._get_key(filename), self.root_path or ".")
+
+    def abspath(self: "AsyncAWSS3Storage", filename: str) -> str:
+        """Return absolute path."""
+        return f"s3://{self.bucket_name}/{self._get_key(filename)}"
+
+    async def unlink(self: "AsyncAWSS3Storage", filename: str) -> None:
+        """Delete the file."""
+        client = await self.get_client()
+        await client.delete_object(
+            Bucket=self.bucket_name,
+            Key=self._get_key(filename),
+        )
+
+    async def unlink_many(
+        self: "AsyncAWSS3Storage",
+        filenames: Iterable[str],
+    ) -> List[Tuple[str, Exception]]:
+        """Delete multiple files using `DeleteObjects` requests."""
+        client = await self.get_client()
+        files = [(self._get_key(filename), filename) for filename in filenames]
+
+        async def _delete(chunk: Dict[str, str]) -> List[Tuple[str, Exception]]:
+            try:
+                response = await client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={
+                        "Objects": [{"Key": key} for key in chunk],
+                        "Quiet": True,
+                    },
+                )
+            except Exception as err:
+                return [(_file, err) for _file in chunk.values()]
+            return [
+                (
+                    chunk[error["Key"]],
+                    Exception(f"{error['Code']}: {error['Message']}"),
+                )
+                for error in response.get("Errors", [])
+            ]
+
+        results = await asyncio.gather(
+            *(
+                _delete(dict(files[i : i + DELETE_OBJECTS_MAX_KEYS]))
+                for i in range(0, len(files), DELETE_OBJECTS_MAX_KEYS)
+            )
+        )
+        return [failed for result in results for failed in result]
+
+    async def close(self: "AsyncAWSS3Storage") -> None:
+        """Close the client."""
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+            self._exit_stack = None
+            self._client = None
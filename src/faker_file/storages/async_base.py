@@ -0,0 +1,211 @@
+import asyncio
+from typing import Any, Iterable, List, Optional, Tuple
+
+from .base import BaseStorage
+from .naming import BaseNameStrategy
+
+__author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
+__copyright__ = "2022-2025 Artur Barseghyan"
+__license__ = "MIT"
+__all__ = (
+    "AsyncBaseStorage",
+    "AsyncStorageAdapter",
+)
+
+
+class AsyncBaseStorage:
+    """Base async storage.
+
+    Mirrors `BaseStorage`, but methods doing I/O are coroutines.
+    `generate_filename`, `relpath` and `abspath` stay synchronous.
+    """
+
+    # Maximum number of concurrent deletions in `unlink_many`
+    unlink_many_concurrency: int = 32
+    # Synchronous equivalent of the storage, if any. Used by
+    # `FILE_REGISTRY.clean_up` outside the event loop.
+    sync_storage: Optional[BaseStorage] = None
+    name_strategy: Optional[BaseNameStrategy] = None
+
+    def __init__(
+        self,
+        *args,
+        name_strategy: Optional[BaseNameStrategy] = None,
+        **kwargs,
+    ) -> None:
+        """
+        :param name_strategy: File name strategy, such as
+            `ULIDNameStrategy` or `CounterNameStrategy`.
+        """
+        self.args = args
+        self.kwargs = kwargs
+        if name_strategy is not None:
+            self.name_strategy = name_strategy
+
+    generate_basename = BaseStorage.generate_basename
+
+    def generate_filename(
+        self: "AsyncBaseStorage",
+        extension: str,
+        prefix: Optional[str] = None,
+        basename: Optional[str] = None,
+    ) -> Any:
+        """Generate filename."""
+        raise NotImplementedError(
+            "Method generate_filename is not implemented!"
+        )
+
+    async def write_text(
+        self: "AsyncBaseStorage",
+        filename: Any,
+        data: str,
+        encoding: Optional[str] = None,
+    ) -> int:
+        """Write text."""
+        raise NotImplementedError("Method write_text is not implemented!")
+
+    async def write_bytes(
+        self: "AsyncBaseStorage",
+        filename: Any,
+        data: bytes,
+    ) -> int:
+        """Write bytes."""
+        raise NotImplementedError("Method write_bytes is not implemented!")
+
+    async def exists(self: "AsyncBaseStorage", filename: Any) -> bool:
+        """Check if file exists."""
+        raise NotImplementedError("Method exists is not implemented!")
+
+    def relpath(self: "AsyncBaseStorage", filename: Any) -> str:
+        """Return relative path."""
+        raise NotImplementedError("Method relpath is not implemented!")
+
+    def abspath(self: "AsyncBaseStorage", filename: Any) -> str:
+        """Return absolute path."""
+        raise NotImplementedError("Method abspath is not implemented!")
+
+    async def unlink(self: "AsyncBaseStorage", filename: Any) -> None:
+        """Delete the file."""
+        raise NotImplementedError("Method unlink is not implemented!")
+
+    async def unlink_many(
+        self: "AsyncBaseStorage",
+        filenames: Iterable[Any],
+    ) -> List[Tuple[Any, Exception]]:
+        """Delete multiple files concurrently.
+
+        :param filenames: Files to delete.
+        :return: List of (filename, error) tuples of files that could not
+            be deleted.
+        """
+        semaphore = asyncio.Semaphore(self.unlink_many_concurrency)
+
+        async def _unlink(filename: Any) -> Optional[Tuple[Any, Exception]]:
+            async with semaphore:
+                try:
+                    await self.unlink(filename)
+                except Exception as err:
+                    return filename, err
+            return None
+
+        results = await asyncio.gather(*map(_unlink, filenames))
+        return [result for result in results if result]
+
+    async def close(self: "AsyncBaseStorage") -> None:
+        """Close connections (if any)."""
+
+    async def __aenter__(self: "AsyncBaseStorage") -> "AsyncBaseStorage":
+        return self
+
+    async def __aexit__(self: "AsyncBaseStorage", *exc_info) -> None:
+        await self.close()
+
+
+class AsyncStorageAdapter(AsyncBaseStorage):
+    """Async adapter for any (synchronous) storage.
+
+    Blocking calls are run in the default thread pool executor of the
+    event loop.
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker_file.storages.async_base import AsyncStorageAdapter
+        from faker_file.storages.aws_s3 import AWSS3Storage
+
+        STORAGE = AsyncStorageAdapter(
+            AWSS3Storage(bucket_name="artur-testing-1")
+        )
+    """
+
+    def __init__(
+        self: "AsyncStorageAdapter",
+        storage: BaseStorage,
+        *args,
+        **kwargs,
+    ) -> None:
+        """
+        :param storage: Storage to adapt.
+        """
+        self.sync_storage = storage
+        super().__init__(*args, **kwargs)
+
+    def generate_filename(
+        self: "AsyncStorageAdapter",
+        extension: str,
+        prefix: Optional[str] = None,
+        basename: Optional[str] = None,
+    ) -> Any:
+        """Generate filename."""
+        return self.sync_storage.generate_filename(
+            extension=extension,
+            prefix=prefix,
+            basename=basename,
+        )
+
+    async def write_text(
+        self: "AsyncStorageAdapter",
+        filename: Any,
+        data: str,
+        encoding: Optional[str] = None,
+    ) -> int:
+        """Write text."""
+        return await asyncio.to_thread(
+            self.sync_storage.write_text, filename, data, encoding
+        )
+
+    async def write_bytes(
+        self: "AsyncStorageAdapter",
+        filename: Any,
+        data: bytes,
+    ) -> int:
+        """Write bytes."""
+        return await asyncio.to_thread(
+            self.sync_storage.write_bytes, filename, data
+        )
+
+    async def exists(self: "AsyncStorageAdapter", filename: Any) -> bool:
+        """Check if file exists."""
+        return await asyncio.to_thread(self.sync_storage.exists, filename)
+
+    def relpath(self: "AsyncStorageAdapter", filename: Any) -> str:
+        """Return relative path."""
+        return self.sync_storage.relpath(filename)
+
+    def abspath(self: "AsyncStorageAdapter", filename: Any) -> str:
+        """Return absolute path."""
+        return self.sync_storage.abspath(filename)
+
+    async def unlink(self: "AsyncStorageAdapter", filename: Any) -> None:
+        """Delete the file."""
+        await asyncio.to_thread(self.sync_storage.unlink, filename)
+
+    async def unlink_many(
+        self: "AsyncStorageAdapter",
+        filenames: Iterable[Any],
+    ) -> List[Tuple[Any, Exception]]:
+        """Delete multiple files (using bulk deletion, if supported)."""
+        return await asyncio.to_thread(
+            self.sync_storage.unlink_many, list(filenames)
+        )
@@ -0,0 +1,52 @@
+import tempfile
+from typing import Optional
+
+from ..base import DEFAULT_REL_PATH
+from .async_base import AsyncStorageAdapter
+from .filesystem import FileSystemStorage
+
+__author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
+__copyright__ = "2022-2025 Artur Barseghyan"
+__license__ = "MIT"
+__all__ = ("AsyncFileSystemStorage",)
+
+
+class AsyncFileSystemStorage(AsyncStorageAdapter):
+    """Async file storage.
+
+    File operations are run in the default thread pool executor of the
+    event loop.
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker_file.storages.async_filesystem import (
+            AsyncFileSystemStorage,
+        )
+
+        storage = AsyncFileSystemStorage()
+        file = storage.generate_filename(prefix="zzz_", extension="docx")
+        await storage.write_text(file, "Lorem ipsum")
+        await storage.write_bytes(file, b"Lorem ipsum")
+    """
+
+    def __init__(
+        self: "AsyncFileSystemStorage",
+        root_path: Optional[str] = tempfile.gettempdir(),
+        rel_path: Optional[str] = DEFAULT_REL_PATH,
+        *args,
+        **kwargs,
+    ) -> None:
+        """
+        :param root_path: Path of your files root directory.
+        :param rel_path: Relative path (from root directory).
+
+        Other arguments (such as `shard_depth` or `name_strategy`) are
+        passed to `FileSystemStorage`.
+        """
+        super().__init__(
+            FileSystemStorage(root_path, rel_path, *args, **kwargs)
+        )
+        self.root_path = self.sync_storage.root_path
+        self.rel_path = self.sync_storage.rel_path
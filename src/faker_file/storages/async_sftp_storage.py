@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import os
+from typing import Optional
+
+import asyncssh
+
+from .async_base import AsyncBaseStorage
+
+__author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
+__copyright__ = "2022-2025 Artur Barseghyan"
+__license__ = "MIT"
+__all__ = ("AsyncSFTPStorage",)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncSFTPStorage(AsyncBaseStorage):
+    """Async SFTP storage, based on `asyncssh`.
+
+    The connection is opened on first use. All requests share one SFTP
+    session, which handles many concurrent requests.
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker import Faker
+        from faker_file.providers.txt_file import TxtFileProvider
+        from faker_file.storages.async_sftp_storage import AsyncSFTPStorage
+
+        FAKER = Faker()
+        FAKER.add_provider(TxtFileProvider)
+
+        STORAGE = AsyncSFTPStorage(
+            host="0.0.0.0",
+            username="foo",
+            password="pass",
+            root_path="/upload",
+        )
+
+        txt_file = await FAKER.atxt_file(storage=STORAGE)
+
+        await STORAGE.close()
+    """
+
+    def __init__(
+        self: "AsyncSFTPStorage",
+        host: str,
+        port: int = 22,
+        username: str = "",
+        password: Optional[str] = None,
+        key: Optional[asyncssh.SSHKey] = None,
+        root_path: str = "",
+        rel_path: str = "",
+        *args,
+        **kwargs,
+    ) -> None:
+        """
+        :param host: The hostname of the SFTP server.
+        :param port: The port of the SFTP server.
+        :param username: The username to authenticate as.
+        :param password: The password to use when connecting.
+        :param key: The private key to use when connecting.
+        :param root_path: Path of your files root directory.
+        :param rel_path: Relative path (from root directory).
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.key = key
+        self.root_path = root_path
+        self.rel_path = rel_path
+        self._connection: Optional[asyncssh.SSHClientConnection] = None
+        self._sftp: Optional[asyncssh.SFTPClient] = None
+        self._lock: Optional[asyncio.Lock] = None
+        super().__init__(*args, **kwargs)
+
+    async def get_sftp(self: "AsyncSFTPStorage") -> asyncssh.SFTPClient:
+        """Get SFTP client, connecting (or reconnecting) if needed."""
+        if self._sftp is not None and not self._connection.is_closed():
+            return self._sftp
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self._sftp is None or self._connection.is_closed():
+                try:
+                    self._connection = await asyncssh.connect(
+                        self.host,
+                        port=self.port,
+                        username=self.username,
+                        password=self.password,
+                        client_keys=[self.key] if self.key else None,
+                        known_hosts=None,
+                    )
+                    self._sftp = await self._connection.start_sftp_client()
+                except Exception as e:
+                    LOGGER.exception(f"Failed to connect to SFTP server: {e}")
+                    raise
+        return self._sftp
+
+    def _build_path(self: "AsyncSFTPStorage", filename: str) -> str:
+        """Build the full path for a file."""
+        return os.path.join(self.root_path, self.rel_path, filename)
+
+    def generate_filename(
+        self: "AsyncSFTPStorage",
+        extension: str,
+        prefix: Optional[str] = None,
+        basename: Optional[str] = None,
+    ) -> str:
+        """Generate filename."""
+        if not extension:
+            LOGGER.error("File extension is required")
+            raise ValueError("Extension shall be given!")
+
+        if not basename:
+            basename = self.generate_basename(prefix)
+
+        return self._build_path(f"{basename}.{extension}")
+
+    async def write_text(
+        self: "AsyncSFTPStorage",
+        filename: str,
+        data: str,
+        encoding: Optional[str] = "utf-8",
+    ) -> int:
+        """Write text."""
+        try:
+            return await self.write_bytes(filename, data.encode(encoding))
+        except Exception as err:
+            LOGGER.exception(f"Failed to write text to {filename}: {err}")
+            return -1
+
+    async def write_bytes(
+        self: "AsyncSFTPStorage",
+        filename: str,
+        data: bytes,
+    ) -> int:
+        """Write bytes."""
+        try:
+            sftp = await self.get_sftp()
+            async with sftp.open(self._build_path(filename), "wb") as file:
+                await file.write(data)
+            return 0
+        except Exception as err:
+            LOGGER.exception(f"Failed to write bytes to {filename}: {err}")
+            return -1
+
+    async def exists(self: "AsyncSFTPStorage", filename: str) -> bool:
+        """Check if file exists."""
+        sftp = await self.get_sftp()
+        return await sftp.exists(self._build_path(filename))
+
+    def relpath(self: "AsyncSFTPStorage", filename: str) -> str:
+        """Return relative path."""
+        return os.path.relpath(self._build_path(filename), self.root_path)
+
+    def abspath(self: "AsyncSFTPStorage", filename: str) -> str:
+        """Return absolute path."""
+        return self._build_path(filename)
+
+    async def unlink(self: "AsyncSFTPStorage", filename: str) -> None:
+        """Remove a file."""
+        sftp = await self.get_sftp()
+        await sftp.remove(self._build_path(filename))
+
+    async def close(self: "AsyncSFTPStorage") -> None:
+        """Close the connection."""
+        if self._sftp is not None:
+            self._sftp.exit()
+            self._sftp = None
+        if self._connection is not None:
+            self._connection.close()
+            await self._connection.wait_closed()
+            self._connection = None
@@ -1,28 +1,76 @@
+import os
 import random
 import string
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from io import BytesIO
+from typing import (
+    Any,
+    BinaryIO,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .naming import BaseNameStrategy
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2022-2025 Artur Barseghyan"
 __license__ = "MIT"
 __all__ = ("BaseStorage",)
 
+# Chunk size used when copying files
+COPY_CHUNK_SIZE = 1024 * 1024
+
 
 class BaseStorage:
-    """Base storage."""
+    """Base storage.
+
+    File names are generated by the `name_strategy` (see
+    `faker_file.storages.naming`), if given. Otherwise, names are random
+    (using the global `random` module), without uniqueness guarantee.
+    """
+
+    # Maximum number of threads used by `unlink_many`
+    unlink_many_workers: int = 8
+    # Whether `copy_file` accepts file names of the storage itself as source
+    # and copies without passing the data through Python
+    native_copy: bool = False
+    # Whether `write_bytes` accepts any bytes-like object (such as
+    # `memoryview`), rather than `bytes` only
+    accepts_memoryview: bool = False
+    name_strategy: Optional[BaseNameStrategy] = None
 
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(
+        self,
+        *args,
+        name_strategy: Optional[BaseNameStrategy] = None,
+        **kwargs,
+    ) -> None:
+        """
+        :param name_strategy: File name strategy, such as
+            `ULIDNameStrategy` or `CounterNameStrategy`.
+        """
         self.args = args
         self.kwargs = kwargs
+        if name_strategy is not None:
+            self.name_strategy = name_strategy
 
     def generate_basename(
         self: "BaseStorage",
         prefix: str = "tmp",
         length: int = 8,
     ) -> str:
-        """Generate a random alphanumeric sequence."""
+        """Generate basename (a random alphanumeric sequence, unless
+        `name_strategy` is set)."""
         if not prefix:
             prefix = "tmp"
+        if self.name_strategy is not None:
+            return self.name_strategy(prefix)
         # Use lowercase letters, digits and underscore
         characters = string.ascii_lowercase + string.digits + "_"
         return prefix + "".join(random.choices(characters, k=length))
@@ -51,6 +99,82 @@ class BaseStorage:
         """Write bytes."""
         raise NotImplementedError("Method write_bytes is not implemented!")
 
+    @contextmanager
+    def open_write(self: "BaseStorage", filename: Any) -> Iterator[BinaryIO]:
+        """Open a writable binary stream.
+
+        Storages, capable of writing incrementally, shall override this.
+        The default implementation buffers everything in memory and calls
+        `write_bytes` once the stream is closed.
+        """
+        buffer = BytesIO()
+        yield buffer
+        self.write_bytes(filename, buffer.getvalue())
+
+    def write_stream(
+        self: "BaseStorage",
+        filename: Any,
+        chunks: Iterable[bytes],
+    ) -> int:
+        """Write bytes, given as an iterable of chunks.
+
+        The default implementation writes chunks to the `open_write`
+        stream.
+
+        :return: Number of bytes written.
+        """
+        written = 0
+        with self.open_write(filename) as file:
+            for chunk in chunks:
+                file.write(chunk)
+                written += len(chunk)
+        return written
+
+    def write_file(
+        self: "BaseStorage",
+        filename: Any,
+        source: Union[str, os.PathLike, BinaryIO],
+    ) -> int:
+        """Write the content of a file.
+
+        In-memory buffers (`BytesIO`) are written as a whole, as `bytes`
+        or, if `accepts_memoryview` is set, without copying them
+        (`getbuffer`). Other files are read from the current position in
+        chunks, passed to `write_stream`, thus never held in memory at once.
+
+        :param filename: File name.
+        :param source: Path or binary file object to copy from.
+        :return: Return value of `write_bytes` or `write_stream`.
+        """
+        if isinstance(source, BytesIO):
+            if not self.accepts_memoryview:
+                return self.write_bytes(filename, source.getvalue())
+            with source.getbuffer() as view:
+                return self.write_bytes(filename, view)
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as file:
+                return self.write_file(filename, file)
+        return self.write_stream(
+            filename, iter(partial(source.read, COPY_CHUNK_SIZE), b"")
+        )
+
+    def copy_file(
+        self: "BaseStorage",
+        filename: Any,
+        source: Union[str, os.PathLike],
+    ) -> int:
+        """Copy an existing file.
+
+        Storages able to copy without passing the data through Python
+        (hard links, server-side copy) shall override this. The default
+        implementation calls `write_file`.
+
+        :param filename: File name.
+        :param source: Path of the file to copy.
+        :return: Return value of `write_file`.
+        """
+        return self.write_file(filename, source)
+
     def exists(self: "BaseStorage", filename: Any) -> bool:
         """Check if file exists."""
         raise NotImplementedError("Method exists is not implemented!")
@@ -66,3 +190,35 @@ class BaseStorage:
     def unlink(self: "BaseStorage", filename: Any) -> None:
         """Delete the file."""
         raise NotImplementedError("Method unlink is not implemented!")
+
+    def unlink_many(
+        self: "BaseStorage",
+        filenames: Iterable[Any],
+    ) -> List[Tuple[Any, Exception]]:
+        """Delete multiple files.
+
+        Storages supporting bulk deletion shall override this. The default
+        implementation calls `unlink` in a bounded thread pool.
+
+        :param filenames: Files to delete.
+        :return: List of (filename, error) tuples of files that could not
+            be deleted.
+        """
+
+        def _unlink(filename: Any) -> Optional[Tuple[Any, Exception]]:
+            try:
+                self.unlink(filename)
+            except Exception as err:
+                return filename, err
+            return None
+
+        filenames = list(filenames)
+        if len(filenames) < 2:
+            results = map(_unlink, filenames)
+            return [result for result in results if result]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.unlink_many_workers, len(filenames))
+        ) as executor:
+            results = executor.map(_unlink, filenames)
+            return [result for result in results if result]
@@ -0,0 +1,333 @@
+import contextlib
+import hashlib
+import os
+import threading
+from functools import partial
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .base import COPY_CHUNK_SIZE, BaseStorage
+from .filesystem import FileSystemStorage
+
+__author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
+__copyright__ = "2022-2025 Artur Barseghyan"
+__license__ = "MIT"
+__all__ = ("DedupStorage",)
+
+DEFAULT_HASH_NAME = "sha256"
+
+
+class DedupStorage(BaseStorage):
+    """Content-addressed deduplicating storage wrapper.
+
+    Hashes the content of every written file. The first file with the
+    given content is written to the inner storage as usual. Files with
+    the same content are created from it with `copy_file` of the inner
+    storage, thus the data is never written (or uploaded) again. Whether
+    the data is also stored once depends on the inner storage:
+
+    - `FileSystemStorage` with `link_files` set (the default inner
+      storage) creates hard links, thus every blob is stored once.
+      Without `link_files`, files are cloned on filesystems supporting
+      reflinks (stored once as well) and fully copied on others.
+    - Cloud storages copy the file server-side. That saves the upload
+      bandwidth only: every copy is a separate object, taking full
+      storage space.
+    - Storages without native copy (such as `SFTPStorage`) get all files
+      written as usual, thus nothing is saved.
+
+    Files with the same content are counted as references to the same
+    blob (see `refcount`). Deleting a file (with `unlink`, `unlink_many`
+    or through `FILE_REGISTRY.remove` and `FILE_REGISTRY.clean_up`) drops
+    a single reference. The data is gone once the last reference is
+    deleted; until then, remaining files are used as the copy source.
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker import Faker
+        from faker_file.providers.txt_file import TxtFileProvider
+        from faker_file.storages.dedup import DedupStorage
+        from faker_file.storages.filesystem import FileSystemStorage
+
+        FAKER = Faker()
+        FAKER.add_provider(TxtFileProvider)
+
+        storage = DedupStorage()
+        files = [
+            FAKER.txt_file(storage=storage, content="Lorem ipsum")
+            for _ in range(1_000)
+        ]
+        # The content has been written once, all other files are hard
+        # links to the first one.
+        print(storage.refcount(files[0].data["filename"]))  # 1000
+    """
+
+    def __init__(
+        self: "DedupStorage",
+        inner_storage: Optional[BaseStorage] = None,
+        hash_name: str = DEFAULT_HASH_NAME,
+        *args,
+        **kwargs,
+    ) -> None:
+        """
+        :param inner_storage: Storage to write to. Defaults to
+            `FileSystemStorage` with `link_files` set.
+        :param hash_name: Name of the `hashlib` algorithm, used to hash
+            the content.
+        """
+        if inner_storage is None:
+            inner_storage = FileSystemStorage(link_files=True)
+        self.inner_storage = inner_storage
+        self.hash_name = hash_name
+        # Number of bytes not written, thanks to deduplication
+        self.bytes_saved = 0
+        # Digest -> {str(filename): filename} of files with that content
+        self._references: Dict[str, Dict[str, Any]] = {}
+        # str(filename) -> digest
+        self._digests: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    @property
+    def native_copy(self: "DedupStorage") -> bool:
+        return self.inner_storage.native_copy
+
+    @property
+    def accepts_memoryview(self: "DedupStorage") -> bool:
+        return self.inner_storage.accepts_memoryview
+
+    def hash_bytes(self: "DedupStorage", data: bytes) -> str:
+        """Hash the data."""
+        return hashlib.new(self.hash_name, data).hexdigest()
+
+    def hash_file(
+        self: "DedupStorage",
+        source: Union[str, os.PathLike, BinaryIO],
+    ) -> str:
+        """Hash the content of a file, reading it in chunks."""
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as file:
+                return self.hash_file(file)
+        digest = hashlib.new(self.hash_name)
+        for chunk in iter(partial(source.read, COPY_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    def refcount(self: "DedupStorage", filename: Any) -> int:
+        """Number of files with the same content as the given one.
+
+        :return: 0 if the file is not known to this storage.
+        """
+        with self._lock:
+            digest = self._digests.get(str(filename))
+            return len(self._references.get(digest, ()))
+
+    def _release(self: "DedupStorage", filename: Any) -> bool:
+        """Drop the reference of the file (if any), under the lock.
+
+        :return: True if other files still share the content.
+        """
+        digest = self._digests.pop(str(filename), None)
+        if digest is None:
+            return False
+        references = self._references[digest]
+        references.pop(str(filename), None)
+        if not references:
+            del self._references[digest]
+            return False
+        return True
+
+    def _write(
+        self: "DedupStorage",
+        filename: Any,
+        digest: str,
+        size: int,
+        write: Callable[[], int],
+    ) -> int:
+        """Create the file from an existing one with the same content, or
+        call `write`.
+
+        :param filename: File name.
+        :param digest: Content hash.
+        :param size: Content size (in bytes).
+        :param write: Writes the content to the inner storage.
+        :return: Return value of `copy_file` or `write`.
+        """
+        key = str(filename)
+        with self._lock:
+            shared = self._release(filename)
+            sources = [
+                source
+                for source_key, source in self._references.get(
+                    digest, {}
+                ).items()
+                if source_key != key
+            ]
+        if shared:
+            # Hard links share the content, thus the file is removed first,
+            # so that the other files are left intact
+            self._unlink_quietly(filename)
+
+        result = None
+        if sources and self.inner_storage.native_copy:
+            result = self._copy(filename, sources[0], digest)
+        copied = result is not None
+        if not copied:
+            result = write()
+
+        with self._lock:
+            if copied:
+                self.bytes_saved += size
+            self._release(filename)
+            self._references.setdefault(digest, {})[key] = filename
+            self._digests[key] = digest
+        return result
+
+    def _copy(
+        self: "DedupStorage",
+        filename: Any,
+        source: Any,
+        digest: str,
+    ) -> Optional[int]:
+        """Copy the file with the inner storage.
+
+        :return: Return value of `copy_file`. None, if the source is gone
+            (it's forgotten then).
+        """
+        try:
+            return self.inner_storage.copy_file(filename, source)
+        except FileNotFoundError:
+            with self._lock:
+                if self._digests.get(str(source)) == digest:
+                    self._release(source)
+            return None
+
+    def _unlink_quietly(self: "DedupStorage", filename: Any) -> None:
+        """Delete the file, ignoring errors."""
+        with contextlib.suppress(Exception):
+            self.inner_storage.unlink(filename)
+
+    def generate_filename(
+        self: "DedupStorage",
+        extension: str,
+        prefix: Optional[str] = None,
+        basename: Optional[str] = None,
+    ) -> Any:
+        """Generate filename."""
+        return self.inner_storage.generate_filename(
+            extension=extension,
+            prefix=prefix,
+            basename=basename,
+        )
+
+    def write_text(
+        self: "DedupStorage",
+        filename: Any,
+        data: str,
+        encoding: Optional[str] = None,
+    ) -> int:
+        """Write text."""
+        data_bytes = data.encode(encoding or "utf-8")
+        self._write(
+            filename,
+            self.hash_bytes(data_bytes),
+            len(data_bytes),
+            lambda: self.inner_storage.write_text(filename, data, encoding),
+        )
+        return len(data)
+
+    def write_bytes(
+        self: "DedupStorage",
+        filename: Any,
+        data: bytes,
+    ) -> int:
+        """Write bytes."""
+        return self._write(
+            filename,
+            self.hash_bytes(data),
+            len(data),
+            lambda: self.inner_storage.write_bytes(filename, data),
+        )
+
+    def write_file(
+        self: "DedupStorage",
+        filename: Any,
+        source: Union[str, os.PathLike, BinaryIO],
+    ) -> int:
+        """Write the content of a file.
+
+        Files given as path are hashed in chunks, without loading them
+        into memory.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            return self.copy_file(filename, source)
+        return super().write_file(filename, source)
+
+    def copy_file(
+        self: "DedupStorage",
+        filename: Any,
+        source: Union[str, os.PathLike],
+    ) -> int:
+        """Copy an existing file.
+
+        Local files are deduplicated. Other sources (such as a cloud URI)
+        are passed to `copy_file` of the inner storage as is.
+        """
+        if not (
+            isinstance(source, (str, os.PathLike)) and os.path.isfile(source)
+        ):
+            with self._lock:
+                shared = self._release(filename)
+            if shared:
+                self._unlink_quietly(filename)
+            return self.inner_storage.copy_file(filename, source)
+
+        return self._write(
+            filename,
+            self.hash_file(source),
+            os.path.getsize(source),
+            lambda: self.inner_storage.copy_file(filename, source),
+        )
+
+    def exists(self: "DedupStorage", filename: Any) -> bool:
+        """Check if file exists."""
+        return self.inner_storage.exists(filename)
+
+    def relpath(self: "DedupStorage", filename: Any) -> str:
+        """Return relative path."""
+        return self.inner_storage.relpath(filename)
+
+    def abspath(self: "DedupStorage", filename: Any) -> str:
+        """Return absolute path."""
+        return self.inner_storage.abspath(filename)
+
+    def unlink(self: "DedupStorage", filename: Any) -> None:
+        """Delete the file, dropping its reference."""
+        self.inner_storage.unlink(filename)
+        with self._lock:
+            self._release(filename)
+
+    def unlink_many(
+        self: "DedupStorage",
+        filenames: Iterable[Any],
+    ) -> List[Tuple[Any, Exception]]:
+        """Delete multiple files, dropping their references."""
+        filenames = list(filenames)
+        errors = self.inner_storage.unlink_many(filenames)
+        failed = {str(filename) for filename, _ in errors}
+        with self._lock:
+            for filename in filenames:
+                if str(filename) not in failed:
+                    self._release(filename)
+        return errors
@@ -1,15 +1,129 @@
+import errno
+import hashlib
 import os
+import stat
+import sys
 import tempfile
-from typing import Optional
+from contextlib import contextmanager
+from functools import partial
+from io import BytesIO
+from typing import (
+    BinaryIO,
+    Callable,
+    Iterator,
+    Optional,
+    Set,
+    TypeVar,
+    Union,
+)
 
 from ..base import DEFAULT_REL_PATH
-from .base import BaseStorage
+from .base import COPY_CHUNK_SIZE, BaseStorage
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2022-2025 Artur Barseghyan"
 __license__ = "MIT"
 __all__ = ("FileSystemStorage",)
 
+T = TypeVar("T")
+
+# Errors meaning that the kernel copy is not supported for the given files
+KERNEL_COPY_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.ENOTSUP,
+    errno.EOPNOTSUPP,
+    errno.EBADF,
+    errno.ENOTTY,
+}
+# `FICLONE` ioctl request (Linux), cloning the whole file (reflink)
+FICLONE = 0x40049409
+
+
+def _copy_range(
+    func: Callable[[int, int, int], int],
+    source_fd: int,
+    target_fd: int,
+    size: int,
+) -> Optional[int]:
+    """Copy `size` bytes with `func`, from the current offsets.
+
+    :return: Number of bytes copied. None, if `func` is not supported for
+        the given file descriptors (and nothing was copied).
+    """
+    copied = 0
+    try:
+        while copied < size:
+            sent = func(source_fd, target_fd, size - copied)
+            if not sent:
+                break
+            copied += sent
+    except OSError as err:
+        if copied or err.errno not in KERNEL_COPY_UNSUPPORTED_ERRNOS:
+            raise
+        return None
+    return copied
+
+
+def reflink(source_fd: int, target_fd: int) -> bool:
+    """Clone the whole source file into the target file (`FICLONE`).
+
+    Both files then share the same data blocks until either of them is
+    modified. Only supported on Linux, within the same filesystem
+    supporting reflinks (such as Btrfs or XFS).
+
+    :return: True if cloned. False, if not supported.
+    """
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        fcntl.ioctl(target_fd, FICLONE, source_fd)
+    except OSError as err:
+        if err.errno not in KERNEL_COPY_UNSUPPORTED_ERRNOS:
+            raise
+        return False
+    return True
+
+
+def kernel_copy(source_fd: int, target_fd: int) -> Optional[int]:
+    """Copy file data within the kernel, without passing it through Python.
+
+    Copies from the current position of `source_fd` to its end. Whole
+    files are cloned (see `reflink`), if supported. Otherwise, data is
+    copied with `os.copy_file_range` (which might share the data blocks
+    as well) or `os.sendfile`.
+
+    :param source_fd: Source file descriptor (shall be a regular file).
+    :param target_fd: Target file descriptor.
+    :return: Number of bytes copied. None, if not supported.
+    """
+    source_stat = os.fstat(source_fd)
+    if not stat.S_ISREG(source_stat.st_mode):
+        return None
+    position = os.lseek(source_fd, 0, os.SEEK_CUR)
+    size = source_stat.st_size - position
+    if not position and size and reflink(source_fd, target_fd):
+        return size
+
+    funcs = []
+    if hasattr(os, "copy_file_range"):
+        funcs.append(os.copy_file_range)
+    if hasattr(os, "sendfile"):
+        funcs.append(
+            lambda _src, _dst, count: os.sendfile(_dst, _src, None, count)
+        )
+    for func in funcs:
+        copied = _copy_range(func, source_fd, target_fd, size)
+        if copied is not None:
+            return copied
+    return None
+
 
 class FileSystemStorage(BaseStorage):
     """File storage.
@@ -30,12 +144,38 @@ class FileSystemStorage(BaseStorage):
     .. code-block:: python
 
         storage = FileSystemStorage()
+
+    Spread files over sharded subdirectories (derived from the hash of
+    the basename, such as `tmp/3f/a2/zzz_abc.txt`), so that no single
+    directory grows too large:
+
+    .. code-block:: python
+
+        storage = FileSystemStorage(shard_depth=2)
+
+    Copy files (see `copy_file`) as hard links, where possible. Note, that
+    the copy and the original then are the same file on disk:
+
+    .. code-block:: python
+
+        storage = FileSystemStorage(link_files=True)
+
+    Directories are created once per process. If a directory is removed
+    afterwards, it's re-created on the next write.
     """
 
+    native_copy: bool = True
+    accepts_memoryview: bool = True
+    # Directories known to exist, shared by all instances
+    _created_dirs: Set[str] = set()
+
     def __init__(
         self: "FileSystemStorage",
         root_path: Optional[str] = tempfile.gettempdir(),
         rel_path: Optional[str] = DEFAULT_REL_PATH,
+        shard_depth: int = 0,
+        shard_width: int = 2,
+        link_files: bool = False,
         *args,
         **kwargs,
     ) -> None:
@@ -43,11 +183,61 @@ class FileSystemStorage(BaseStorage):
         :param root_path: Path of your files root directory (in case of Django
             it would be `settings.MEDIA_ROOT`).
         :param rel_path: Relative path (from root directory).
+        :param shard_depth: Number of nested shard subdirectories. If set
+            to 0, files are stored directly in the `rel_path` directory.
+        :param shard_width: Number of hex characters in a shard subdirectory
+            name (2 gives 256 subdirectories per level).
+        :param link_files: If set to True, `copy_file` creates hard links
+            (falling back to copying, if source is on another filesystem).
         """
         self.root_path = root_path or ""
         self.rel_path = rel_path or ""
+        self.shard_depth = shard_depth
+        self.shard_width = shard_width
+        self.link_files = link_files
         super().__init__(*args, **kwargs)
 
+    @classmethod
+    def clear_dir_cache(cls) -> None:
+        """Forget which directories were created."""
+        cls._created_dirs.clear()
+
+    def _makedirs(self: "FileSystemStorage", dir_path: str) -> None:
+        """Create directory, unless already done."""
+        if dir_path not in self._created_dirs:
+            os.makedirs(dir_path, exist_ok=True)
+            self._created_dirs.add(dir_path)
+
+    def _retry_missing_dir(
+        self: "FileSystemStorage",
+        filename: str,
+        write: Callable[[], T],
+    ) -> T:
+        """Call `write`, re-creating the directory if it's gone."""
+        try:
+            return write()
+        except FileNotFoundError:
+            dir_path = os.path.dirname(filename)
+            if dir_path not in self._created_dirs:
+                raise
+            self._created_dirs.discard(dir_path)
+            self._makedirs(dir_path)
+            return write()
+
+    def get_shard_path(self: "FileSystemStorage", basename: str) -> str:
+        """Get shard subdirectories for the basename (such as `3f/a2`)."""
+        if not self.shard_depth:
+            return ""
+        digest = hashlib.md5(
+            basename.encode(), usedforsecurity=False
+        ).hexdigest()
+        return os.path.join(
+            *(
+                digest[i * self.shard_width : (i + 1) * self.shard_width]
+                for i in range(self.shard_depth)
+            )
+        )
+
     def generate_filename(
         self: "FileSystemStorage",
         extension: str,
@@ -55,14 +245,16 @@ class FileSystemStorage(BaseStorage):
         basename: Optional[str] = None,
     ) -> str:
         """Generate filename."""
-        dir_path = os.path.join(self.root_path, self.rel_path)
-        os.makedirs(dir_path, exist_ok=True)
         if not extension:
             raise Exception("Extension shall be given!")
 
         if not basename:
             basename = self.generate_basename(prefix)
 
+        dir_path = os.path.join(self.root_path, self.rel_path)
+        if self.shard_depth:
+            dir_path = os.path.join(dir_path, self.get_shard_path(basename))
+        self._makedirs(dir_path)
         return os.path.join(dir_path, f"{basename}.{extension}")
 
         # if basename:
@@ -82,8 +274,12 @@ class FileSystemStorage(BaseStorage):
         encoding: Optional[str] = None,
     ) -> int:
         """Write text."""
-        with open(filename, "w") as file:
-            return file.write(data)
+
+        def _write() -> int:
+            with open(filename, "w") as file:
+                return file.write(data)
+
+        return self._retry_missing_dir(filename, _write)
 
     def write_bytes(
         self: "FileSystemStorage",
@@ -91,8 +287,85 @@ class FileSystemStorage(BaseStorage):
         data: bytes,
     ) -> int:
         """Write bytes."""
-        with open(filename, "wb") as file:
-            return file.write(data)
+
+        def _write() -> int:
+            with open(filename, "wb") as file:
+                return file.write(data)
+
+        return self._retry_missing_dir(filename, _write)
+
+    @contextmanager
+    def open_write(
+        self: "FileSystemStorage",
+        filename: str,
+    ) -> Iterator[BinaryIO]:
+        """Open a writable binary stream."""
+        file = self._retry_missing_dir(filename, partial(open, filename, "wb"))
+        with file:
+            yield file
+
+    def write_file(
+        self: "FileSystemStorage",
+        filename: str,
+        source: Union[str, os.PathLike, BinaryIO],
+    ) -> int:
+        """Write the content of a file.
+
+        Data of files on disk is copied within the kernel (see
+        `kernel_copy`), if supported.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as file:
+                return self.write_file(filename, file)
+
+        try:
+            source_fd = None if isinstance(source, BytesIO) else source.fileno()
+        except (AttributeError, OSError, ValueError):
+            source_fd = None
+        if source_fd is None:
+            return super().write_file(filename, source)
+
+        def _write() -> int:
+            with open(filename, "wb") as file:
+                # Buffered readers might have read ahead, thus position
+                # of the file descriptor is set explicitly
+                position = source.tell()
+                os.lseek(source_fd, position, os.SEEK_SET)
+                copied = kernel_copy(source_fd, file.fileno())
+                if copied is not None:
+                    source.seek(position + copied)
+                    return copied
+
+                source.seek(position)
+                copied = 0
+                for chunk in iter(partial(source.read, COPY_CHUNK_SIZE), b""):
+                    copied += file.write(chunk)
+                return copied
+
+        return self._retry_missing_dir(filename, _write)
+
+    def copy_file(
+        self: "FileSystemStorage",
+        filename: str,
+        source: Union[str, os.PathLike],
+    ) -> int:
+        """Copy an existing file.
+
+        Creates a hard link if `link_files` is set. Otherwise (or if
+        linking fails), copies the data with `write_file`, cloning it on
+        filesystems supporting reflinks.
+        """
+        if self.link_files:
+            try:
+                self._retry_missing_dir(
+                    filename, partial(os.link, source, filename)
+                )
+            except OSError:
+                # Another filesystem, existing target, no permissions, ...
+                pass
+            else:
+                return os.stat(filename).st_size
+        return self.write_file(filename, source)
 
     def exists(self: "FileSystemStorage", filename: str) -> bool:
         """Check if file exists."""
@@ -0,0 +1,197 @@
+import itertools
+import os
+import random
+import string
+import threading
+import time
+import uuid
+from typing import Optional
+
+__author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
+__copyright__ = "2022-2025 Artur Barseghyan"
+__license__ = "MIT"
+__all__ = (
+    "BaseNameStrategy",
+    "CounterNameStrategy",
+    "RandomNameStrategy",
+    "ULIDNameStrategy",
+    "UUIDNameStrategy",
+)
+
+# Lowercase Crockford's Base32 (no i, l, o and u)
+ULID_ALPHABET = "0123456789abcdefghjkmnpqrstvwxyz"
+
+
+class BaseNameStrategy:
+    """Base file name strategy.
+
+    Generates basenames (file names without extension) for storages.
+    Shall be thread-safe.
+    """
+
+    def generate(self: "BaseNameStrategy", prefix: str) -> str:
+        """Generate basename.
+
+        :param prefix: Basename prefix.
+        :return: Basename.
+        """
+        raise NotImplementedError("Method generate is not implemented!")
+
+    def __call__(self: "BaseNameStrategy", prefix: str) -> str:
+        return self.generate(prefix)
+
+
+class RandomNameStrategy(BaseNameStrategy):
+    """Random alphanumeric names.
+
+    Uses its own random number generator, thus names don't depend on (nor
+    change) the state of the global `random` module. No uniqueness
+    guarantee: with the default length, collisions become likely after
+    tens of millions of names.
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker_file.storages.filesystem import FileSystemStorage
+        from faker_file.storages.naming import RandomNameStrategy
+
+        # Same names on every run
+        storage = FileSystemStorage(name_strategy=RandomNameStrategy(seed=42))
+    """
+
+    characters: str = string.ascii_lowercase + string.digits + "_"
+
+    def __init__(
+        self: "RandomNameStrategy",
+        length: int = 8,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        :param length: Number of random characters.
+        :param seed: Seed of the random number generator.
+        """
+        self.length = length
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def generate(self: "RandomNameStrategy", prefix: str) -> str:
+        """Generate basename."""
+        with self._lock:
+            chars = self._random.choices(self.characters, k=self.length)
+        return prefix + "".join(chars)
+
+
+class CounterNameStrategy(BaseNameStrategy):
+    """Sequential names (`tmp00000000`, `tmp00000001`, ...).
+
+    Names are unique within the strategy instance. Give each process (or
+    each machine) its own `namespace`, if several of them write to the
+    same location.
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker_file.storages.filesystem import FileSystemStorage
+        from faker_file.storages.naming import CounterNameStrategy
+
+        storage = FileSystemStorage(
+            name_strategy=CounterNameStrategy(namespace="worker1_"),
+        )
+    """
+
+    def __init__(
+        self: "CounterNameStrategy",
+        start: int = 0,
+        width: int = 8,
+        namespace: str = "",
+    ) -> None:
+        """
+        :param start: First number.
+        :param width: Minimum number of digits (zero-padded).
+        :param namespace: Added between prefix and number.
+        """
+        self.width = width
+        self.namespace = namespace
+        self._counter = itertools.count(start)
+        self._lock = threading.Lock()
+
+    def generate(self: "CounterNameStrategy", prefix: str) -> str:
+        """Generate basename."""
+        with self._lock:
+            number = next(self._counter)
+        return f"{prefix}{self.namespace}{number:0{self.width}d}"
+
+
+class ULIDNameStrategy(BaseNameStrategy):
+    """ULID (time-ordered) names.
+
+    26 characters: 48-bit timestamp (milliseconds) followed by 80 random
+    bits (from `os.urandom`), encoded with lowercase Crockford's Base32.
+    Names sort by creation time. Within the same millisecond, the random
+    part is incremented, so names generated by one instance are unique and
+    strictly increasing. Across instances (or processes), collisions are
+    practically impossible.
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker_file.storages.aws_s3 import AWSS3Storage
+        from faker_file.storages.naming import ULIDNameStrategy
+
+        storage = AWSS3Storage(
+            bucket_name="artur-testing-1",
+            name_strategy=ULIDNameStrategy(),
+        )
+    """
+
+    def __init__(self: "ULIDNameStrategy") -> None:
+        self._last_timestamp = -1
+        self._last_randomness = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def encode(value: int, length: int) -> str:
+        """Encode integer with Crockford's Base32."""
+        chars = []
+        for _ in range(length):
+            value, index = divmod(value, 32)
+            chars.append(ULID_ALPHABET[index])
+        return "".join(reversed(chars))
+
+    def generate(self: "ULIDNameStrategy", prefix: str) -> str:
+        """Generate basename."""
+        timestamp = time.time_ns() // 1_000_000
+        with self._lock:
+            if timestamp <= self._last_timestamp:
+                # Same millisecond (or clock went backwards)
+                timestamp = self._last_timestamp
+                randomness = self._last_randomness + 1
+                if randomness >> 80:
+                    timestamp += 1
+                    randomness = int.from_bytes(os.urandom(10), "big")
+            else:
+                randomness = int.from_bytes(os.urandom(10), "big")
+            self._last_timestamp = timestamp
+            self._last_randomness = randomness
+        return prefix + self.encode((timestamp << 80) | randomness, 26)
+
+
+class UUIDNameStrategy(BaseNameStrategy):
+    """UUID4 names (32 hex characters).
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker_file.storages.filesystem import FileSystemStorage
+        from faker_file.storages.naming import UUIDNameStrategy
+
+        storage = FileSystemStorage(name_strategy=UUIDNameStrategy())
+    """
+
+    def generate(self: "UUIDNameStrategy", prefix: str) -> str:
+        """Generate basename."""
+        return prefix + uuid.uuid4().hex
@@ -1,4 +1,8 @@
-from pathy import set_client_params
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Tuple
+
+from pathy import Pathy, get_client, set_client_params
 
 from .cloud import CloudStorage
 
@@ -7,6 +11,11 @@ __copyright__ = "2022-2025 Artur Barseghyan"
 __license__ = "MIT"
 __all__ = ("AWSS3Storage",)
 
+# Maximum number of keys per `DeleteObjects` request
+DELETE_OBJECTS_MAX_KEYS = 1_000
+# Minimum size of a multipart upload part (except for the last one)
+MULTIPART_MIN_PART_SIZE = 5 * 1024 * 1024
+
 
 class AWSS3Storage(CloudStorage):
     """AWS S3 Storage.
@@ -24,6 +33,18 @@ class AWSS3Storage(CloudStorage):
         file = s3_storage.generate_filename(prefix="zzz_", extension="docx")
         s3_storage.write_text(file, "Lorem ipsum")
         s3_storage.write_bytes(file, b"Lorem ipsum")
+
+    Files larger than 100 MB are uploaded with S3 multipart upload, in
+    parts uploaded in parallel (each part is retried on failure):
+
+    .. code-block:: python
+
+        s3_storage = AWSS3Storage(
+            bucket_name="artur-testing-1",
+            multipart_threshold=50 * 1024 * 1024,
+            multipart_chunk_size=16 * 1024 * 1024,
+            multipart_workers=8,
+        )
     """
 
     schema: str = "s3"
@@ -33,3 +54,99 @@ class AWSS3Storage(CloudStorage):
     ) -> None:
         """Authenticate to AWS S3."""
         set_client_params("s3", key_id=key_id, key_secret=key_secret)
+
+    def write_multipart(
+        self: "AWSS3Storage",
+        file: Pathy,
+        data: bytes,
+    ) -> int:
+        """Upload data using S3 multipart upload.
+
+        Parts are uploaded in parallel by `multipart_workers` threads,
+        each retried up to `multipart_retries` times. If the upload
+        fails, it's aborted.
+        """
+        native_client = getattr(get_client(self.schema), "client", None)
+        # Not an S3 client (for instance, when `use_fs` is in effect)
+        if not hasattr(native_client, "create_multipart_upload"):
+            return super().write_multipart(file, data)
+
+        chunk_size = max(self.multipart_chunk_size, MULTIPART_MIN_PART_SIZE)
+        view = memoryview(data)
+        upload_id = native_client.create_multipart_upload(
+            Bucket=file.root,
+            Key=file.key,
+        )["UploadId"]
+
+        def _upload_part(part_number: int) -> Dict[str, Any]:
+            offset = (part_number - 1) * chunk_size
+            response = self.call_with_retries(
+                native_client.upload_part,
+                Bucket=file.root,
+                Key=file.key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=bytes(view[offset : offset + chunk_size]),
+            )
+            return {"ETag": response["ETag"], "PartNumber": part_number}
+
+        part_numbers = range(1, -(-len(data) // chunk_size) + 1)
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max(1, self.multipart_workers)
+            ) as executor:
+                parts = list(executor.map(_upload_part, part_numbers))
+            self.call_with_retries(
+                native_client.complete_multipart_upload,
+                Bucket=file.root,
+                Key=file.key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except Exception:
+            native_client.abort_multipart_upload(
+                Bucket=file.root,
+                Key=file.key,
+                UploadId=upload_id,
+            )
+            raise
+        return len(data)
+
+    def unlink_many(
+        self: "AWSS3Storage",
+        filenames: Iterable[Any],
+    ) -> List[Tuple[Any, Exception]]:
+        """Delete multiple files using `DeleteObjects` requests."""
+        native_client = getattr(get_client(self.schema), "client", None)
+        # Not an S3 client (for instance, when `use_fs` is in effect)
+        if not hasattr(native_client, "delete_objects"):
+            return super().unlink_many(filenames)
+
+        buckets = defaultdict(list)
+        for filename in filenames:
+            file = self._get_file(filename)
+            buckets[file.root].append((file.key, filename))
+
+        failed = []
+        for bucket, files in buckets.items():
+            for i in range(0, len(files), DELETE_OBJECTS_MAX_KEYS):
+                chunk = dict(files[i : i + DELETE_OBJECTS_MAX_KEYS])
+                try:
+                    response = native_client.delete_objects(
+                        Bucket=bucket,
+                        Delete={
+                            "Objects": [{"Key": key} for key in chunk],
+                            "Quiet": True,
+                        },
+                    )
+                except Exception as err:
+                    failed.extend((_file, err) for _file in chunk.values())
+                    continue
+                failed.extend(
+                    (
+                        chunk[error["Key"]],
+                        Exception(f"{error['Code']}: {error['Message']}"),
+                    )
+                    for error in response.get("Errors", [])
+                )
+        return failed
@@ -1,4 +1,7 @@
-from pathy import set_client_params
+from concurrent.futures import ThreadPoolExecutor
+
+from azure.storage.blob import BlobBlock
+from pathy import Pathy, get_client, set_client_params
 
 from .cloud import CloudStorage
 
@@ -24,6 +27,11 @@ class AzureCloudStorage(CloudStorage):
         file = azure_storage.generate_filename(prefix="zzz_", extension="docx")
         azure_storage.write_text(file, "Lorem ipsum")
         azure_storage.write_bytes(file, b"Lorem ipsum")
+
+    Files larger than `multipart_threshold` bytes are uploaded as blocks
+    (by `multipart_workers` threads, each block is retried up to
+    `multipart_retries` times), which are then committed at once (the
+    commit is retried as well).
     """
 
     schema = "azure"
@@ -33,3 +41,39 @@ class AzureCloudStorage(CloudStorage):
     ) -> None:
         """Authenticate to Azure Cloud Storage."""
         set_client_params("azure", connection_string=connection_string)
+
+    def write_multipart(
+        self: "AzureCloudStorage",
+        file: Pathy,
+        data: bytes,
+    ) -> int:
+        """Upload data as staged blocks, committed with a block list."""
+        service = getattr(get_client(self.schema), "_service", None)
+        # Not an Azure client (for instance, when `use_fs` is in effect)
+        if not hasattr(service, "get_blob_client"):
+            return super().write_multipart(file, data)
+
+        blob_client = service.get_blob_client(
+            container=file.root, blob=file.key
+        )
+        chunk_size = self.multipart_chunk_size
+        view = memoryview(data)
+
+        def _stage_block(offset: int) -> BlobBlock:
+            block_id = f"{offset // chunk_size:08d}"
+            self.call_with_retries(
+                blob_client.stage_block,
+                block_id,
+                bytes(view[offset : offset + chunk_size]),
+            )
+            return BlobBlock(block_id=block_id)
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, self.multipart_workers)
+        ) as executor:
+            blocks = list(
+                executor.map(_stage_block, range(0, len(data), chunk_size))
+            )
+        # Uncommitted blocks are discarded by Azure on failure
+        self.call_with_retries(blob_client.commit_block_list, blocks)
+        return len(data)
@@ -1,7 +1,20 @@
+import logging
+import os
+import time
 from abc import abstractmethod
-from typing import Any, Dict, Optional, Union
+from contextlib import contextmanager
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from pathy import Pathy
+from pathy import Pathy, get_client
 
 from ...base import DEFAULT_REL_PATH
 from ..base import BaseStorage
@@ -17,17 +30,30 @@ __all__ = (
 )
 
 
+LOGGER = logging.getLogger(__name__)
+
 DEFAULT_ROOT_PATH = "tmp"
 IS_LEGACY_PATHY_VERSION = is_legacy_pathy_version()
+# Files larger than this (in bytes) are uploaded in parts
+DEFAULT_MULTIPART_THRESHOLD = 100 * 1024 * 1024
+DEFAULT_MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_MULTIPART_WORKERS = 4
+DEFAULT_MULTIPART_RETRIES = 3
 
 
 class CloudStorage(BaseStorage):
-    """Base cloud storage."""
+    """Base cloud storage.
+
+    Files larger than `multipart_threshold` bytes are uploaded in parts
+    of `multipart_chunk_size` bytes (see `write_multipart`), instead of
+    a single request.
+    """
 
     bucket_name: str
     bucket: Pathy
     credentials: Dict[str, str]
     schema: Optional[str] = None
+    native_copy: bool = True
 
     def __init__(
         self: "CloudStorage",
@@ -35,15 +61,38 @@ class CloudStorage(BaseStorage):
         root_path: Optional[str] = DEFAULT_ROOT_PATH,
         rel_path: Optional[str] = DEFAULT_REL_PATH,
         credentials: Optional[Dict[str, Any]] = None,
+        multipart_threshold: Optional[int] = DEFAULT_MULTIPART_THRESHOLD,
+        multipart_chunk_size: int = DEFAULT_MULTIPART_CHUNK_SIZE,
+        multipart_workers: int = DEFAULT_MULTIPART_WORKERS,
+        multipart_retries: int = DEFAULT_MULTIPART_RETRIES,
         *args,
         **kwargs,
     ):
+        """
+        :param bucket_name: Bucket name.
+        :param root_path: Path of your files root directory.
+        :param rel_path: Relative path (from root directory).
+        :param credentials: Credentials, passed to `authenticate`.
+        :param multipart_threshold: Size (in bytes) above which files are
+            uploaded in parts. If set to None, files are always uploaded
+            with a single request.
+        :param multipart_chunk_size: Size (in bytes) of a single part.
+        :param multipart_workers: Number of parts uploaded in parallel.
+            Used by AWS S3 and Azure only.
+        :param multipart_retries: Number of retries per part. Used by AWS
+            S3 and Azure only (Google Cloud Storage uses the retry policy
+            of its client library).
+        """
         if self.schema is None:
             raise Exception("The `schema` property should the set!")
         self.bucket_name = bucket_name
         self.root_path = root_path or ""
         self.rel_path = rel_path or ""
         self.cache_dir = None
+        self.multipart_threshold = multipart_threshold
+        self.multipart_chunk_size = multipart_chunk_size
+        self.multipart_workers = multipart_workers
+        self.multipart_retries = multipart_retries
         credentials = credentials or {}
 
         if credentials:
@@ -106,6 +155,9 @@ class CloudStorage(BaseStorage):
         """Write text."""
         # file = self.bucket / self.root_path / self.rel_path / filename
         # return file.write_text(data, encoding)
+        if self.use_multipart(len(data)):
+            self.write_bytes(filename, data.encode(encoding or "utf-8"))
+            return len(data)
         file = self._get_file(filename)
         return file.write_text(data, encoding)
 
@@ -113,8 +165,111 @@ class CloudStorage(BaseStorage):
         """Write bytes."""
         # file = self.bucket / self.root_path / self.rel_path / filename
         file = self._get_file(filename)
+        if self.use_multipart(len(data)):
+            return self.write_multipart(file, data)
         return file.write_bytes(data)
 
+    def use_multipart(self: "CloudStorage", size: int) -> bool:
+        """Check if data of the given size shall be uploaded in parts."""
+        return (
+            self.multipart_threshold is not None
+            and size > self.multipart_threshold
+        )
+
+    def write_multipart(self: "CloudStorage", file: Pathy, data: bytes) -> int:
+        """Upload data in parts.
+
+        Generic implementation, streaming the data through `open_write`
+        in parts of `multipart_chunk_size` bytes, without parallel uploads
+        or retries. Overridden by storages supporting native multipart
+        (or resumable) uploads.
+
+        :param file: File object.
+        :param data: Data to upload.
+        :return: Number of bytes written.
+        """
+        view = memoryview(data)
+        with self.open_write(file) as stream:
+            for offset in range(0, len(view), self.multipart_chunk_size):
+                stream.write(view[offset : offset + self.multipart_chunk_size])
+        return len(data)
+
+    def call_with_retries(
+        self: "CloudStorage",
+        func: Callable[..., Any],
+        *args,
+        **kwargs,
+    ) -> Any:
+        """Call `func`, retrying up to `multipart_retries` times.
+
+        Waits 0.5, 1, 2, ... seconds between attempts.
+        """
+
+        def _attempt() -> Tuple[bool, Any]:
+            try:
+                return True, func(*args, **kwargs)
+            except Exception as err:
+                return False, err
+
+        for attempt in range(self.multipart_retries):
+            succeeded, result = _attempt()
+            if succeeded:
+                return result
+            LOGGER.warning(
+                f"Attempt {attempt + 1} of {getattr(func, '__name__', func)} "
+                f"failed, retrying: {result}"
+            )
+            time.sleep(0.5 * 2**attempt)
+        return func(*args, **kwargs)
+
+    @contextmanager
+    def open_write(
+        self: "CloudStorage",
+        filename: Union[Pathy, str],
+    ) -> Iterator[BinaryIO]:
+        """Open a writable binary stream.
+
+        Data is uploaded in parts while being written (for instance, as
+        S3 multipart upload), so that it's never held in memory at once.
+        """
+        file = self._get_file(filename)
+        with file.open("wb") as stream:
+            yield stream
+
+    def copy_file(
+        self: "CloudStorage",
+        filename: Union[Pathy, str],
+        source: Union[Pathy, str, os.PathLike],
+    ) -> int:
+        """Copy an existing file.
+
+        Files in the same cloud (given as `Pathy` or as URI with the same
+        schema, such as `s3://bucket/path/to/file.pdf`) are copied
+        server-side, without downloading them. Other files are uploaded
+        with `write_file`.
+
+        :param filename: File name.
+        :param source: Path (or URI) of the file to copy.
+        :return: Size of the copied file (in bytes).
+        """
+        if not (
+            isinstance(source, Pathy)
+            or (
+                isinstance(source, str)
+                and source.startswith(f"{self.schema}://")
+            )
+        ):
+            return self.write_file(filename, source)
+
+        source_file = Pathy(source)
+        file = self._get_file(filename)
+        client = get_client(self.schema)
+        blob = client.get_blob(source_file)
+        if blob is None:
+            raise FileNotFoundError(f"File {source_file} does not exist!")
+        blob.bucket.copy_blob(blob, client.get_bucket(file), file.key)
+        return blob.size
+
     def exists(self: "CloudStorage", filename: Union[Pathy, str]) -> bool:
         """Check if file exists."""
         # if isinstance(filename, str):
@@ -1,5 +1,10 @@
+import io
+from collections import defaultdict
+from typing import Any, Iterable, List, Tuple
+
+from google.cloud.storage.retry import DEFAULT_RETRY
 from google.oauth2 import service_account
-from pathy import set_client_params
+from pathy import Pathy, get_client, set_client_params
 
 from .cloud import CloudStorage
 
@@ -8,6 +13,11 @@ __copyright__ = "2022-2025 Artur Barseghyan"
 __license__ = "MIT"
 __all__ = ("GoogleCloudStorage",)
 
+# Maximum number of calls per batch request
+BATCH_MAX_CALLS = 100
+# Chunk size of resumable uploads shall be a multiple of this
+RESUMABLE_CHUNK_ALIGNMENT = 256 * 1024
+
 
 class GoogleCloudStorage(CloudStorage):
     """Google Cloud Storage.
@@ -25,6 +35,13 @@ class GoogleCloudStorage(CloudStorage):
         file = gs_storage.generate_filename(prefix="zzz_", extension="docx")
         gs_storage.write_text(file, "Lorem ipsum")
         gs_storage.write_bytes(file, b"Lorem ipsum")
+
+    Files larger than `multipart_threshold` bytes are uploaded with a
+    resumable upload, in chunks of `multipart_chunk_size` bytes (rounded
+    up to a multiple of 256 KB). Failed chunks are retried with the default
+    retry policy of the `google-cloud-storage` library. Resumable uploads
+    are sequential, thus `multipart_workers` and `multipart_retries` have
+    no effect.
     """
 
     schema = "gs"
@@ -37,3 +54,60 @@ class GoogleCloudStorage(CloudStorage):
             json_file_path
         )
         set_client_params("gs", credentials=credentials)
+
+    def write_multipart(
+        self: "GoogleCloudStorage",
+        file: Pathy,
+        data: bytes,
+    ) -> int:
+        """Upload data using a resumable upload."""
+        native_client = getattr(get_client(self.schema), "client", None)
+        # Not a GCS client (for instance, when `use_fs` is in effect)
+        if not hasattr(native_client, "bucket"):
+            return super().write_multipart(file, data)
+
+        chunk_size = (
+            -(-self.multipart_chunk_size // RESUMABLE_CHUNK_ALIGNMENT)
+            * RESUMABLE_CHUNK_ALIGNMENT
+        )
+        blob = native_client.bucket(file.root).blob(
+            file.key,
+            chunk_size=chunk_size,
+        )
+        blob.upload_from_file(
+            io.BytesIO(data),
+            size=len(data),
+            retry=DEFAULT_RETRY,
+        )
+        return len(data)
+
+    def unlink_many(
+        self: "GoogleCloudStorage",
+        filenames: Iterable[Any],
+    ) -> List[Tuple[Any, Exception]]:
+        """Delete multiple files using batch requests.
+
+        If a batch fails, all files of that batch are reported as failed.
+        """
+        native_client = getattr(get_client(self.schema), "client", None)
+        # Not a GCS client (for instance, when `use_fs` is in effect)
+        if not hasattr(native_client, "batch"):
+            return super().unlink_many(filenames)
+
+        buckets = defaultdict(list)
+        for filename in filenames:
+            file = self._get_file(filename)
+            buckets[file.root].append((file.key, filename))
+
+        failed = []
+        for bucket_name, files in buckets.items():
+            bucket = native_client.bucket(bucket_name)
+            for i in range(0, len(files), BATCH_MAX_CALLS):
+                chunk = files[i : i + BATCH_MAX_CALLS]
+                try:
+                    with native_client.batch():
+                        for key, _filename in chunk:
+                            bucket.delete_blob(key)
+                except Exception as err:
+                    failed.extend((filename, err) for _key, filename in chunk)
+        return failed
@@ -1,6 +1,23 @@
 import logging
 import os
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import chain
+from queue import Empty, LifoQueue
+from threading import BoundedSemaphore, Lock, local
+from typing import (
+    Any,
+    BinaryIO,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import paramiko
 
@@ -9,10 +26,228 @@ from .base import BaseStorage
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2022-2025 Artur Barseghyan"
 __license__ = "MIT"
-__all__ = ("SFTPStorage",)
+__all__ = (
+    "SFTPConnectionPool",
+    "SFTPStorage",
+)
 
 LOGGER = logging.getLogger(__name__)
 
+# Size of chunks written to the remote file (maximum size of one SFTP
+# write request in paramiko).
+DEFAULT_CHUNK_SIZE = 32_768
+# Maximum number of chunks written without waiting for the server
+# acknowledgements.
+DEFAULT_WINDOW = 64
+
+
+class SFTPConnectionPool:
+    """Thread-safe pool of SFTP clients (channels).
+
+    Clients are created lazily (up to `pool_size`) and spread over one or
+    more transports (at most `channels_per_transport` clients each).
+    Clients are health checked on checkout and check-in; broken ones are
+    discarded and replaced, reconnecting dropped transports.
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker_file.storages.sftp_storage import SFTPConnectionPool
+
+        POOL = SFTPConnectionPool(
+            host="0.0.0.0",
+            username="foo",
+            password="pass",
+            pool_size=4,
+        )
+
+        with POOL.connection() as sftp:
+            sftp.listdir("/upload")
+
+        POOL.close()
+    """
+
+    def __init__(
+        self: "SFTPConnectionPool",
+        host: str,
+        port: int = 22,
+        username: str = "",
+        password: Optional[str] = None,
+        key: Optional[paramiko.PKey] = None,
+        pool_size: int = 1,
+        channels_per_transport: int = 4,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        :param host: The hostname of the SFTP server.
+        :param port: The port of the SFTP server.
+        :param username: The username to authenticate as.
+        :param password: The password to use when connecting.
+        :param key: The private key to use when connecting.
+        :param pool_size: Maximum number of SFTP clients.
+        :param channels_per_transport: Maximum number of SFTP clients
+            sharing one transport (TCP connection).
+        :param timeout: Maximum time (in seconds) to wait for a free client.
+            If not given, wait forever.
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.key = key
+        self.pool_size = pool_size
+        self.channels_per_transport = channels_per_transport
+        self.timeout = timeout
+        self._idle: "LifoQueue[paramiko.SFTPClient]" = LifoQueue()
+        self._semaphore = BoundedSemaphore(pool_size)
+        # Number of open clients per transport
+        self._transports: Dict[paramiko.Transport, int] = {}
+        self._lock = Lock()
+        # Client checked out by the current thread (for nested checkouts)
+        self._local = local()
+
+    def _connect_transport(self: "SFTPConnectionPool") -> paramiko.Transport:
+        transport = paramiko.Transport((self.host, self.port))
+        try:
+            if self.key:
+                transport.connect(username=self.username, pkey=self.key)
+            else:
+                transport.connect(
+                    username=self.username,
+                    password=self.password,
+                )
+        except Exception:
+            transport.close()
+            raise
+        return transport
+
+    def _create_client(self: "SFTPConnectionPool") -> paramiko.SFTPClient:
+        with self._lock:
+            for transport in [
+                _t for _t in self._transports if not _t.is_active()
+            ]:
+                if not self._transports[transport]:
+                    del self._transports[transport]
+            transport = next(
+                (
+                    _t
+                    for _t, _count in self._transports.items()
+                    if _t.is_active() and _count < self.channels_per_transport
+                ),
+                None,
+            )
+            if transport is None:
+                transport = self._connect_transport()
+                self._transports[transport] = 0
+            self._transports[transport] += 1
+
+        try:
+            return paramiko.SFTPClient.from_transport(transport)
+        except Exception:
+            self._release_transport(transport)
+            raise
+
+    def _release_transport(
+        self: "SFTPConnectionPool",
+        transport: paramiko.Transport,
+    ) -> None:
+        with self._lock:
+            if transport not in self._transports:
+                return
+            self._transports[transport] -= 1
+            if self._transports[transport] <= 0 and not transport.is_active():
+                del self._transports[transport]
+                transport.close()
+
+    def _discard(
+        self: "SFTPConnectionPool",
+        client: paramiko.SFTPClient,
+    ) -> None:
+        channel = client.get_channel()
+        try:
+            client.close()
+        except Exception as err:
+            LOGGER.debug(f"Failed to close SFTP client: {err}")
+        if channel is not None:
+            self._release_transport(channel.get_transport())
+
+    @staticmethod
+    def is_healthy(client: paramiko.SFTPClient) -> bool:
+        """Check if client is usable."""
+        channel = client.get_channel()
+        return (
+            channel is not None
+            and not channel.closed
+            and channel.get_transport().is_active()
+        )
+
+    def acquire(self: "SFTPConnectionPool") -> paramiko.SFTPClient:
+        """Check out a client. Shall be released with `release`."""
+        if not self._semaphore.acquire(timeout=self.timeout):
+            raise TimeoutError("No free SFTP connection in the pool")
+        try:
+            while True:
+                try:
+                    client = self._idle.get_nowait()
+                except Empty:
+                    return self._create_client()
+                if self.is_healthy(client):
+                    return client
+                LOGGER.info("Discarding broken SFTP connection")
+                self._discard(client)
+        except Exception:
+            self._semaphore.release()
+            raise
+
+    def release(
+        self: "SFTPConnectionPool",
+        client: paramiko.SFTPClient,
+    ) -> None:
+        """Return a client to the pool."""
+        try:
+            if self.is_healthy(client):
+                self._idle.put(client)
+            else:
+                self._discard(client)
+        finally:
+            self._semaphore.release()
+
+    @contextmanager
+    def connection(
+        self: "SFTPConnectionPool",
+    ) -> Iterator[paramiko.SFTPClient]:
+        """Check out a client for the duration of the `with` block.
+
+        Nested checkouts within the same thread reuse the same client.
+        """
+        client = getattr(self._local, "client", None)
+        if client is not None:
+            yield client
+            return
+
+        client = self.acquire()
+        self._local.client = client
+        try:
+            yield client
+        finally:
+            self._local.client = None
+            self.release(client)
+
+    def close(self: "SFTPConnectionPool") -> None:
+        """Close idle clients and all transports."""
+        while True:
+            try:
+                client = self._idle.get_nowait()
+            except Empty:
+                break
+            client.close()
+        with self._lock:
+            transports = list(self._transports)
+            self._transports.clear()
+        for transport in transports:
+            transport.close()
+
 
 class SFTPStorage(BaseStorage):
     """SFTP storage.
@@ -48,8 +283,23 @@ class SFTPStorage(BaseStorage):
 
         # Generate TXT file inside `/upload/another` directory
         txt_file = FAKER.txt_file(storage=STORAGE_SUB_DIR)
+
+    The storage is thread-safe. Connections are pooled (see
+    `SFTPConnectionPool`); set `pool_size` to the number of threads
+    writing concurrently:
+
+    .. code-block:: python
+
+        STORAGE = SFTPStorage(
+            host="0.0.0.0",
+            username="foo",
+            password="pass",
+            pool_size=8,
+        )
     """
 
+    pool: Optional[SFTPConnectionPool] = None
+    # Kept for backwards compatibility. Not thread-safe, use `connection`
     sftp: Optional[paramiko.SFTPClient] = None
     transport: Optional[paramiko.Transport] = None
 
@@ -62,6 +312,12 @@ class SFTPStorage(BaseStorage):
         key: Optional[paramiko.PKey] = None,
         root_path: str = "",
         rel_path: str = "",
+        pool_size: int = 1,
+        channels_per_transport: int = 4,
+        pool_timeout: Optional[float] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        window: int = DEFAULT_WINDOW,
+        upload_workers: int = 1,
         *args,
         **kwargs,
     ) -> None:
@@ -73,24 +329,60 @@ class SFTPStorage(BaseStorage):
         :param key: The private key to use when connecting.
         :param root_path: Path of your files root directory.
         :param rel_path: Relative path (from root directory).
+        :param pool_size: Maximum number of SFTP connections (channels).
+            Increase it to let several threads use the storage at once.
+        :param channels_per_transport: Maximum number of SFTP channels
+            sharing one transport (TCP connection).
+        :param pool_timeout: Maximum time (in seconds) to wait for a free
+            connection. If not given, wait forever.
+        :param chunk_size: Size of chunks written to the remote file.
+        :param window: Maximum number of chunks written (pipelined) without
+            waiting for the server acknowledgements.
+        :param upload_workers: If greater than 1, files larger than
+            `chunk_size * window` are uploaded in parts of that size, in
+            parallel, using up to `upload_workers` pooled connections
+            (`pool_size` shall be at least `upload_workers`).
         """
         self.root_path = root_path
         self.rel_path = rel_path
+        self.chunk_size = chunk_size
+        self.window = window
+        self.upload_workers = upload_workers
 
-        self.transport = paramiko.Transport((host, port))
+        self.pool = SFTPConnectionPool(
+            host=host,
+            port=port,
+            username=username,
+            password=password,
+            key=key,
+            pool_size=pool_size,
+            channels_per_transport=channels_per_transport,
+            timeout=pool_timeout,
+        )
 
-        # Authentication
+        # Authentication (the first connection is opened eagerly, so that
+        # wrong credentials are reported right away).
         try:
-            if key:
-                self.transport.connect(username=username, pkey=key)
-            else:
-                self.transport.connect(username=username, password=password)
-            self.sftp = paramiko.SFTPClient.from_transport(self.transport)
+            with self.pool.connection() as sftp:
+                self.sftp = sftp
+                self.transport = sftp.get_channel().get_transport()
         except Exception as e:
             LOGGER.exception(f"Failed to connect to SFTP server: {e}")
             raise
         super().__init__(*args, **kwargs)
 
+    def connection(
+        self: "SFTPStorage",
+    ) -> ContextManager[paramiko.SFTPClient]:
+        """Check out a pooled SFTP client (context manager).
+
+        .. code-block:: python
+
+            with STORAGE.connection() as sftp:
+                sftp.listdir(STORAGE.root_path)
+        """
+        return self.pool.connection()
+
     def _build_path(self: "SFTPStorage", filename: str) -> str:
         """Build the full path for a file."""
         return os.path.join(self.root_path, self.rel_path, filename)
@@ -130,27 +422,154 @@ class SFTPStorage(BaseStorage):
         try:
             # Encode the text data into bytes before writing
             encoded_data = data.encode(encoding)
-            with self.sftp.open(self._build_path(filename), "wb") as file:
-                file.write(encoded_data)
-                return 0
+            self._write_chunks(filename, [encoded_data])
+            return 0
         except Exception as err:
             LOGGER.exception(f"Failed to write text to {filename}: {err}")
             return -1
 
     def write_bytes(self: "SFTPStorage", filename: str, data: bytes) -> int:
-        """Write bytes."""
+        """Write bytes.
+
+        Data is written in pipelined chunks (see `chunk_size` and
+        `window`), in parallel if `upload_workers` is greater than 1.
+        """
         try:
-            with self.sftp.open(self._build_path(filename), "wb") as file:
-                file.write(data)
-                return 0
+            self._write_chunks(filename, [memoryview(data)])
+            return 0
         except Exception as err:
             LOGGER.exception(f"Failed to write bytes to {filename}: {err}")
             return -1
 
+    def write_stream(
+        self: "SFTPStorage",
+        filename: str,
+        chunks: Iterable[bytes],
+    ) -> int:
+        """Write bytes, given as an iterable of chunks.
+
+        Same as `write_bytes`, but the data doesn't have to be built as
+        one bytes object. Returns the number of bytes written (or -1 on
+        failure).
+
+        .. code-block:: python
+
+            def chunks():
+                for _ in range(1_000):
+                    yield FAKER.binary(length=1024 * 1024)
+
+            STORAGE.write_stream("large.bin", chunks())
+        """
+        try:
+            return self._write_chunks(filename, chunks)
+        except Exception as err:
+            LOGGER.exception(f"Failed to write stream to {filename}: {err}")
+            return -1
+
+    def _split(
+        self: "SFTPStorage",
+        chunks: Iterable[bytes],
+        size: int,
+    ) -> Iterator[memoryview]:
+        """Re-split chunks into memoryview slices of at most `size`."""
+        for chunk in chunks:
+            view = memoryview(chunk)
+            for offset in range(0, len(view), size):
+                yield view[offset : offset + size]
+
+    def _join(
+        self: "SFTPStorage",
+        chunks: Iterable[bytes],
+        size: int,
+    ) -> Iterator[Union[bytes, memoryview]]:
+        """Re-split chunks into parts of exactly `size` (but the last)."""
+        buffer = bytearray()
+        for chunk in self._split(chunks, size):
+            if not buffer and len(chunk) == size:
+                yield chunk
+                continue
+            buffer += chunk
+            if len(buffer) >= size:
+                yield bytes(buffer[:size])
+                del buffer[:size]
+        if buffer:
+            yield bytes(buffer)
+
+    def _write_file(
+        self: "SFTPStorage",
+        file: paramiko.SFTPFile,
+        chunks: Iterable[bytes],
+    ) -> int:
+        """Write chunks to an open remote file, pipelined.
+
+        :return: Number of bytes written.
+        """
+        file.set_pipelined(True)
+        written = 0
+        for counter, chunk in enumerate(
+            self._split(chunks, self.chunk_size), start=1
+        ):
+            file.write(chunk)
+            written += len(chunk)
+            if counter % self.window == 0:
+                # Any request waits for acknowledgements of pending writes
+                file.stat()
+        return written
+
+    def _write_chunks(
+        self: "SFTPStorage",
+        filename: str,
+        chunks: Iterable[bytes],
+    ) -> int:
+        """Write chunks to the remote file.
+
+        :return: Number of bytes written.
+        """
+        path = self._build_path(filename)
+        part_size = self.chunk_size * self.window
+        parts = self._join(chunks, part_size)
+        first_parts = [part for _, part in zip(range(2), parts)]
+
+        if self.upload_workers < 2 or len(first_parts) < 2:
+            with self.connection() as sftp, sftp.open(path, "wb") as file:
+                return self._write_file(file, chain(first_parts, parts))
+
+        def _upload(offset: int, part: bytes) -> None:
+            with self.connection() as sftp, sftp.open(path, "r+b") as file:
+                file.seek(offset)
+                self._write_file(file, [part])
+
+        # Create (truncate) the file
+        with self.connection() as sftp:
+            sftp.open(path, "wb").close()
+
+        with ThreadPoolExecutor(max_workers=self.upload_workers) as executor:
+            futures = deque()
+            offset = 0
+            for part in chain(first_parts, parts):
+                futures.append(executor.submit(_upload, offset, part))
+                offset += len(part)
+                # Limit the number of parts held in memory
+                if len(futures) >= 2 * self.upload_workers:
+                    futures.popleft().result()
+            for future in futures:
+                future.result()
+        return offset
+
+    @contextmanager
+    def open_write(self: "SFTPStorage", filename: str) -> Iterator[BinaryIO]:
+        """Open a writable binary stream."""
+        with (
+            self.connection() as sftp,
+            sftp.open(self._build_path(filename), "wb") as file,
+        ):
+            yield file
+
     def exists(self: "SFTPStorage", filename: str) -> bool:
         """Check if file exists."""
         try:
-            self.sftp.stat(self._build_path(filename))
+            with self.connection() as sftp:
+                sftp.stat(self._build_path(filename))
             return True
         except IOError:
             return False
@@ -166,16 +585,44 @@ class SFTPStorage(BaseStorage):
     def unlink(self: "SFTPStorage", filename: str) -> None:
         """Remove a file."""
         try:
-            self.sftp.remove(self._build_path(filename))
+            with self.connection() as sftp:
+                sftp.remove(self._build_path(filename))
         except Exception as err:
             LOGGER.exception(f"Failed to remove {filename}: {err}")
 
+    def unlink_many(
+        self: "SFTPStorage",
+        filenames: Iterable[Any],
+    ) -> List[Tuple[Any, Exception]]:
+        """Remove multiple files.
+
+        Files are removed concurrently, using up to `pool_size` pooled
+        connections.
+        """
+
+        def _remove(filename: Any) -> Optional[Tuple[Any, Exception]]:
+            try:
+                with self.connection() as sftp:
+                    sftp.remove(self._build_path(filename))
+            except Exception as err:
+                return filename, err
+            return None
+
+        filenames = list(filenames)
+        if self.pool.pool_size < 2 or len(filenames) < 2:
+            results = map(_remove, filenames)
+            return [result for result in results if result]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.pool.pool_size, len(filenames))
+        ) as executor:
+            results = executor.map(_remove, filenames)
+            return [result for result in results if result]
+
     def close(self: "SFTPStorage"):
-        """Explicitly close the connection."""
-        if self.sftp:
-            self.sftp.close()
-        if self.transport:
-            self.transport.close()
+        """Explicitly close the connections."""
+        if self.pool:
+            self.pool.close()
 
     def __del__(self: "SFTPStorage"):
         """Destructor to ensure connection is closed."""
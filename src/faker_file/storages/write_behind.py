@@ -0,0 +1,324 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import weakref
+from collections import Counter
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+
+from .base import BaseStorage
+
+__author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
+__copyright__ = "2022-2025 Artur Barseghyan"
+__license__ = "MIT"
+__all__ = (
+    "WriteBehindError",
+    "WriteBehindStorage",
+)
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUE_BYTES = 64 * 1024 * 1024
+DEFAULT_WORKERS = 4
+
+# Storages with pending writes, flushed at interpreter exit
+_INSTANCES: "weakref.WeakSet[WriteBehindStorage]" = weakref.WeakSet()
+
+
+class WriteBehindError(Exception):
+    """Raised by `flush` (or `close`) if any of the writes failed."""
+
+    def __init__(self, errors: List[Tuple[Any, Exception]]) -> None:
+        """
+        :param errors: List of (filename, error) tuples of failed writes.
+        """
+        self.errors = errors
+        super().__init__(
+            f"Failed to write {len(errors)} file(s): "
+            + ", ".join(f"{filename} ({err!r})" for filename, err in errors)
+        )
+
+
+class WriteBehindStorage(BaseStorage):
+    """Write-behind storage wrapper.
+
+    Writes return immediately. Data is written to the inner storage by
+    background threads. If more than `max_queue_bytes` bytes are waiting
+    to be written, writes block until there's room (backpressure).
+
+    Call `flush` to wait for all pending writes to complete. If any of
+    them failed (raised an exception, or returned a negative number of
+    bytes written), `WriteBehindError` (listing all failed files) is
+    raised.
+    `close` flushes and stops the background threads.
+
+    Usage example:
+
+    .. code-block:: python
+
+        from faker import Faker
+        from faker_file.providers.txt_file import TxtFileProvider
+        from faker_file.storages.aws_s3 import AWSS3Storage
+        from faker_file.storages.write_behind import WriteBehindStorage
+
+        FAKER = Faker()
+        FAKER.add_provider(TxtFileProvider)
+
+        with WriteBehindStorage(
+            AWSS3Storage(bucket_name="artur-testing-1"),
+            max_queue_bytes=128 * 1024 * 1024,
+            workers=8,
+        ) as storage:
+            files = [FAKER.txt_file(storage=storage) for _ in range(1_000)]
+
+    Checking for errors without closing the storage:
+
+    .. code-block:: python
+
+        from faker_file.storages.write_behind import WriteBehindError
+
+        try:
+            storage.flush()
+        except WriteBehindError as err:
+            for filename, error in err.errors:
+                print(filename, error)
+    """
+
+    def __init__(
+        self: "WriteBehindStorage",
+        inner_storage: BaseStorage,
+        max_queue_bytes: int = DEFAULT_MAX_QUEUE_BYTES,
+        workers: int = DEFAULT_WORKERS,
+        *args,
+        **kwargs,
+    ) -> None:
+        """
+        :param inner_storage: Storage to write to (for instance,
+            `FileSystemStorage`, `AWSS3Storage` or `SFTPStorage`). Shall
+            be thread-safe if `workers` is greater than 1.
+        :param max_queue_bytes: Maximum size (in bytes) of data waiting to
+            be written. A single write larger than that is still accepted
+            when nothing else is pending.
+        :param workers: Number of background threads.
+        """
+        self.inner_storage = inner_storage
+        self.max_queue_bytes = max_queue_bytes
+        self.workers = max(1, workers)
+        self.errors: List[Tuple[Any, Exception]] = []
+        self._queue: "queue.Queue[Optional[Tuple[Any, Callable, int]]]" = (
+            queue.Queue()
+        )
+        self._condition = threading.Condition()
+        self._pending_bytes = 0
+        self._pending = Counter()
+        self._closed = False
+        self._threads = [
+            threading.Thread(
+                target=self._worker,
+                name=f"faker-file-write-behind-{i}",
+                daemon=True,
+            )
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+        _INSTANCES.add(self)
+        super().__init__(*args, **kwargs)
+
+    def _worker(self: "WriteBehindStorage") -> None:
+        """Write queued data to the inner storage."""
+        while True:
+            task = self._queue.get()
+            if task is None:
+                return
+            filename, write, size = task
+            try:
+                written = write()
+                # Some storages (for instance, `SFTPStorage`) report
+                # failures by returning -1, instead of raising
+                if isinstance(written, int) and written < 0:
+                    raise IOError(
+                        f"Inner storage returned {written} (write failed)"
+                    )
+            except Exception as err:
+                LOGGER.error(f"Failed to write file {filename}: {err}")
+                with self._condition:
+                    self.errors.append((filename, err))
+            finally:
+                with self._condition:
+                    self._pending_bytes -= size
+                    self._pending[str(filename)] -= 1
+                    if not self._pending[str(filename)]:
+                        del self._pending[str(filename)]
+                    self._condition.notify_all()
+
+    def _submit(
+        self: "WriteBehindStorage",
+        filename: Any,
+        write: Callable[[], Any],
+        size: int,
+    ) -> None:
+        """Queue a write, blocking while the queue is full."""
+        with self._condition:
+            if self._closed:
+                raise ValueError("Storage is closed!")
+            self._condition.wait_for(
+                lambda: (
+                    not self._pending_bytes
+                    or self._pending_bytes + size <= self.max_queue_bytes
+                )
+            )
+            self._pending_bytes += size
+            self._pending[str(filename)] += 1
+        self._queue.put((filename, write, size))
+
+    def _wait_for(self: "WriteBehindStorage", filenames: Iterable[Any]) -> None:
+        """Wait for pending writes of the given files."""
+        keys = {str(filename) for filename in filenames}
+        with self._condition:
+            self._condition.wait_for(lambda: keys.isdisjoint(self._pending))
+
+    def generate_filename(
+        self: "WriteBehindStorage",
+        extension: str,
+        prefix: Optional[str] = None,
+        basename: Optional[str] = None,
+    ) -> Any:
+        """Generate filename."""
+        return self.inner_storage.generate_filename(
+            extension=extension,
+            prefix=prefix,
+            basename=basename,
+        )
+
+    def write_text(
+        self: "WriteBehindStorage",
+        filename: Any,
+        data: str,
+        encoding: Optional[str] = None,
+    ) -> int:
+        """Queue text for writing."""
+        self._submit(
+            filename,
+            lambda: self.inner_storage.write_text(filename, data, encoding),
+            len(data),
+        )
+        return len(data)
+
+    def write_bytes(
+        self: "WriteBehindStorage",
+        filename: Any,
+        data: bytes,
+    ) -> int:
+        """Queue bytes for writing.
+
+        Data, other than `bytes` (such as `memoryview`), is copied, as it
+        might be changed or released after this call returns.
+        """
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        self._submit(
+            filename,
+            lambda: self.inner_storage.write_bytes(filename, data),
+            len(data),
+        )
+        return len(data)
+
+    def copy_file(
+        self: "WriteBehindStorage",
+        filename: Any,
+        source: Union[str, os.PathLike],
+    ) -> int:
+        """Queue a copy of an existing file.
+
+        No data is held in memory, thus the copy does not count towards
+        `max_queue_bytes`. Source file shall not be changed (or removed)
+        until the copy is done.
+        """
+        self._submit(
+            filename,
+            lambda: self.inner_storage.copy_file(filename, source),
+            0,
+        )
+        return 0
+
+    def exists(self: "WriteBehindStorage", filename: Any) -> bool:
+        """Check if file exists (or is waiting to be written)."""
+        with self._condition:
+            if str(filename) in self._pending:
+                return True
+        return self.inner_storage.exists(filename)
+
+    def relpath(self: "WriteBehindStorage", filename: Any) -> str:
+        """Return relative path."""
+        return self.inner_storage.relpath(filename)
+
+    def abspath(self: "WriteBehindStorage", filename: Any) -> str:
+        """Return absolute path."""
+        return self.inner_storage.abspath(filename)
+
+    def unlink(self: "WriteBehindStorage", filename: Any) -> None:
+        """Delete the file, once its pending writes complete."""
+        self._wait_for([filename])
+        self.inner_storage.unlink(filename)
+
+    def unlink_many(
+        self: "WriteBehindStorage",
+        filenames: Iterable[Any],
+    ) -> List[Tuple[Any, Exception]]:
+        """Delete multiple files, once their pending writes complete."""
+        filenames = list(filenames)
+        self._wait_for(filenames)
+        return self.inner_storage.unlink_many(filenames)
+
+    def flush(self: "WriteBehindStorage") -> None:
+        """Wait for all pending writes to complete.
+
+        :raises WriteBehindError: If any of the writes (since the previous
+            `flush`) failed.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: not self._pending)
+            errors, self.errors = self.errors, []
+        if errors:
+            raise WriteBehindError(errors)
+
+    def close(self: "WriteBehindStorage") -> None:
+        """Flush and stop the background threads.
+
+        :raises WriteBehindError: If any of the writes failed.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            self.flush()
+        finally:
+            for _ in self._threads:
+                self._queue.put(None)
+            for thread in self._threads:
+                thread.join()
+            _INSTANCES.discard(self)
+
+    def __enter__(self: "WriteBehindStorage") -> "WriteBehindStorage":
+        return self
+
+    def __exit__(self: "WriteBehindStorage", *exc_info) -> None:
+        self.close()
+
+
+def _close(storage: WriteBehindStorage) -> None:
+    """Close the storage, logging failed writes."""
+    try:
+        storage.close()
+    except WriteBehindError as err:
+        LOGGER.error(str(err))
+
+
+@atexit.register
+def _close_all() -> None:
+    """Complete pending writes at interpreter exit."""
+    for storage in list(_INSTANCES):
+        _close(storage)
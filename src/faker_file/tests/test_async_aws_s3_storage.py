@@ -0,0 +1,152 @@
+import asyncio
+import unittest
+from typing import Any, Dict
+from unittest import mock
+
+import boto3
+from faker import Faker
+from moto.server import ThreadedMotoServer
+
+from ..providers.txt_file import TxtFileProvider
+from ..registry import FileRegistry
+from ..storages.async_aws_s3 import AsyncAWSS3Storage
+from .utils import AutoFreePortInt
+
+__author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
+__copyright__ = "2022-2025 Artur Barseghyan"
+__license__ = "MIT"
+__all__ = ("TestAsyncAWSS3StorageTestCase",)
+
+FAKER = Faker()
+FAKER.add_provider(TxtFileProvider)
+
+MOTO_HOST = "127.0.0.1"
+BUCKET_NAME = "testing"
+
+
+class TestAsyncAWSS3StorageTestCase(unittest.TestCase):
+    """Test `AsyncAWSS3Storage` against moto in server mode."""
+
+    server: ThreadedMotoServer
+    credentials: Dict[str, Any]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        port = int(AutoFreePortInt(host=MOTO_HOST))
+        cls.server = ThreadedMotoServer(ip_address=MOTO_HOST, port=port)
+        cls.server.start()
+        cls.credentials = {
+            "key_id": "testing",
+            "key_secret": "testing",
+            "region_name": "us-east-1",
+            "endpoint_url": f"http://{MOTO_HOST}:{port}",
+        }
+        boto3.client(
+            "s3",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+            region_name="us-east-1",
+            endpoint_url=cls.credentials["endpoint_url"],
+        ).create_bucket(Bucket=BUCKET_NAME)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.stop()
+        super().tearDownClass()
+
+    def get_storage(self) -> AsyncAWSS3Storage:
+        return AsyncAWSS3Storage(
+            bucket_name=BUCKET_NAME,
+            rel_path="tmp",
+            credentials=self.credentials,
+        )
+
+    def test_write_bytes(self: "TestAsyncAWSS3StorageTestCase") -> None:
+        async def _test() -> None:
+            async with self.get_storage() as storage:
+                filename = storage.generate_filename(extension="bin")
+                self.assertFalse(await storage.exists(filename))
+                self.assertEqual(
+                    await storage.write_bytes(filename, b"Lorem ipsum"), 11
+                )
+                self.assertTrue(await storage.exists(filename))
+                client = await storage.get_client()
+                response = await client.get_object(
+                    Bucket=BUCKET_NAME, Key=storage._get_key(filename)
+                )
+                async with response["Body"] as body:
+                    self.assertEqual(await body.read(), b"Lorem ipsum")
+                await storage.unlink(filename)
+                self.assertFalse(await storage.exists(filename))
+
+        asyncio.run(_test())
+
+    def test_write_text(self: "TestAsyncAWSS3StorageTestCase") -> None:
+        async def _test() -> None:
+            async with self.get_storage() as storage:
+                filename = storage.generate_filename(extension="txt")
+                self.assertEqual(
+                    await storage.write_text(filename, "Lørem"),
+                    len("Lørem".encode()),
+                )
+                self.assertTrue(await storage.exists(filename))
+                self.assertEqual(
+                    storage.abspath(filename),
+                    f"s3://{BUCKET_NAME}/{filename}",
+                )
+                self.assertEqual(
+                    storage.abspath(storage.abspath(filename)),
+                    storage.abspath(filename),
+                )
+                await storage.unlink(filename)
+
+        asyncio.run(_test())
+
+    def test_unlink_many(self: "TestAsyncAWSS3StorageTestCase") -> None:
+        async def _test() -> None:
+            async with self.get_storage() as storage:
+                filenames = [
+                    storage.generate_filename(extension="txt") for _ in range(5)
+                ]
+                await asyncio.gather(
+                    *(
+                        storage.write_text(filename, "Lorem ipsum")
+                        for filename in filenames
+                    )
+                )
+                for filename in filenames:
+                    self.assertTrue(await storage.exists(filename))
+
+                self.assertEqual(await storage.unlink_many(filenames), [])
+                for filename in filenames:
+                    self.assertFalse(await storage.exists(filename))
+
+        asyncio.run(_test())
+
+    def test_registry_aclean_up(self: "TestAsyncAWSS3StorageTestCase") -> None:
+        async def _test() -> None:
+            async with self.get_storage() as storage:
+                files = [
+                    await FAKER.atxt_file(storage=storage) for _ in range(3)
+                ]
+                for file in files:
+                    # Async storage files are not deleted by `remove`
+                    self.assertFalse(registry.remove(file))
+                    self.assertIsNotNone(registry.search(file))
+                self.assertEqual(
+                    registry.clean_up(), {"succeeded": 0, "failed": 3}
+                )
+                self.assertEqual(
+                    await registry.aclean_up(),
+                    {"succeeded": 3, "failed": 0},
+                )
+                for file in files:
+                    self.assertIsNone(registry.search(file))
+                    self.assertFalse(
+                        await storage.exists(file.data["filename"])
+                    )
+
+        registry = FileRegistry()
+        with mock.patch("faker_file.async_provider.FILE_REGISTRY", registry):
+            asyncio.run(_test())
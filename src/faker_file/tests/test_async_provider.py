@@ -0,0 +1,149 @@
+import asyncio
+import importlib
+import inspect
+import os
+import pkgutil
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Type, Union
+from unittest import mock
+
+from faker import Faker
+from parameterized import parameterized
+from PIL import Image
+
+from .. import providers
+from ..async_provider import ASYNC_METHOD_MARKER, ASYNC_METHOD_PREFIX
+from ..base import BytesValue, StringValue
+from ..providers.base.text_extractor import BaseTextExtractor
+from ..providers.image.pil_generator import PilImageGenerator
+from ..providers.pdf_file.generators.reportlab_generator import (
+    ReportlabPdfGenerator,
+)
+from ..registry import FileRegistry
+from ..storages.async_filesystem import AsyncFileSystemStorage
+
+__author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
+__copyright__ = "2022-2025 Artur Barseghyan"
+__license__ = "MIT"
+__all__ = ("AsyncProviderTestCase",)
+
+FAKER = Faker()
+SOURCE_DIR = tempfile.mkdtemp()
+TEXT_DIR_PATH = os.path.join(SOURCE_DIR, "text")
+IMAGE_DIR_PATH = os.path.join(SOURCE_DIR, "image")
+TXT_PATH = os.path.join(TEXT_DIR_PATH, "source.txt")
+PNG_PATH = os.path.join(IMAGE_DIR_PATH, "source.png")
+
+
+class PlainTextExtractor(BaseTextExtractor):
+    """Text extractor reading plain text files (Tika needs network)."""
+
+    def extract(self, source_file: Union[Path, str]) -> str:
+        with open(source_file) as _file:
+            return _file.read()
+
+
+# Arguments for methods with required arguments, by sync method name
+ASYNC_METHOD_KWARGS: Dict[str, Dict[str, Any]] = {
+    "augment_file_from_dir": {
+        "source_dir_path": TEXT_DIR_PATH,
+        "text_extractor_cls": PlainTextExtractor,
+    },
+    "augment_files_from_dir": {
+        "source_dir_path": TEXT_DIR_PATH,
+        "count": 2,
+        "text_extractor_cls": PlainTextExtractor,
+    },
+    "augment_image_from_path": {"path": PNG_PATH},
+    "augment_random_image_from_dir": {"source_dir_path": IMAGE_DIR_PATH},
+    "file_from_path": {"path": TXT_PATH},
+    "generic_file": {"content": "<p>{{text}}</p>", "extension": "html"},
+    "random_file_from_dir": {"source_dir_path": TEXT_DIR_PATH},
+    "pdf_file": {"pdf_generator_cls": ReportlabPdfGenerator},
+    **{
+        f"{extension}_file": {"image_generator_cls": PilImageGenerator}
+        for extension in ("bmp", "gif", "ico", "jpeg", "png", "tiff", "webp")
+    },
+}
+
+
+def get_async_methods() -> List[Tuple[Type, str]]:
+    """Get all generated async methods of all (importable) providers."""
+    methods = []
+    for module_info in pkgutil.walk_packages(
+        providers.__path__, f"{providers.__name__}."
+    ):
+        try:
+            module = importlib.import_module(module_info.name)
+        except (ImportError, OSError):
+            # Optional dependencies (or their system libraries) missing
+            continue
+        for cls in vars(module).values():
+            if not inspect.isclass(cls) or cls.__module__ != module.__name__:
+                continue
+            methods.extend(
+                (cls, name)
+                for name, func in vars(cls).items()
+                if getattr(func, ASYNC_METHOD_MARKER, None)
+            )
+    return methods
+
+
+class AsyncProviderTestCase(unittest.TestCase):
+    """Test awaitable provider methods."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        os.makedirs(TEXT_DIR_PATH, exist_ok=True)
+        os.makedirs(IMAGE_DIR_PATH, exist_ok=True)
+        with open(TXT_PATH, "w") as _file:
+            _file.write(FAKER.text())
+        Image.new("RGB", (64, 64), "red").save(PNG_PATH)
+
+    def test_async_methods_found(self) -> None:
+        """Test async methods are generated, including list returning."""
+        names = {name for _cls, name in get_async_methods()}
+        self.assertIn(f"{ASYNC_METHOD_PREFIX}txt_file", names)
+        self.assertIn(f"{ASYNC_METHOD_PREFIX}augment_files_from_dir", names)
+
+    @parameterized.expand(
+        get_async_methods(),
+        name_func=lambda func, num, param: (
+            f"{func.__name__}_{num}_{param.args[1]}"
+        ),
+    )
+    def test_async_method(self, provider_cls: Type, method_name: str) -> None:
+        """Test every generated async method, saved and raw."""
+        kwargs = ASYNC_METHOD_KWARGS.get(
+            method_name[len(ASYNC_METHOD_PREFIX) :], {}
+        )
+        method = getattr(provider_cls(FAKER), method_name)
+        storage = AsyncFileSystemStorage()
+        registry = FileRegistry()
+        with mock.patch("faker_file.async_provider.FILE_REGISTRY", registry):
+            result = asyncio.run(method(storage=storage, **kwargs))
+            raw_result = asyncio.run(
+                method(storage=storage, raw=True, **kwargs)
+            )
+
+        files = result if isinstance(result, list) else [result]
+        self.assertTrue(files)
+        for file in files:
+            self.assertIsInstance(file, StringValue)
+            self.assertIs(file.data["storage"], storage)
+            self.assertTrue(storage.sync_storage.exists(file.data["filename"]))
+            self.assertIsNotNone(registry.search(file))
+
+        raw_files = raw_result if isinstance(raw_result, list) else [raw_result]
+        self.assertEqual(len(raw_files), len(files))
+        for raw_file in raw_files:
+            self.assertIsInstance(raw_file, BytesValue)
+            self.assertGreater(len(raw_file), 0)
+            self.assertIsNone(registry.search(raw_file.data["filename"]))
+
+        self.assertEqual(
+            registry.clean_up(), {"succeeded": len(files), "failed": 0}
+        )
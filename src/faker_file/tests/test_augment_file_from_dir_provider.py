@@ -1,8 +1,18 @@
+import asyncio
 import os.path
 import tempfile
 import unittest
 from copy import deepcopy
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import pytest
 import tika
@@ -18,6 +28,7 @@ from ..providers.augment_file_from_dir import (
 from ..providers.augment_file_from_dir.augmenters.faker_augmenter import (
     DEFAULT_AUGMENTATION_PROBABILITY,
     DEFAULT_POOL_SIZE,
+    FakerWordAugmenter,
 )
 from ..providers.base.text_augmenter import BaseTextAugmenter
 from ..providers.base.text_extractor import BaseTextExtractor
@@ -293,6 +304,75 @@ class AugmentFileFromDirProviderTestCase(unittest.TestCase):
                 text_augmenter_cls=MyTextAugmenter,
             )
 
+    def test_augment_files_from_dir(
+        self: "AugmentFileFromDirProviderTestCase",
+    ) -> None:
+        """Test `augment_files_from_dir` augments texts in one batch."""
+        calls: List[List[str]] = []
+
+        class MyTextAugmenter(BaseTextAugmenter):
+            """Test text augmenter."""
+
+            def augment(self, text: str) -> str:
+                raise AssertionError("`augment_many` should be used.")
+
+            def augment_many(self, texts: Iterable[str]) -> List[str]:
+                texts = list(texts)
+                calls.append(texts)
+                return [text.upper() for text in texts]
+
+        files = AugmentFileFromDirProvider(_FAKER).augment_files_from_dir(
+            source_dir_path=SOURCE_DIR_PATH,
+            count=3,
+            extensions={"txt"},
+            storage=FS_STORAGE,
+            text_augmenter_cls=MyTextAugmenter,
+        )
+        self.assertEqual(len(files), 3)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(calls[0]), 3)
+        for _file in files:
+            self.assertTrue(FS_STORAGE.exists(_file))
+
+        _file = AugmentFileFromDirProvider(_FAKER).augment_file_from_dir(
+            source_dir_path=SOURCE_DIR_PATH,
+            extensions={"txt"},
+            storage=FS_STORAGE,
+            text_augmenter_cls=MyTextAugmenter,
+        )
+        self.assertTrue(FS_STORAGE.exists(_file))
+        self.assertEqual(len(calls), 2)
+
+        files = asyncio.run(
+            AugmentFileFromDirProvider(_FAKER).aaugment_files_from_dir(
+                source_dir_path=SOURCE_DIR_PATH,
+                count=3,
+                extensions={"txt"},
+                storage=FS_STORAGE,
+                text_augmenter_cls=MyTextAugmenter,
+            )
+        )
+        self.assertEqual(len(files), 3)
+        self.assertEqual(len(calls), 3)
+        for _file in files:
+            self.assertTrue(FS_STORAGE.exists(_file))
+            self.assertIsNotNone(FILE_REGISTRY.search(_file))
+
+    def test_augment_many(
+        self: "AugmentFileFromDirProviderTestCase",
+    ) -> None:
+        """Test `augment_many`."""
+        augmenter = FakerWordAugmenter(
+            augmentation_probability=1.0,
+            generator=_FAKER,
+        )
+        texts = ["lorem ipsum dolor", "", "sit amet"]
+        augmented = augmenter.augment_many(texts)
+        self.assertEqual(len(augmented), len(texts))
+        self.assertEqual(augmented[1], "")
+        self.assertNotEqual(augmented[0], texts[0])
+        self.assertEqual(augmenter.augment_many([]), [])
+
     @parameterized.expand(
         # "provider, method_name, kwargs, storage",
         __RAW_PARAMETRIZED_DATA,
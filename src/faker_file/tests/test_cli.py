@@ -1,13 +1,29 @@
+import hashlib
+import io
+import json
 import logging
+import os
 import re
 import subprocess
+import sys
+import tarfile
+import tempfile
 import unittest
 from importlib import import_module, reload
 from typing import Union
+from unittest import mock
 
 from parameterized import parameterized
 
+from ..cli.batch import run_batch, validate_batch_manifest
 from ..cli.command import main
+from ..cli.helpers import (
+    PROVIDERS,
+    generate_files,
+    get_manifest,
+    get_manifest_path,
+    write_tar_stream,
+)
 from ..registry import FILE_REGISTRY
 from ..storages.filesystem import FileSystemStorage
 
@@ -281,6 +297,14 @@ class TestCLI(unittest.TestCase):
         cmd = ["faker-file", "generate-completion"]
         res = subprocess.check_output(cmd).strip()
         self.assertTrue(res)
+        file_path = os.path.join(
+            os.path.expanduser("~"), "faker_file_completion.sh"
+        )
+        with open(file_path) as file:
+            completion_script = file.read()
+        for option in ("--workers", "--seed", "--stdout", "--tar-stream"):
+            self.assertIn(option, completion_script)
+        self.assertIn("batch", completion_script)
 
     def test_cli_version(self: "TestCLI") -> None:
         """Test CLI, version."""
@@ -295,3 +319,272 @@ class TestCLI(unittest.TestCase):
         with self.assertRaises(SystemExit):
             main()
         reload(_module)
+
+    @parameterized.expand(
+        # "target",
+        [
+            ("faker_file.cli.helpers.get_manifest",),
+            ("faker_file.cli.helpers.get_provider_method",),
+        ]
+    )
+    def test_missing_optional_dependency(
+        self: "TestCLI",
+        target: str,
+    ) -> None:
+        """Test missing dependencies of providers end with a message."""
+        with (
+            mock.patch(target, side_effect=ImportError("No module")),
+            mock.patch.object(sys, "argv", ["faker-file", "txt_file"]),
+            mock.patch("builtins.print") as _print,
+            self.assertRaises(SystemExit),
+        ):
+            main()
+        self.assertIn("pip install faker-file[common]", _print.call_args[0][0])
+
+    def test_manifest_cache(self: "TestCLI") -> None:
+        """Test CLI manifest is cached on disk."""
+        with mock.patch.dict(
+            os.environ, {"FAKER_FILE_CACHE_DIR": tempfile.mkdtemp()}
+        ):
+            get_manifest.cache_clear()
+            manifest = get_manifest()
+            self.assertTrue(os.path.exists(get_manifest_path()))
+            self.assertEqual(set(manifest), set(PROVIDERS))
+            self.assertEqual(
+                manifest["docx_file"]["max_nb_chars"],
+                {"default": 10_000, "type": int},
+            )
+            self.assertEqual(
+                manifest["graphic_png_file"]["size"],
+                {"default": (256, 256), "type": None},
+            )
+            # Required arguments default to None
+            self.assertIsNone(manifest["generic_file"]["basename"]["default"])
+
+            get_manifest.cache_clear()
+            with mock.patch(
+                "faker_file.cli.helpers.build_manifest",
+                side_effect=AssertionError("Manifest shall be cached"),
+            ):
+                self.assertEqual(get_manifest(), manifest)
+
+            with self.subTest("Broken cache is rebuilt"):
+                with open(get_manifest_path(), "w") as file:
+                    file.write("{")
+                get_manifest.cache_clear()
+                self.assertEqual(get_manifest(), manifest)
+        get_manifest.cache_clear()
+
+    def test_lazy_provider_imports(self: "TestCLI") -> None:
+        """Test CLI only imports the provider being used."""
+        code = (
+            "import sys; "
+            "from faker_file.cli.helpers import PROVIDERS, get_manifest; "
+            "get_manifest(); "
+            "PROVIDERS['txt_file']; "
+            "print(sorted("
+            "m for m in sys.modules if m.startswith('faker_file.providers.')"
+            " and m.endswith('_file')))"
+        )
+        env = dict(os.environ, FAKER_FILE_CACHE_DIR=tempfile.mkdtemp())
+        # Build the manifest first
+        subprocess.check_output([sys.executable, "-c", code], env=env)
+        res = subprocess.check_output([sys.executable, "-c", code], env=env)
+        self.assertEqual(
+            res.decode().strip(), "['faker_file.providers.txt_file']"
+        )
+
+    def test_generate_files(self: "TestCLI") -> None:
+        """Test generating files in a process pool."""
+        contents = {}
+        for workers in (1, 2):
+            filenames = list(
+                generate_files("txt_file", nb_files=4, workers=workers, seed=42)
+            )
+            self.assertEqual(len(set(filenames)), 4)
+            contents[workers] = []
+            for filename in filenames:
+                with open(filename) as file:
+                    contents[workers].append(file.read())
+                FS_STORAGE.unlink(filename)
+        # Same content, regardless of the number of workers
+        self.assertEqual(contents[1], contents[2])
+        self.assertEqual(len(set(contents[1])), 4)
+
+    def test_cli_workers(self: "TestCLI") -> None:
+        """Test CLI, `--workers` and `--seed` options."""
+        cmd = [
+            "faker-file",
+            "txt_file",
+            "--nb_files=3",
+            "--workers=2",
+            "--seed=42",
+        ]
+        res = subprocess.run(cmd, capture_output=True, check=True)
+        lines = res.stdout.decode().strip().splitlines()
+        self.assertEqual(len(lines), 3)
+        for counter, line in enumerate(lines, start=1):
+            self.assertIn(f"({counter} of 3)", line)
+            filename = extract_filename(line)
+            self.assertTrue(FS_STORAGE.exists(filename))
+            FS_STORAGE.unlink(filename)
+        self.assertIn("Generated 3 txt_file file(s) in", res.stderr.decode())
+
+    def test_run_batch(self: "TestCLI") -> None:
+        """Test batch job."""
+        with tempfile.TemporaryDirectory() as root_path:
+            manifest = validate_batch_manifest(
+                {
+                    "seed": 42,
+                    "storages": {
+                        "local": {
+                            "class": (
+                                "faker_file.storages.filesystem."
+                                "FileSystemStorage"
+                            ),
+                            "kwargs": {"root_path": root_path},
+                        },
+                    },
+                    "entries": [
+                        {"provider": "txt_file", "count": 3},
+                        {
+                            "provider": "csv_file",
+                            "count": 2,
+                            "kwargs": {"num_rows": 3},
+                            "storage": "local",
+                        },
+                        {
+                            "provider": "txt_file",
+                            "kwargs": {"wrap_chars_after": "x"},
+                        },
+                    ],
+                }
+            )
+            indexes = {}
+            for workers in (1, 2):
+                index_file = io.StringIO()
+                summary = run_batch(manifest, index_file, workers=workers)
+                self.assertEqual(summary, {"succeeded": 5, "failed": 1})
+                records = [
+                    json.loads(line)
+                    for line in index_file.getvalue().splitlines()
+                ]
+                self.assertEqual(
+                    [record["provider"] for record in records],
+                    ["txt_file"] * 3 + ["csv_file"] * 2 + ["txt_file"],
+                )
+                self.assertIn("error", records[-1])
+                for record in records[:-1]:
+                    with open(record["path"], "rb") as file:
+                        content = file.read()
+                    self.assertEqual(len(content), record["size"])
+                    self.assertEqual(
+                        hashlib.sha256(content).hexdigest(), record["sha256"]
+                    )
+                    os.remove(record["path"])
+                for record in records[3:5]:
+                    self.assertTrue(record["path"].startswith(root_path))
+                    self.assertEqual(record["kwargs"], {"num_rows": 3})
+                indexes[workers] = [record.get("sha256") for record in records]
+            # Same content, regardless of the number of workers
+            self.assertEqual(indexes[1], indexes[2])
+
+    @parameterized.expand(
+        [
+            ([],),
+            ({"entries": []},),
+            ({"entries": [{"provider": "unknown_file"}]},),
+            ({"entries": [{"provider": "txt_file", "count": -1}]},),
+            ({"entries": [{"provider": "txt_file", "storage": "unknown"}]},),
+            ({"entries": [{"provider": "txt_file", "kwargs": {"raw": True}}]},),
+            (
+                {
+                    "storages": {"local": {}},
+                    "entries": [{"provider": "txt_file"}],
+                },
+            ),
+        ]
+    )
+    def test_validate_batch_manifest_errors(
+        self: "TestCLI", manifest: dict
+    ) -> None:
+        """Test invalid batch manifests."""
+        with self.assertRaises(ValueError):
+            validate_batch_manifest(manifest)
+
+    def test_cli_batch(self: "TestCLI") -> None:
+        """Test CLI, `batch` command."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manifest_path = os.path.join(temp_dir, "manifest.json")
+            index_path = os.path.join(temp_dir, "index.jsonl")
+            with open(manifest_path, "w") as file:
+                json.dump(
+                    {
+                        "workers": 2,
+                        "entries": [{"provider": "txt_file", "count": 3}],
+                    },
+                    file,
+                )
+            cmd = [
+                "faker-file",
+                "batch",
+                manifest_path,
+                f"--index={index_path}",
+            ]
+            res = subprocess.run(cmd, capture_output=True, check=True)
+            self.assertIn("Generated 3 of 3 file(s) in", res.stderr.decode())
+            with open(index_path) as file:
+                records = [json.loads(line) for line in file]
+            self.assertEqual(len(records), 3)
+            for record in records:
+                self.assertTrue(FS_STORAGE.exists(record["path"]))
+                FS_STORAGE.unlink(record["path"])
+
+    def test_generate_files_raw(self: "TestCLI") -> None:
+        """Test generating files with `raw` set to True."""
+        files = list(
+            generate_files("txt_file", nb_files=3, workers=2, seed=42, raw=True)
+        )
+        self.assertEqual(len(files), 3)
+        for name, content in files:
+            self.assertTrue(name.endswith(".txt"))
+            self.assertIsInstance(content, bytes)
+            self.assertFalse(FS_STORAGE.exists(name))
+        fileobj = io.BytesIO()
+        self.assertEqual(write_tar_stream(files, fileobj), 3)
+        fileobj.seek(0)
+        with tarfile.open(fileobj=fileobj) as tar:
+            self.assertEqual(
+                [
+                    (member.name, tar.extractfile(member).read())
+                    for member in tar.getmembers()
+                ],
+                files,
+            )
+
+    def test_cli_stdout(self: "TestCLI") -> None:
+        """Test CLI, `--stdout` option."""
+        cmd = ["faker-file", "txt_file", "--stdout", "--content=Lorem ipsum"]
+        res = subprocess.run(cmd, capture_output=True, check=True)
+        self.assertEqual(res.stdout, b"Lorem ipsum")
+
+        cmd = ["faker-file", "txt_file", "--stdout", "--nb_files=2"]
+        res = subprocess.run(cmd, capture_output=True)
+        self.assertNotEqual(res.returncode, 0)
+
+    def test_cli_tar_stream(self: "TestCLI") -> None:
+        """Test CLI, `--tar-stream` option."""
+        cmd = [
+            "faker-file",
+            "txt_file",
+            "--nb_files=3",
+            "--workers=2",
+            "--tar-stream",
+        ]
+        res = subprocess.run(cmd, capture_output=True, check=True)
+        with tarfile.open(fileobj=io.BytesIO(res.stdout)) as tar:
+            members = tar.getmembers()
+            self.assertEqual(len(members), 3)
+            for member in members:
+                self.assertTrue(member.name.endswith(".txt"))
+                self.assertTrue(tar.extractfile(member).read())
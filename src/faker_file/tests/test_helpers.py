@@ -1,12 +1,44 @@
+import os
+import tempfile
 import unittest
 from copy import deepcopy
+from typing import List
+
+import reportlab
+from faker import Faker
+from reportlab.pdfbase import pdfmetrics
 
 from ..helpers import random_pop
+from ..providers.base.text_extractor import BaseTextExtractor
+from ..providers.helpers.dir_index import (
+    clear_dir_index_cache,
+    get_dir_index,
+)
+from ..providers.helpers.extraction_cache import (
+    MemoryExtractionCache,
+    SqliteExtractionCache,
+    TieredExtractionCache,
+)
+from ..providers.helpers.fonts import (
+    clear_pil_font_cache,
+    get_pil_font,
+    warm_up_pil_font_cache,
+)
+from ..providers.pdf_file.generators.reportlab_generator import (
+    get_paragraph_style,
+    register_font,
+)
+from ..providers.random_file_from_dir import RandomFileFromDirProvider
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2022-2025 Artur Barseghyan"
 __license__ = "MIT"
-__all__ = ("HelpersTestCase",)
+__all__ = (
+    "DirIndexTestCase",
+    "ExtractionCacheTestCase",
+    "FontsTestCase",
+    "HelpersTestCase",
+)
 
 
 class HelpersTestCase(unittest.TestCase):
@@ -26,3 +58,214 @@ class HelpersTestCase(unittest.TestCase):
             element = random_pop(my_list)
             self.assertIn(element, orig_my_list)
             self.assertNotIn(element, my_list)
+
+
+class FontsTestCase(unittest.TestCase):
+    """Test font helpers test case."""
+
+    font_path = os.path.join(
+        os.path.dirname(reportlab.__file__), "fonts", "Vera.ttf"
+    )
+
+    def setUp(self: "FontsTestCase") -> None:
+        clear_pil_font_cache()
+
+    def tearDown(self: "FontsTestCase") -> None:
+        clear_pil_font_cache()
+
+    def test_get_pil_font(self: "FontsTestCase") -> None:
+        """Test `get_pil_font`."""
+        font = get_pil_font(self.font_path, 12)
+        self.assertEqual(font.size, 12)
+        self.assertIs(get_pil_font(self.font_path, 12), font)
+        self.assertIsNot(get_pil_font(self.font_path, 14), font)
+
+    def test_warm_up_pil_font_cache(self: "FontsTestCase") -> None:
+        """Test `warm_up_pil_font_cache`."""
+        warm_up_pil_font_cache([(self.font_path, 12), (self.font_path, 14, 0)])
+        font = get_pil_font(self.font_path, 14)
+        self.assertEqual(font.size, 14)
+        self.assertIs(get_pil_font(self.font_path, 14, 0), font)
+
+    def test_register_reportlab_font(self: "FontsTestCase") -> None:
+        """Test `register_font` and `get_paragraph_style`."""
+        register_font("FontsTestCaseVera", self.font_path)
+        font = pdfmetrics.getFont("FontsTestCaseVera")
+        register_font("FontsTestCaseVera", self.font_path)
+        self.assertIs(pdfmetrics.getFont("FontsTestCaseVera"), font)
+
+        style = get_paragraph_style("FontsTestCaseVera", "Heading2")
+        self.assertEqual(style.fontName, "FontsTestCaseVera")
+        self.assertIs(
+            get_paragraph_style("FontsTestCaseVera", "Heading2"), style
+        )
+        self.assertNotEqual(
+            get_paragraph_style("FontsTestCaseVera").fontName, "Helvetica"
+        )
+
+
+class DirIndexTestCase(unittest.TestCase):
+    """Test directory index test case."""
+
+    def setUp(self: "DirIndexTestCase") -> None:
+        clear_dir_index_cache()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dir_path = self.temp_dir.name
+        os.makedirs(os.path.join(self.dir_path, "sub"))
+        for name, size in (
+            ("a.txt", 1),
+            ("b.pdf", 10),
+            (os.path.join("sub", "c.txt"), 100),
+        ):
+            with open(os.path.join(self.dir_path, name), "wb") as _file:
+                _file.write(b"x" * size)
+
+    def tearDown(self: "DirIndexTestCase") -> None:
+        self.temp_dir.cleanup()
+        clear_dir_index_cache()
+
+    def test_get_dir_index(self: "DirIndexTestCase") -> None:
+        """Test `get_dir_index`."""
+        index = get_dir_index(self.dir_path)
+        self.assertEqual(
+            sorted(index.paths),
+            [
+                os.path.join(self.dir_path, "a.txt"),
+                os.path.join(self.dir_path, "b.pdf"),
+            ],
+        )
+        self.assertIs(get_dir_index(self.dir_path), index)
+        self.assertEqual(len(get_dir_index(self.dir_path, {"txt"})), 1)
+        self.assertEqual(len(get_dir_index(self.dir_path, recursive=True)), 3)
+        self.assertIn(index.choice(), index.paths)
+
+    def test_get_dir_index_invalidation(self: "DirIndexTestCase") -> None:
+        """Test `get_dir_index` invalidation."""
+        index = get_dir_index(self.dir_path)
+        os.remove(os.path.join(self.dir_path, "a.txt"))
+        # Make sure mtime changes, regardless of file system resolution
+        os.utime(self.dir_path, (0, 0))
+        self.assertIs(get_dir_index(self.dir_path, ttl=60), index)
+        new_index = get_dir_index(self.dir_path)
+        self.assertIsNot(new_index, index)
+        self.assertEqual(len(new_index), 1)
+
+    def test_choice_weights(self: "DirIndexTestCase") -> None:
+        """Test `DirIndex.choice` with weights."""
+        index = get_dir_index(self.dir_path, recursive=True)
+        self.assertTrue(index.choice(weights={"pdf": 1}).endswith("b.pdf"))
+        self.assertTrue(
+            all(
+                index.choice(weights={"txt": 1}).endswith(".txt")
+                for _ in range(20)
+            )
+        )
+        self.assertIn(index.choice(weights="size"), index.paths)
+        with self.assertRaises(IndexError):
+            index.choice(weights={"docx": 1})
+        with self.assertRaises(ValueError):
+            index.choice(weights="name")
+
+    def test_choice_seeded(self: "DirIndexTestCase") -> None:
+        """Test `DirIndex.choice` is reproducible under `seed_instance`."""
+        index = get_dir_index(self.dir_path, recursive=True)
+        self.assertEqual(index.paths, sorted(index.paths))
+
+        def _pick(seed: int) -> List[bytes]:
+            faker = Faker()
+            faker.add_provider(RandomFileFromDirProvider)
+            faker.seed_instance(seed)
+            return [
+                faker.random_file_from_dir(
+                    source_dir_path=self.dir_path,
+                    recursive=True,
+                    raw=True,
+                )
+                for _ in range(20)
+            ]
+
+        self.assertEqual(_pick(42), _pick(42))
+        self.assertEqual(len(set(_pick(42))), 3)
+
+
+class ExtractionCacheTestCase(unittest.TestCase):
+    """Test extraction cache test case."""
+
+    def setUp(self: "ExtractionCacheTestCase") -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "a.txt")
+        with open(self.file_path, "w") as _file:
+            _file.write("Lorem ipsum")
+
+    def tearDown(self: "ExtractionCacheTestCase") -> None:
+        self.temp_dir.cleanup()
+
+    def test_memory_cache(self: "ExtractionCacheTestCase") -> None:
+        """Test `MemoryExtractionCache`."""
+        cache = MemoryExtractionCache(maxsize=2)
+        cache.set("a", "A")
+        cache.set("b", "B")
+        self.assertEqual(cache.get("a"), "A")
+        cache.set("c", "C")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "A")
+        self.assertEqual(cache.get("c"), "C")
+
+    def test_tiered_cache(self: "ExtractionCacheTestCase") -> None:
+        """Test `TieredExtractionCache` with `SqliteExtractionCache`."""
+        db_path = os.path.join(self.temp_dir.name, "cache.sqlite3")
+        disk_cache = SqliteExtractionCache(db_path)
+        disk_cache.set("a", "A")
+        disk_cache.close()
+
+        memory_cache = MemoryExtractionCache()
+        disk_cache = SqliteExtractionCache(db_path)
+        cache = TieredExtractionCache([memory_cache, disk_cache])
+        self.assertIsNone(memory_cache.get("a"))
+        self.assertEqual(cache.get("a"), "A")
+        self.assertEqual(memory_cache.get("a"), "A")
+        self.assertIsNone(cache.get("b"))
+        cache.clear()
+        self.assertIsNone(disk_cache.get("a"))
+        disk_cache.close()
+
+    def test_extract_cached(self: "ExtractionCacheTestCase") -> None:
+        """Test `BaseTextExtractor.extract_cached`."""
+        calls = []
+
+        class MyTextExtractor(BaseTextExtractor):
+            """Test text extractor."""
+
+            def extract(self, source_file):
+                calls.append(source_file)
+                with open(source_file) as _file:
+                    return _file.read()
+
+        # No cache by default
+        extractor = MyTextExtractor()
+        extractor.extract_cached(self.file_path)
+        extractor.extract_cached(self.file_path)
+        self.assertEqual(len(calls), 2)
+
+        for cache_by_content in (False, True):
+            calls.clear()
+            with open(self.file_path, "w") as _file:
+                _file.write("Lorem ipsum")
+            extractor = MyTextExtractor(
+                cache=MemoryExtractionCache(),
+                cache_by_content=cache_by_content,
+            )
+            self.assertEqual(
+                extractor.extract_cached(self.file_path), "Lorem ipsum"
+            )
+            self.assertEqual(
+                extractor.extract_cached(self.file_path), "Lorem ipsum"
+            )
+            self.assertEqual(len(calls), 1)
+
+            with open(self.file_path, "w") as _file:
+                _file.write("Dolor sit amet")
+            self.assertEqual(
+                extractor.extract_cached(self.file_path), "Dolor sit amet"
+            )
+            self.assertEqual(len(calls), 2)
@@ -9,6 +9,7 @@ from importlib import import_module, reload
 from io import BytesIO
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from unittest import mock
 from xml.etree import ElementTree
 
 import pytest
@@ -18,7 +19,13 @@ from parameterized import parameterized
 from pathy import use_fs
 from PIL import Image, ImageDraw
 
-from ..base import DEFAULT_REL_PATH, DynamicTemplate, pystr_format_func
+from ..base import (
+    DEFAULT_REL_PATH,
+    BytesValue,
+    DynamicTemplate,
+    StringValue,
+    pystr_format_func,
+)
 from ..constants import (
     DEFAULT_FILE_ENCODING,
     DEFAULT_FONT_NAME,
@@ -332,6 +339,7 @@ from ..providers.helpers.inner import (
     create_inner_xml_file,
     create_inner_zip_file,
     fuzzy_choice_create_inner_file,
+    get_inner_provider,
     list_create_inner_file,
 )
 from ..providers.ico_file import GraphicIcoFileProvider, IcoFileProvider
@@ -572,6 +580,13 @@ def create_test_files():
     )
 
 
+class CustomWordProvider(BaseProvider):
+    """Custom provider, used in templates of inner files."""
+
+    def custom_word(self: "CustomWordProvider") -> str:
+        return f"custom-{self.random_int(0, 9)}"
+
+
 class ProvidersTestCase(unittest.TestCase):
     """Providers test case."""
 
@@ -2376,6 +2391,158 @@ class ProvidersTestCase(unittest.TestCase):
 
         self.assertTrue(FS_STORAGE.exists(_file))
 
+    @parameterized.expand(
+        # "provider, method_name",
+        [
+            (ZipFileProvider, "zip_file"),
+            (TarFileProvider, "tar_file"),
+            (EmlFileProvider, "eml_file"),
+        ],
+    )
+    def test_archive_inner_files_in_memory(
+        self: "ProvidersTestCase",
+        provider: Type[FileProvider],
+        method_name: str,
+    ) -> None:
+        """Test archive providers do not write inner files to storage."""
+        _method = getattr(provider(None), method_name)
+        _file = _method(
+            options={
+                "count": 3,
+                "create_inner_file_func": create_inner_docx_file,
+            },
+        )
+
+        self.assertTrue(FS_STORAGE.exists(_file))
+        self.assertEqual(len(_file.data["inner"]), 3)
+        for _inner_path, _inner_file in _file.data["inner"].items():
+            self.assertIsInstance(_inner_file, BytesValue)
+            self.assertFalse(FS_STORAGE.exists(_inner_path))
+
+    @parameterized.expand(
+        # "provider, method_name, executor",
+        [
+            (ZipFileProvider, "zip_file", "thread"),
+            (ZipFileProvider, "zip_file", "process"),
+            (TarFileProvider, "tar_file", "thread"),
+            (EmlFileProvider, "eml_file", "thread"),
+        ],
+    )
+    def test_archive_inner_files_parallel(
+        self: "ProvidersTestCase",
+        provider: Type[FileProvider],
+        method_name: str,
+        executor: str,
+    ) -> None:
+        """Test archive providers generate inner files in parallel."""
+        _contents = []
+        for _workers in (3, 2):
+            _faker = Faker()
+            _faker.seed_instance(42)
+            _method = getattr(provider(_faker), method_name)
+            _file = _method(
+                raw=True,
+                options={
+                    "count": 6,
+                    "create_inner_file_func": create_inner_txt_file,
+                    "workers": _workers,
+                    "executor": executor,
+                },
+            )
+            self.assertEqual(len(_file.data["inner"]), 6)
+            _contents.append(
+                [_f.data["content"] for _f in _file.data["inner"].values()]
+            )
+
+        # Same seed: same content in same order, regardless of workers
+        self.assertEqual(_contents[0], _contents[1])
+
+    @parameterized.expand(
+        # "executor",
+        [
+            ("thread",),
+            ("process",),
+        ],
+    )
+    def test_archive_inner_files_parallel_custom_provider(
+        self: "ProvidersTestCase",
+        executor: str,
+    ) -> None:
+        """Test workers get custom providers of the parent generator."""
+        _faker = Faker()
+        _faker.add_provider(CustomWordProvider)
+        _file = ZipFileProvider(_faker).zip_file(
+            raw=True,
+            options={
+                "count": 4,
+                "create_inner_file_func": create_inner_txt_file,
+                "create_inner_file_args": {"content": "{{custom_word}}"},
+                "workers": 2,
+                "executor": executor,
+            },
+        )
+        for _inner_file in _file.data["inner"].values():
+            self.assertRegex(_inner_file.data["content"], r"^custom-\d$")
+
+    def test_get_inner_provider(self: "ProvidersTestCase") -> None:
+        """Test inner functions reuse provider instances."""
+        _faker = Faker()
+        _provider = get_inner_provider(TxtFileProvider, _faker)
+        self.assertIs(get_inner_provider(TxtFileProvider, _faker), _provider)
+        self.assertIsNot(
+            get_inner_provider(TxtFileProvider, Faker()), _provider
+        )
+        self.assertIsInstance(
+            get_inner_provider(DocxFileProvider, _faker), DocxFileProvider
+        )
+        self.assertIs(
+            get_inner_provider(TxtFileProvider),
+            get_inner_provider(TxtFileProvider),
+        )
+
+        with mock.patch.object(
+            TxtFileProvider, "txt_file", autospec=True
+        ) as _txt_file:
+            create_inner_txt_file(generator=_faker, raw=True)
+            create_inner_txt_file(generator=_faker, raw=True)
+        self.assertIs(_txt_file.call_args_list[0][0][0], _provider)
+        self.assertIs(_txt_file.call_args_list[1][0][0], _provider)
+
+    @parameterized.expand(
+        # "provider, method_name, kwargs, storage",
+        [
+            (ZipFileProvider, "zip_file", {}, None),
+            (ZipFileProvider, "zip_file", {}, PATHY_FS_STORAGE),
+            (TarFileProvider, "tar_file", {}, None),
+            (TarFileProvider, "tar_file", {"compression": "gz"}, None),
+            (TarFileProvider, "tar_file", {}, PATHY_FS_STORAGE),
+        ],
+    )
+    def test_archive_stream(
+        self: "ProvidersTestCase",
+        provider: Type[FileProvider],
+        method_name: str,
+        kwargs: Dict[str, Any],
+        storage: Optional[BaseStorage] = None,
+    ) -> None:
+        """Test archive providers in stream mode."""
+        _method = getattr(provider(None), method_name)
+        _file = _method(
+            storage=storage,
+            stream=True,
+            options={
+                "count": 3,
+                "create_inner_file_func": create_inner_docx_file,
+            },
+            **kwargs,
+        )
+
+        self.assertTrue((storage or FS_STORAGE).exists(_file))
+        self.assertEqual(len(_file.data["files"]), 3)
+        for _inner_file in _file.data["inner"].values():
+            self.assertIsInstance(_inner_file, StringValue)
+            self.assertNotIn("content", _inner_file.data)
+
     @parameterized.expand(
         # "module_path, "
         # "module_name, "
@@ -3770,6 +3937,7 @@ class XMLFileProviderTestCase(unittest.TestCase):
 
         # Verify the XML is valid by parsing it
         from xml.etree import ElementTree
+
         try:
             ElementTree.fromstring(xml_content)
         except ElementTree.ParseError as e:
@@ -3789,6 +3957,7 @@ class XMLFileProviderTestCase(unittest.TestCase):
 
         for edge_case in edge_cases:
             with self.subTest(edge_case=edge_case):
+
                 class EdgeCaseProvider(BaseProvider):
                     def edge_text(self, _text: str = edge_case) -> str:
                         return _text
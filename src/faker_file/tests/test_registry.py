@@ -1,11 +1,16 @@
+import asyncio
 import io
 import logging
 import unittest
+from typing import Any, Iterable, List, Tuple
 
 from faker import Faker
 
+from ..base import BytesValue, StringValue
 from ..providers.txt_file import TxtFileProvider
-from ..registry import FILE_REGISTRY, LOGGER
+from ..registry import FILE_REGISTRY, LOGGER, FileRegistry
+from ..storages.async_filesystem import AsyncFileSystemStorage
+from ..storages.filesystem import FileSystemStorage
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2022-2025 Artur Barseghyan"
@@ -17,6 +22,23 @@ FAKER = Faker()
 FAKER.add_provider(TxtFileProvider)
 
 
+class NativeAsyncStorage:
+    """Async storage without `sync_storage`."""
+
+    sync_storage = None
+
+    def __init__(self) -> None:
+        self.storage = FileSystemStorage()
+
+    async def unlink(self, filename: Any) -> None:
+        self.storage.unlink(filename)
+
+    async def unlink_many(
+        self, filenames: Iterable[Any]
+    ) -> List[Tuple[Any, Exception]]:
+        return self.storage.unlink_many(filenames)
+
+
 class RegistryTestCase(unittest.TestCase):
     """Test `registry` module."""
 
@@ -92,3 +114,145 @@ class RegistryTestCase(unittest.TestCase):
 
         # Clean up by removing the handler
         LOGGER.removeHandler(handler)
+
+    def test_lightweight_entries(self):
+        txt_file = FAKER.txt_file()
+        entry = FILE_REGISTRY.search(txt_file)
+        self.assertEqual(entry, txt_file)
+        self.assertNotIn("content", entry.data)
+        self.assertIn("content", txt_file.data)
+        self.assertEqual(
+            entry.data["payload_size"],
+            len(txt_file.data["content"].encode("utf-8")),
+        )
+        self.assertTrue(FILE_REGISTRY.remove(str(txt_file)))
+
+    def test_max_entries(self):
+        registry = FileRegistry(max_entries=2)
+        txt_file_1 = FAKER.txt_file()
+        txt_file_2 = FAKER.txt_file()
+        txt_file_3 = FAKER.txt_file()
+        for txt_file in (txt_file_1, txt_file_2, txt_file_3):
+            registry.add(txt_file)
+
+        self.assertIsNone(registry.search(txt_file_1))
+        self.assertIsNotNone(registry.search(txt_file_2))
+        self.assertIsNotNone(registry.search(txt_file_3))
+
+        # Forgotten file is not deleted
+        self.assertTrue(txt_file_1.data["storage"].exists(txt_file_1))
+        registry.clean_up()
+        self.assertFalse(txt_file_2.data["storage"].exists(txt_file_2))
+
+    def test_retain_content(self):
+        txt_file_1 = FAKER.txt_file(content="a" * 1_000)
+        txt_file_2 = FAKER.txt_file(content="b" * 1_000)
+        registry = FileRegistry(retain_content=True, max_bytes=1_500)
+        registry.add(txt_file_1)
+        self.assertIs(registry.search(txt_file_1), txt_file_1)
+
+        registry.add(txt_file_2)
+        self.assertNotIn("content", registry.search(txt_file_1).data)
+        self.assertEqual(
+            registry.search(txt_file_1).data["payload_size"], 1_000
+        )
+        self.assertIs(registry.search(txt_file_2), txt_file_2)
+        registry.clean_up()
+
+    def test_max_bytes_payload_size(self):
+        # 2 bytes per character, once encoded
+        txt_file_1 = FAKER.txt_file(content="é" * 500)
+        txt_file_2 = FAKER.txt_file(content="ü" * 500)
+        registry = FileRegistry(retain_content=True, max_bytes=1_500)
+        registry.add(txt_file_1)
+        self.assertEqual(txt_file_1.data["payload_size"], 1_000)
+        self.assertIs(registry.search(txt_file_1), txt_file_1)
+
+        registry.add(txt_file_2)
+        self.assertNotIn("content", registry.search(txt_file_1).data)
+        self.assertIs(registry.search(txt_file_2), txt_file_2)
+        registry.clean_up()
+
+    def test_clean_up_summary(self):
+        registry = FileRegistry()
+        txt_file_1 = FAKER.txt_file()
+        txt_file_2 = FAKER.txt_file()
+        txt_file_3 = FAKER.txt_file()
+        for txt_file in (txt_file_1, txt_file_2, txt_file_3):
+            registry.add(txt_file)
+        txt_file_3.data["storage"].unlink(txt_file_3)
+
+        summary = registry.clean_up()
+
+        self.assertEqual(summary, {"succeeded": 2, "failed": 1})
+        self.assertFalse(txt_file_1.data["storage"].exists(txt_file_1))
+        self.assertFalse(txt_file_2.data["storage"].exists(txt_file_2))
+
+    def test_async(self):
+        async def _test():
+            storage = AsyncFileSystemStorage()
+            txt_file_1 = await FAKER.atxt_file(storage=storage)
+            txt_file_2 = await FAKER.atxt_file(storage=storage)
+            txt_file_3 = await FAKER.atxt_file()
+            self.assertTrue(await storage.exists(txt_file_1.data["filename"]))
+            self.assertIs(txt_file_1.data["storage"], storage)
+
+            raw = await FAKER.atxt_file(storage=storage, raw=True)
+            self.assertIsInstance(raw, BytesValue)
+            self.assertFalse(await storage.exists(raw.data["filename"]))
+
+            registry = FileRegistry()
+            for txt_file in (txt_file_1, txt_file_2, txt_file_3):
+                registry.add(txt_file)
+            summary = await registry.aclean_up()
+
+            self.assertEqual(summary, {"succeeded": 3, "failed": 0})
+            for txt_file in (txt_file_1, txt_file_2, txt_file_3):
+                self.assertFalse(
+                    await txt_file.data["storage"].exists(
+                        txt_file.data["filename"]
+                    )
+                )
+
+        asyncio.run(_test())
+
+    def test_keep_native_async_storage_files(self):
+        """Files that can't be deleted synchronously stay registered."""
+        storage = NativeAsyncStorage()
+
+        def _make_file(file_storage: Any) -> StringValue:
+            filename = storage.storage.generate_filename(extension="txt")
+            storage.storage.write_text(filename, "Lorem ipsum")
+            file = StringValue(storage.storage.relpath(filename))
+            file.data = {"filename": filename, "storage": file_storage}
+            return file
+
+        async_file = _make_file(storage)
+        registry = FileRegistry()
+        registry.add(async_file)
+        registry.add(_make_file(storage.storage))
+
+        self.assertFalse(registry.remove(async_file))
+        self.assertIsNotNone(registry.search(async_file))
+        self.assertEqual(registry.clean_up(), {"succeeded": 1, "failed": 1})
+        self.assertIsNotNone(registry.search(async_file))
+        self.assertTrue(storage.storage.exists(async_file.data["filename"]))
+
+        self.assertEqual(
+            asyncio.run(registry.aclean_up()),
+            {"succeeded": 1, "failed": 0},
+        )
+        self.assertIsNone(registry.search(async_file))
+        self.assertFalse(storage.storage.exists(async_file.data["filename"]))
+
+    def test_clean_up_async_storage(self):
+        """Files of async storages are deleted with their `sync_storage`."""
+        registry = FileRegistry()
+        txt_file = asyncio.run(FAKER.atxt_file())
+        registry.add(txt_file)
+        self.assertEqual(registry.clean_up(), {"succeeded": 1, "failed": 0})
+        self.assertFalse(
+            txt_file.data["storage"].sync_storage.exists(
+                txt_file.data["filename"]
+            )
+        )
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 import socket
@@ -5,14 +6,17 @@ import tempfile
 import threading
 import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from typing import Any, Dict, Type, Union
+from typing import Any, Dict, List, Type, Union
+from unittest import mock
 
 from faker import Faker
 from parameterized import parameterized
 
 from ..providers.txt_file import TxtFileProvider
-from ..registry import FILE_REGISTRY
+from ..registry import FILE_REGISTRY, FileRegistry
+from ..storages.async_sftp_storage import AsyncSFTPStorage
 from ..storages.sftp_storage import SFTPStorage
 from .sftp_server import SFTPServerManager, start_server
 from .utils import AutoFreePortInt
@@ -333,3 +337,158 @@ class TestSFTPStorageTestCase(unittest.TestCase):
             filename=FAKER.file_name(),
         )
         self.assertFalse(val)
+
+    def test_storage_pool_concurrent_writes(self) -> None:
+        storage = SFTPStorage(
+            host=self.sftp_host,
+            port=self.sftp_port,
+            username=self.sftp_user,
+            password=self.sftp_pass,
+            root_path=self.sftp_root_path,
+            pool_size=4,
+            channels_per_transport=2,
+        )
+        filenames = [
+            storage.generate_filename(extension="txt") for _ in range(16)
+        ]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(
+                    lambda _f: storage.write_bytes(_f, _f.encode()),
+                    filenames,
+                )
+            )
+
+        self.assertEqual(results, [0] * len(filenames))
+        self.assertTrue(all(storage.exists(_f) for _f in filenames))
+        # At most 4 channels, at most 2 channels per transport
+        self.assertLessEqual(storage.pool._idle.qsize(), 4)
+        self.assertLessEqual(len(storage.pool._transports), 2)
+
+        self.assertEqual(storage.unlink_many(filenames), [])
+        self.assertFalse(any(storage.exists(_f) for _f in filenames))
+        storage.close()
+
+    def test_storage_pool_reconnect(self) -> None:
+        storage = SFTPStorage(
+            host=self.sftp_host,
+            port=self.sftp_port,
+            username=self.sftp_user,
+            password=self.sftp_pass,
+            root_path=self.sftp_root_path,
+        )
+        # Drop the connection
+        storage.transport.close()
+
+        filename = storage.generate_filename(extension="txt")
+        self.assertEqual(storage.write_bytes(filename, b"Lorem ipsum"), 0)
+        self.assertTrue(storage.exists(filename))
+        storage.unlink(filename)
+        storage.close()
+
+    def test_storage_pool_timeout(self) -> None:
+        storage = SFTPStorage(
+            host=self.sftp_host,
+            port=self.sftp_port,
+            username=self.sftp_user,
+            password=self.sftp_pass,
+            root_path=self.sftp_root_path,
+            pool_timeout=0.1,
+        )
+        client = storage.pool.acquire()
+        with self.assertRaises(TimeoutError):
+            storage.pool.acquire()
+        storage.pool.release(client)
+        storage.close()
+
+    @parameterized.expand(
+        # "upload_workers, chunks",
+        [
+            (1, [b"Lorem ipsum"]),
+            (1, [os.urandom(1000), os.urandom(3000), b"", os.urandom(5)]),
+            (3, [os.urandom(1000), os.urandom(3000), b"", os.urandom(5)]),
+            (3, [os.urandom(10_000)]),
+        ],
+    )
+    def test_storage_write_stream(
+        self: "TestSFTPStorageTestCase",
+        upload_workers: int,
+        chunks: List[bytes],
+    ) -> None:
+        storage = SFTPStorage(
+            host=self.sftp_host,
+            port=self.sftp_port,
+            username=self.sftp_user,
+            password=self.sftp_pass,
+            root_path=self.sftp_root_path,
+            pool_size=3,
+            chunk_size=256,
+            window=4,
+            upload_workers=upload_workers,
+        )
+        data = b"".join(chunks)
+
+        file_stream = storage.generate_filename(extension="bin")
+        self.assertEqual(
+            storage.write_stream(file_stream, iter(chunks)), len(data)
+        )
+        file_bytes = storage.generate_filename(extension="bin")
+        self.assertEqual(storage.write_bytes(file_bytes, data), 0)
+        file_copy = storage.generate_filename(extension="bin")
+        with tempfile.NamedTemporaryFile() as source:
+            source.write(data)
+            source.flush()
+            # Files are passed to `write_stream`
+            self.assertEqual(
+                storage.write_file(file_copy, source.name), len(data)
+            )
+
+        filenames = [file_stream, file_bytes, file_copy]
+        for filename in filenames:
+            with (
+                storage.connection() as sftp,
+                sftp.open(storage.abspath(filename), "rb") as file,
+            ):
+                self.assertEqual(file.read(), data)
+
+        self.assertEqual(storage.unlink_many(filenames), [])
+        storage.close()
+
+    def test_async_storage(self: "TestSFTPStorageTestCase") -> None:
+        async def _test() -> None:
+            async with AsyncSFTPStorage(
+                host=self.sftp_host,
+                port=self.sftp_port,
+                username=self.sftp_user,
+                password=self.sftp_pass,
+                root_path=self.sftp_root_path,
+            ) as storage:
+                files = await asyncio.gather(
+                    *(FAKER.atxt_file(storage=storage) for _ in range(5))
+                )
+                for file in files:
+                    self.assertTrue(await storage.exists(file.data["filename"]))
+                    self.assertTrue(
+                        storage.abspath(file.data["filename"]).startswith(
+                            self.sftp_root_path
+                        )
+                    )
+
+                # Files of async storages are skipped by `clean_up`, but
+                # stay registered
+                self.assertEqual(
+                    registry.clean_up(), {"succeeded": 0, "failed": 5}
+                )
+                self.assertEqual(
+                    await registry.aclean_up(),
+                    {"succeeded": 5, "failed": 0},
+                )
+                for file in files:
+                    self.assertFalse(
+                        await storage.exists(file.data["filename"])
+                    )
+
+        registry = FileRegistry()
+        with mock.patch("faker_file.async_provider.FILE_REGISTRY", registry):
+            asyncio.run(_test())
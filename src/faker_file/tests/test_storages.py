@@ -1,17 +1,33 @@
 import json
+import os
+import random
+import shutil
 import tempfile
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, Type, Union
+from typing import Any, Callable, Dict, Type, Union
+from unittest import mock
 
 from faker import Faker
+from moto import mock_aws
 from parameterized import parameterized
-from pathy import use_fs, use_fs_cache
+from pathy import get_client, use_fs, use_fs_cache
 
 from ..providers.json_file import JsonFileProvider
 from ..registry import FILE_REGISTRY
 from ..storages.base import BaseStorage
+from ..storages.dedup import DedupStorage
 from ..storages.filesystem import FileSystemStorage
+from ..storages.naming import (
+    BaseNameStrategy,
+    CounterNameStrategy,
+    RandomNameStrategy,
+    ULIDNameStrategy,
+    UUIDNameStrategy,
+)
 from ..storages.pathy_based.aws_s3 import AWSS3Storage
 from ..storages.pathy_based.azure_cloud_storage import AzureCloudStorage
 from ..storages.pathy_based.cloud import (
@@ -19,6 +35,7 @@ from ..storages.pathy_based.cloud import (
     LocalCloudFileSystemStorage,
 )
 from ..storages.pathy_based.google_cloud_storage import GoogleCloudStorage
+from ..storages.write_behind import WriteBehindError, WriteBehindStorage
 from .data import GCS_CREDENTIALS_JSON
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
@@ -213,6 +230,465 @@ class TestStoragesTestCase(unittest.TestCase):
         # Clean up
         storage.unlink(filename_bytes)
 
+    @parameterized.expand(
+        # "storage_cls, kwargs, read_bytes",
+        [
+            (FileSystemStorage, {}, lambda f: Path(f).read_bytes()),
+            (
+                LocalCloudFileSystemStorage,
+                {
+                    "bucket_name": "testing",
+                    "rel_path": "tmp",
+                },
+                lambda f: f.read_bytes(),
+            ),
+        ],
+    )
+    def test_storage_open_write(
+        self: "TestStoragesTestCase",
+        storage_cls: Type[BaseStorage],
+        kwargs: Dict[str, Any],
+        read_bytes: Callable[[Any], bytes],
+    ) -> None:
+        """Test storage `open_write`."""
+        storage = storage_cls(**kwargs)
+        filename = storage.generate_filename(prefix="zzz", extension="bin")
+        with storage.open_write(filename) as stream:
+            stream.write(b"Lorem ")
+            stream.write(b"ipsum")
+        self.assertTrue(storage.exists(filename))
+        self.assertEqual(read_bytes(filename), b"Lorem ipsum")
+        storage.unlink(filename)
+
+        # `write_stream` is built on top of `open_write`
+        self.assertEqual(
+            storage.write_stream(filename, iter([b"Lorem ", b"ipsum"])), 11
+        )
+        self.assertEqual(read_bytes(filename), b"Lorem ipsum")
+        storage.unlink(filename)
+
+    @parameterized.expand(
+        # "storage_cls, kwargs, read_bytes",
+        [
+            (
+                FileSystemStorage,
+                {},
+                lambda f: Path(f).read_bytes(),
+            ),
+            (
+                LocalCloudFileSystemStorage,
+                {
+                    "bucket_name": "testing",
+                    "rel_path": "tmp",
+                },
+                lambda f: f.read_bytes(),
+            ),
+        ],
+    )
+    def test_storage_write_file(
+        self: "TestStoragesTestCase",
+        storage_cls: Type[BaseStorage],
+        kwargs: Dict[str, Any],
+        read_bytes: Callable[[Any], bytes],
+    ) -> None:
+        """Test storage `write_file`."""
+        storage = storage_cls(**kwargs)
+        data = os.urandom(3 * 1024 * 1024 + 17)
+        with tempfile.NamedTemporaryFile(suffix=".bin") as source:
+            source.write(data)
+            source.flush()
+
+            with self.subTest("Path"):
+                filename = storage.generate_filename(extension="bin")
+                storage.write_file(filename, source.name)
+                self.assertEqual(read_bytes(filename), data)
+                storage.unlink(filename)
+
+            with self.subTest("Partially read file"):
+                filename = storage.generate_filename(extension="bin")
+                with open(source.name, "rb") as file:
+                    file.read(10)
+                    storage.write_file(filename, file)
+                    self.assertEqual(file.read(), b"")
+                self.assertEqual(read_bytes(filename), data[10:])
+                storage.unlink(filename)
+
+        with self.subTest("BytesIO"):
+            filename = storage.generate_filename(extension="bin")
+            with BytesIO(data) as buffer:
+                storage.write_file(filename, buffer)
+            self.assertEqual(read_bytes(filename), data)
+            storage.unlink(filename)
+
+    @parameterized.expand(
+        # "storage_cls, kwargs, data_type",
+        [
+            (FileSystemStorage, {}, memoryview),
+            (
+                LocalCloudFileSystemStorage,
+                {"bucket_name": "testing", "rel_path": "tmp"},
+                bytes,
+            ),
+        ],
+    )
+    def test_storage_write_file_bytes_io(
+        self: "TestStoragesTestCase",
+        storage_cls: Type[BaseStorage],
+        kwargs: Dict[str, Any],
+        data_type: type,
+    ) -> None:
+        """Test `write_file` passes `bytes`, unless `accepts_memoryview`."""
+        storage = storage_cls(**kwargs)
+        filename = storage.generate_filename(extension="bin")
+        received = []
+        with mock.patch.object(
+            storage,
+            "write_bytes",
+            side_effect=lambda _, data: received.append(
+                (type(data), bytes(data))
+            ),
+        ):
+            storage.write_file(filename, BytesIO(b"Lorem ipsum"))
+        self.assertEqual(received, [(data_type, b"Lorem ipsum")])
+
+    def test_file_system_storage_write_file_fallback(
+        self: "TestStoragesTestCase",
+    ) -> None:
+        """Test `FileSystemStorage` `write_file` without kernel copy."""
+        storage = FileSystemStorage()
+        data = os.urandom(1024 * 1024 + 17)
+        with BytesIO(data) as buffer:
+            source = storage.generate_filename(extension="bin")
+            storage.write_file(source, buffer)
+        filename = storage.generate_filename(extension="bin")
+        with mock.patch(
+            "faker_file.storages.filesystem.kernel_copy", return_value=None
+        ) as mocked:
+            self.assertEqual(storage.write_file(filename, source), len(data))
+        mocked.assert_called_once()
+        self.assertEqual(Path(filename).read_bytes(), data)
+        self.assertEqual(storage.unlink_many([source, filename]), [])
+
+    def test_file_system_storage_copy_file(
+        self: "TestStoragesTestCase",
+    ) -> None:
+        """Test `FileSystemStorage` `copy_file`."""
+        storage = FileSystemStorage()
+        source = storage.generate_filename(extension="txt")
+        storage.write_text(source, "Lorem ipsum")
+
+        with self.subTest("Copy"):
+            filename = storage.generate_filename(extension="txt")
+            self.assertEqual(storage.copy_file(filename, source), 11)
+            self.assertEqual(Path(filename).read_text(), "Lorem ipsum")
+            self.assertFalse(os.path.samefile(filename, source))
+            storage.unlink(filename)
+
+        with self.subTest("Hard link"):
+            storage = FileSystemStorage(link_files=True)
+            filename = storage.generate_filename(extension="txt")
+            self.assertEqual(storage.copy_file(filename, source), 11)
+            self.assertTrue(os.path.samefile(filename, source))
+            storage.unlink(filename)
+
+        with self.subTest("Hard link not possible"):
+            filename = storage.generate_filename(extension="txt")
+            with mock.patch(
+                "os.link", side_effect=OSError(18, "Cross-device link")
+            ):
+                self.assertEqual(storage.copy_file(filename, source), 11)
+            self.assertEqual(Path(filename).read_text(), "Lorem ipsum")
+            self.assertFalse(os.path.samefile(filename, source))
+            storage.unlink(filename)
+
+        storage.unlink(source)
+
+    @mock_aws
+    def test_aws_s3_storage_copy_file(
+        self: "TestStoragesTestCase",
+    ) -> None:
+        """Test `AWSS3Storage` server-side `copy_file`."""
+        use_fs(False)
+        storage = AWSS3Storage(
+            bucket_name="testing",
+            credentials={"key_id": "key", "key_secret": "key_secret"},
+        )
+        source = storage.generate_filename(prefix="zzz", extension="txt")
+        storage.write_text(source, "Lorem ipsum")
+        filename = storage.generate_filename(prefix="zzz", extension="txt")
+        native_client = get_client("s3").client
+        with (
+            mock.patch.object(
+                native_client, "copy", wraps=native_client.copy
+            ) as copy,
+            mock.patch.object(storage, "write_file") as write_file,
+        ):
+            self.assertEqual(storage.copy_file(filename, str(source)), 11)
+        copy.assert_called_once()
+        write_file.assert_not_called()
+        self.assertEqual(filename.read_text(), "Lorem ipsum")
+
+        with self.subTest("Local file is uploaded"):
+            local_storage = FileSystemStorage()
+            local_source = local_storage.generate_filename(extension="txt")
+            local_storage.write_text(local_source, "Dolor sit")
+            storage.copy_file(filename, local_source)
+            self.assertEqual(filename.read_text(), "Dolor sit")
+            local_storage.unlink(local_source)
+
+        with self.subTest("Missing file"), self.assertRaises(FileNotFoundError):
+            storage.copy_file(filename, "s3://testing/tmp/tmp/missing.txt")
+
+        self.assertEqual(storage.unlink_many([source, filename]), [])
+
+    @parameterized.expand(
+        # "storage_cls, kwargs",
+        [
+            (FileSystemStorage, {}),
+            (
+                LocalCloudFileSystemStorage,
+                {
+                    "bucket_name": "testing",
+                    "rel_path": "tmp",
+                },
+            ),
+        ],
+    )
+    def test_storage_unlink_many(
+        self: "TestStoragesTestCase",
+        storage_cls: Type[BaseStorage],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """Test storage `unlink_many`."""
+        storage = storage_cls(**kwargs)
+        filenames = []
+        for _ in range(10):
+            filename = storage.generate_filename(prefix="zzz", extension="txt")
+            storage.write_text(filename, "Lorem ipsum")
+            filenames.append(filename)
+        missing = storage.generate_filename(prefix="zzz", extension="txt")
+
+        failed = storage.unlink_many(filenames + [missing])
+
+        self.assertEqual([_filename for _filename, _err in failed], [missing])
+        for filename in filenames:
+            self.assertFalse(storage.exists(filename))
+
+    @mock_aws
+    def test_aws_s3_storage_unlink_many(self: "TestStoragesTestCase") -> None:
+        """Test `AWSS3Storage` `unlink_many` (bulk delete)."""
+        use_fs(False)
+        storage = AWSS3Storage(
+            bucket_name="testing",
+            credentials={"key_id": "key", "key_secret": "key_secret"},
+        )
+        filenames = []
+        for _ in range(10):
+            filename = storage.generate_filename(prefix="zzz", extension="txt")
+            storage.write_text(filename, "Lorem ipsum")
+            filenames.append(filename)
+
+        self.assertEqual(storage.unlink_many(filenames), [])
+        for filename in filenames:
+            self.assertFalse(storage.exists(filename))
+
+    @mock_aws
+    def test_aws_s3_storage_write_multipart(
+        self: "TestStoragesTestCase",
+    ) -> None:
+        """Test `AWSS3Storage` multipart upload."""
+        use_fs(False)
+        storage = AWSS3Storage(
+            bucket_name="testing",
+            credentials={"key_id": "key", "key_secret": "key_secret"},
+            multipart_threshold=1024 * 1024,
+            multipart_chunk_size=5 * 1024 * 1024,
+            multipart_workers=2,
+        )
+        native_client = get_client("s3").client
+        upload_part = native_client.upload_part
+        calls = []
+
+        def _flaky_upload_part(**kwargs):
+            calls.append(kwargs["PartNumber"])
+            # Fail the first attempt of the second part
+            if calls.count(2) == 1 and kwargs["PartNumber"] == 2:
+                raise ConnectionError("Connection reset")
+            return upload_part(**kwargs)
+
+        data = os.urandom(11 * 1024 * 1024)
+        filename = storage.generate_filename(prefix="zzz", extension="bin")
+        with (
+            mock.patch.object(
+                native_client, "upload_part", side_effect=_flaky_upload_part
+            ),
+            mock.patch("time.sleep"),
+        ):
+            self.assertEqual(storage.write_bytes(filename, data), len(data))
+
+        self.assertEqual(sorted(calls), [1, 2, 2, 3])
+        self.assertEqual(filename.read_bytes(), data)
+        storage.unlink(filename)
+
+        with self.subTest("Small files are uploaded at once"):
+            filename = storage.generate_filename(prefix="zzz", extension="txt")
+            with mock.patch.object(native_client, "upload_part") as mocked:
+                storage.write_text(filename, "Lorem ipsum")
+            mocked.assert_not_called()
+            self.assertEqual(filename.read_text(), "Lorem ipsum")
+            storage.unlink(filename)
+
+    def test_google_cloud_storage_write_multipart(
+        self: "TestStoragesTestCase",
+    ) -> None:
+        """Test `GoogleCloudStorage` resumable upload."""
+        use_fs(tempfile.gettempdir())
+        # Own directory, as the `use_fs` client removes emptied directories
+        storage = GoogleCloudStorage(
+            bucket_name="testing",
+            rel_path="tmp_multipart",
+            multipart_threshold=1024,
+            multipart_chunk_size=300 * 1024,
+        )
+        uploaded = {}
+
+        def _upload_from_file(file_obj, size, retry):
+            uploaded["data"] = file_obj.read()
+            uploaded["size"] = size
+            uploaded["retry"] = retry
+
+        native_client = mock.MagicMock()
+        blob = native_client.bucket.return_value.blob.return_value
+        blob.upload_from_file.side_effect = _upload_from_file
+        data = os.urandom(2048)
+        filename = storage.generate_filename(prefix="zzz", extension="bin")
+        with mock.patch(
+            "faker_file.storages.pathy_based.google_cloud_storage.get_client",
+            return_value=mock.Mock(client=native_client),
+        ):
+            self.assertEqual(storage.write_bytes(filename, data), len(data))
+
+        native_client.bucket.assert_called_once_with("testing")
+        # Chunk size is rounded up to a multiple of 256 KB
+        native_client.bucket.return_value.blob.assert_called_once_with(
+            filename.key,
+            chunk_size=512 * 1024,
+        )
+        self.assertEqual(uploaded["data"], data)
+        self.assertEqual(uploaded["size"], len(data))
+        self.assertIsNotNone(uploaded["retry"])
+
+        with self.subTest("Small files are uploaded at once"):
+            with mock.patch.object(storage, "write_multipart") as mocked:
+                storage.write_bytes(filename, b"Lorem ipsum")
+            mocked.assert_not_called()
+            self.assertEqual(filename.read_bytes(), b"Lorem ipsum")
+            storage.unlink(filename)
+
+    def test_azure_cloud_storage_write_multipart(
+        self: "TestStoragesTestCase",
+    ) -> None:
+        """Test `AzureCloudStorage` staged blocks upload."""
+        use_fs(tempfile.gettempdir())
+        storage = AzureCloudStorage(
+            bucket_name="testing",
+            rel_path="tmp",
+            multipart_threshold=10,
+            multipart_chunk_size=4,
+            multipart_workers=2,
+            multipart_retries=2,
+        )
+        staged = {}
+        attempts = []
+        lock = threading.Lock()
+
+        def _stage_block(block_id, block_data):
+            with lock:
+                attempts.append(block_id)
+                # Fail the first attempt of the second block
+                if attempts.count("00000001") == 1 and block_id == "00000001":
+                    raise ConnectionError("Connection reset")
+                staged[block_id] = block_data
+
+        blob_client = mock.MagicMock()
+        blob_client.stage_block.side_effect = _stage_block
+        blob_client.commit_block_list.side_effect = [
+            ConnectionError("Connection reset"),
+            None,
+        ]
+        service = mock.MagicMock()
+        service.get_blob_client.return_value = blob_client
+        data = b"Lorem ipsum dolor"
+        filename = storage.generate_filename(prefix="zzz", extension="txt")
+        with (
+            mock.patch(
+                "faker_file.storages.pathy_based.azure_cloud_storage"
+                ".get_client",
+                return_value=mock.Mock(_service=service),
+            ),
+            mock.patch("time.sleep"),
+        ):
+            self.assertEqual(storage.write_bytes(filename, data), len(data))
+
+        service.get_blob_client.assert_called_once_with(
+            container="testing", blob=filename.key
+        )
+        self.assertEqual(
+            sorted(attempts),
+            [
+                "00000000",
+                "00000001",
+                "00000001",
+                "00000002",
+                "00000003",
+                "00000004",
+            ],
+        )
+        (blocks,) = blob_client.commit_block_list.call_args.args
+        self.assertEqual(
+            [block.id for block in blocks],
+            ["00000000", "00000001", "00000002", "00000003", "00000004"],
+        )
+        self.assertEqual(
+            b"".join(staged[block.id] for block in blocks),
+            data,
+        )
+        self.assertEqual(blob_client.commit_block_list.call_count, 2)
+
+        with self.subTest("Failed blocks are not committed"):
+            blob_client.reset_mock()
+            blob_client.stage_block.side_effect = ConnectionError("Down")
+            with (
+                mock.patch(
+                    "faker_file.storages.pathy_based.azure_cloud_storage"
+                    ".get_client",
+                    return_value=mock.Mock(_service=service),
+                ),
+                mock.patch("time.sleep"),
+                self.assertRaises(ConnectionError),
+            ):
+                storage.write_bytes(filename, data)
+            # Blocks not started yet are cancelled. Started ones are tried
+            # `multipart_retries` times plus the final attempt.
+            self.assertGreaterEqual(blob_client.stage_block.call_count, 3)
+            self.assertEqual(blob_client.stage_block.call_count % 3, 0)
+            blob_client.commit_block_list.assert_not_called()
+
+    def test_cloud_storage_write_multipart(
+        self: "TestStoragesTestCase",
+    ) -> None:
+        """Test generic `CloudStorage` multipart upload."""
+        storage = LocalCloudFileSystemStorage(
+            bucket_name="testing",
+            rel_path="tmp",
+            multipart_threshold=10,
+            multipart_chunk_size=4,
+        )
+        filename = storage.generate_filename(prefix="zzz", extension="txt")
+        self.assertEqual(storage.write_text(filename, "Lorem ipsum"), 11)
+        self.assertEqual(filename.read_text(), "Lorem ipsum")
+        storage.unlink(filename)
+
     @parameterized.expand(
         # "storage_cls, kwargs, prefix, extension",
         [
@@ -318,6 +794,174 @@ class TestStoragesTestCase(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             method(**method_kwargs)
 
+    def test_write_behind_storage(self: "TestStoragesTestCase") -> None:
+        """Test `WriteBehindStorage`."""
+        with WriteBehindStorage(FileSystemStorage(), workers=4) as storage:
+            files = [
+                FAKER.json_file(storage=storage, num_rows=5) for _ in range(20)
+            ]
+            for file in files:
+                self.assertTrue(storage.exists(file.data["filename"]))
+            storage.flush()
+            for file in files:
+                with open(storage.abspath(file.data["filename"])) as _file:
+                    self.assertEqual(_file.read(), file.data["content"])
+
+        with self.assertRaises(ValueError):
+            storage.write_bytes(files[0].data["filename"], b"Lorem ipsum")
+
+    def test_write_behind_storage_backpressure(
+        self: "TestStoragesTestCase",
+    ) -> None:
+        """Test `WriteBehindStorage` blocks when the queue is full."""
+        inner_storage = FileSystemStorage()
+        release = threading.Event()
+        write_bytes = inner_storage.write_bytes
+
+        def _blocking_write_bytes(filename: str, data: bytes) -> int:
+            release.wait()
+            return write_bytes(filename, data)
+
+        inner_storage.write_bytes = _blocking_write_bytes
+        storage = WriteBehindStorage(
+            inner_storage, max_queue_bytes=10, workers=1
+        )
+        filename_1 = storage.generate_filename(extension="bin")
+        filename_2 = storage.generate_filename(extension="bin")
+        # Larger than the queue, but accepted as nothing else is pending
+        storage.write_bytes(filename_1, b"x" * 20)
+
+        writer = threading.Thread(
+            target=storage.write_bytes, args=(filename_2, b"y" * 5)
+        )
+        writer.start()
+        writer.join(timeout=0.2)
+        self.assertTrue(writer.is_alive())
+
+        release.set()
+        writer.join(timeout=5)
+        self.assertFalse(writer.is_alive())
+        storage.close()
+        self.assertTrue(inner_storage.exists(filename_1))
+        self.assertTrue(inner_storage.exists(filename_2))
+        self.assertEqual(storage.unlink_many([filename_1, filename_2]), [])
+
+    def test_write_behind_storage_errors(
+        self: "TestStoragesTestCase",
+    ) -> None:
+        """Test `WriteBehindStorage` reports failed writes."""
+        storage = WriteBehindStorage(FileSystemStorage())
+        filename = storage.generate_filename(extension="txt")
+        missing = os.path.join(tempfile.gettempdir(), "missing", "a.txt")
+        storage.write_text(filename, "Lorem ipsum")
+        storage.write_text(missing, "Lorem ipsum")
+
+        with self.assertRaises(WriteBehindError) as context:
+            storage.flush()
+        self.assertEqual(
+            [_filename for _filename, _err in context.exception.errors],
+            [missing],
+        )
+        self.assertIsInstance(context.exception.errors[0][1], FileNotFoundError)
+        # Errors are reported once
+        storage.close()
+        storage.unlink(filename)
+
+    def test_write_behind_storage_negative_return(
+        self: "TestStoragesTestCase",
+    ) -> None:
+        """Test `WriteBehindStorage` reports writes returning -1."""
+        inner_storage = FileSystemStorage()
+        storage = WriteBehindStorage(inner_storage)
+        filename = storage.generate_filename(extension="txt")
+        # Like `SFTPStorage`, which returns -1 on failure
+        with mock.patch.object(inner_storage, "write_text", return_value=-1):
+            storage.write_text(filename, "Lorem ipsum")
+            with self.assertRaises(WriteBehindError) as context:
+                storage.flush()
+        self.assertEqual(
+            [_filename for _filename, _err in context.exception.errors],
+            [filename],
+        )
+        self.assertIsInstance(context.exception.errors[0][1], IOError)
+        storage.close()
+
+    def test_dedup_storage(self: "TestStoragesTestCase") -> None:
+        """Test `DedupStorage`."""
+        storage = DedupStorage()
+        self.assertTrue(storage.inner_storage.link_files)
+        content = json.dumps({"lorem": "ipsum"})
+        files = [
+            FAKER.json_file(storage=storage, content=content) for _ in range(3)
+        ]
+        other = FAKER.json_file(storage=storage, content="[]")
+        paths = [storage.abspath(file.data["filename"]) for file in files]
+        self.assertEqual(storage.refcount(files[0].data["filename"]), 3)
+        self.assertEqual(storage.refcount(other.data["filename"]), 1)
+        self.assertEqual(storage.bytes_saved, 2 * len(content))
+        self.assertTrue(os.path.samefile(paths[0], paths[2]))
+        self.assertFalse(os.path.samefile(paths[0], storage.abspath(other)))
+
+        with self.subTest("Remove through registry"):
+            self.assertTrue(FILE_REGISTRY.remove(files[0]))
+            self.assertFalse(os.path.exists(paths[0]))
+            self.assertEqual(storage.refcount(files[1].data["filename"]), 2)
+            self.assertEqual(Path(paths[1]).read_text(), content)
+
+        with self.subTest("Overwrite keeps other references intact"):
+            storage.write_text(files[1].data["filename"], "{}")
+            self.assertEqual(Path(paths[1]).read_text(), "{}")
+            self.assertEqual(Path(paths[2]).read_text(), content)
+            self.assertEqual(storage.refcount(files[2].data["filename"]), 1)
+
+        with self.subTest("Source removed behind the storage"):
+            os.remove(paths[2])
+            filename = storage.generate_filename(extension="json")
+            storage.write_text(filename, content)
+            self.assertEqual(Path(filename).read_text(), content)
+            self.assertEqual(storage.refcount(filename), 1)
+            storage.unlink(filename)
+
+        FILE_REGISTRY.remove(files[2])
+        FILE_REGISTRY.clean_up()
+        self.assertFalse(storage._digests)
+        self.assertFalse(storage._references)
+
+    def test_dedup_storage_threads(self: "TestStoragesTestCase") -> None:
+        """Test `DedupStorage` counts saved bytes across threads."""
+        storage = DedupStorage()
+        filenames = [
+            storage.generate_filename(extension="bin") for _ in "abcdefgh"
+        ]
+        storage.write_bytes(filenames[0], b"Lorem")
+        with ThreadPoolExecutor(max_workers=7) as executor:
+            list(
+                executor.map(
+                    lambda filename: storage.write_bytes(filename, b"Lorem"),
+                    filenames[1:],
+                )
+            )
+        self.assertEqual(storage.refcount(filenames[0]), 8)
+        self.assertEqual(storage.bytes_saved, 7 * len(b"Lorem"))
+        self.assertEqual(storage.unlink_many(filenames), [])
+
+    def test_dedup_storage_without_native_copy(
+        self: "TestStoragesTestCase",
+    ) -> None:
+        """Test `DedupStorage` writes files as usual without native copy."""
+        inner_storage = FileSystemStorage()
+        inner_storage.native_copy = False
+        storage = DedupStorage(inner_storage)
+        filenames = [storage.generate_filename(extension="bin") for _ in "ab"]
+        with mock.patch.object(inner_storage, "copy_file") as copy_file:
+            for filename in filenames:
+                storage.write_bytes(filename, b"Lorem ipsum")
+        copy_file.assert_not_called()
+        self.assertEqual(storage.refcount(filenames[0]), 2)
+        self.assertEqual(storage.bytes_saved, 0)
+        self.assertEqual(storage.unlink_many(filenames), [])
+        self.assertEqual(storage.refcount(filenames[0]), 0)
+
     def test_file_system_storage_abspath(self: "TestStoragesTestCase") -> None:
         """Test `FileSystemStorage` `abspath`."""
         storage = FileSystemStorage(
@@ -327,6 +971,104 @@ class TestStoragesTestCase(unittest.TestCase):
         filename = storage.generate_filename(prefix="", extension="tmp")
         self.assertTrue(storage.abspath(filename).startswith("/tmp/rel_tmp/"))
 
+    def test_file_system_storage_dir_cache(
+        self: "TestStoragesTestCase",
+    ) -> None:
+        """Test `FileSystemStorage` creates directories once."""
+        root_path = tempfile.mkdtemp()
+        storage = FileSystemStorage(root_path=root_path, rel_path="cached")
+        with mock.patch("os.makedirs", wraps=os.makedirs) as makedirs:
+            for _ in range(5):
+                storage.generate_filename(extension="txt")
+        makedirs.assert_called_once_with(
+            os.path.join(root_path, "cached"), exist_ok=True
+        )
+
+        with self.subTest("Directory is re-created if removed"):
+            filename = storage.generate_filename(extension="txt")
+            shutil.rmtree(os.path.join(root_path, "cached"))
+            storage.write_text(filename, "Lorem ipsum")
+            self.assertTrue(storage.exists(filename))
+            shutil.rmtree(os.path.join(root_path, "cached"))
+            with storage.open_write(filename) as stream:
+                stream.write(b"Lorem ipsum")
+            self.assertTrue(storage.exists(filename))
+
+        shutil.rmtree(root_path)
+        FileSystemStorage.clear_dir_cache()
+
+    def test_file_system_storage_sharding(
+        self: "TestStoragesTestCase",
+    ) -> None:
+        """Test `FileSystemStorage` sharded subdirectories."""
+        root_path = tempfile.mkdtemp()
+        storage = FileSystemStorage(
+            root_path=root_path, rel_path="sharded", shard_depth=2
+        )
+        filename = storage.generate_filename(extension="txt", basename="lorem")
+        self.assertEqual(
+            storage.relpath(filename),
+            os.path.join("sharded", "d2", "e1", "lorem.txt"),
+        )
+        # Same basename, same shard
+        self.assertEqual(
+            storage.generate_filename(extension="csv", basename="lorem"),
+            os.path.join(os.path.dirname(filename), "lorem.csv"),
+        )
+        storage.write_text(filename, "Lorem ipsum")
+        self.assertTrue(storage.exists(storage.relpath(filename)))
+        storage.unlink(filename)
+        shutil.rmtree(root_path)
+
+    @parameterized.expand(
+        [
+            (CounterNameStrategy(), 11),
+            (RandomNameStrategy(seed=42), 11),
+            (ULIDNameStrategy(), 29),
+            (UUIDNameStrategy(), 35),
+        ]
+    )
+    def test_name_strategies(
+        self: "TestStoragesTestCase",
+        name_strategy: BaseNameStrategy,
+        length: int,
+    ) -> None:
+        """Test file name strategies."""
+        storage = FileSystemStorage(name_strategy=name_strategy)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            filenames = list(
+                executor.map(
+                    lambda _: storage.generate_filename(extension="txt"),
+                    range(10_000),
+                )
+            )
+        self.assertEqual(len(set(filenames)), len(filenames))
+        for filename in filenames[:10]:
+            basename = os.path.splitext(os.path.basename(filename))[0]
+            self.assertTrue(basename.startswith("tmp"))
+            self.assertEqual(len(basename), length)
+
+    def test_name_strategies_order(self: "TestStoragesTestCase") -> None:
+        """Test file name strategies ordering and reproducibility."""
+        with self.subTest("Counter"):
+            strategy = CounterNameStrategy(start=9, width=2, namespace="w1_")
+            self.assertEqual(
+                [strategy("zzz") for _ in range(3)],
+                ["zzzw1_09", "zzzw1_10", "zzzw1_11"],
+            )
+
+        with self.subTest("ULID"):
+            strategy = ULIDNameStrategy()
+            names = [strategy("") for _ in range(1_000)]
+            self.assertEqual(names, sorted(names))
+
+        with self.subTest("Random, seeded"):
+            random_state = random.getstate()
+            names_1 = [RandomNameStrategy(seed=1)("") for _ in range(3)]
+            names_2 = [RandomNameStrategy(seed=1)("") for _ in range(3)]
+            self.assertEqual(names_1, names_2)
+            self.assertEqual(random.getstate(), random_state)
+
     def test_pathy_file_system_storage_abspath(
         self: "TestStoragesTestCase",
     ) -> None: